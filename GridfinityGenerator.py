@@ -1,5 +1,11 @@
 # Assuming you have not changed the general structure of the template no modification is needed in this file.
+import time
+
+# taken before the imports below, the logged load time includes importing the add-in modules
+MODULE_LOAD_START_TIME = time.perf_counter()
+
 from . import commands
+from . import config
 from .lib import fusion360utils as futil
 
 
@@ -8,6 +14,8 @@ def run(context):
         # This will run the start function in each of your commands as defined in commands/__init__.py
         commands.start()
 
+        futil.log(f'{config.ADDIN_NAME} loaded in {(time.perf_counter() - MODULE_LOAD_START_TIME) * 1000:.0f}ms')
+
     except:
         futil.handle_error('run')
 
@@ -20,5 +28,14 @@ def stop(context):
         # This will run the start function in each of your commands as defined in commands/__init__.py
         commands.stop()
 
+        # Release template bodies, stage results, b-rep snapshots and shared planes kept for the design session,
+        # generators are only imported once a command was run
+        if commands.isAnyCommandLoaded():
+            from .lib.gridfinityUtils import baseBodyCache, binStageCache, bRepIndex, constructionPlaneRegistry
+            baseBodyCache.clearBaseBodyCache()
+            binStageCache.clearBinStageCache()
+            bRepIndex.clearBRepIndex()
+            constructionPlaneRegistry.clearConstructionPlaneRegistry()
+
     except:
-        futil.handle_error('stop')
\ No newline at end of file
+        futil.handle_error('stop')
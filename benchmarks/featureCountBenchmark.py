@@ -0,0 +1,397 @@
+"""
+Feature count benchmark for bin and baseplate generators.
+
+Runs the generators over a matrix of configurations against the recording CAD backend
+(cadBackend) outside of Fusion 360 and reports emitted timeline entities and python
+wall time per configuration. Counts are compared against benchmarks/baseline.json,
+any increase is reported as a regression.
+
+Generators run inside of a deferred compute scope as in the commands, --compare-compute runs every
+configuration once more without it and reports sketch solves and wall time of both.
+--compare-booleans runs every configuration once more with every recorded boolean operation emitted
+as a separate combine and reports combine features of both.
+
+usage: python benchmarks/featureCountBenchmark.py [--filter TEXT] [--update-baseline] [--output FILE] [--trace] [--compare-compute] [--compare-booleans]
+"""
+import argparse
+import contextlib
+import importlib
+import itertools
+import json
+import math
+import os
+import sys
+import time
+
+ADDIN_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# recorder keys stored in the baseline, wall time is reported but never compared
+REPORTED_COUNTS = {
+    'features': 'features',
+    'sketches': 'sketches',
+    'constructionPlanes': 'planes',
+    'features.combine': 'combines',
+    'combineTools': 'tools',
+    'brepQueries': 'queries',
+    'sketchComputes': 'solves',
+    'sketchConstraints': 'constrs',
+    'sketchDimensions': 'dims',
+    'extrudeParticipants': 'parts',
+}
+
+BIN_SIZES = [(1, 1), (2, 2), (3, 3), (4, 4), (6, 6), (10, 10)]
+BIN_COMPARTMENTS = [(1, 1), (2, 2), (4, 3)]
+BIN_HEIGHT = 5
+# several bins generated into the same design, as when building a drawer set
+BIN_BATCHES = [(4, (1, 1)), (4, (2, 2)), (12, (1, 1))]
+PLATE_SIZES = [(1, 1), (2, 2), (3, 3), (4, 4), (6, 6), (10, 10)]
+PLATE_TYPES = ['light', 'full', 'skeletonized']
+# baseplate cutter built per cell against the one built from joined rows
+PLATE_CUTTER_SIZES = [(5, 5), (10, 10), (20, 20)]
+PLATE_CUTTERS = {'per-cell': False, 'rows': True}
+# detailed preview rebuilt after a single input change, unchanged bin stages are reused
+STAGE_REUSE_CHANGES = {'tab angle': ('tabOverhangAngle', math.radians(30)), 'lip notches': ('hasLipNotches', False), 'wall': ('wallThickness', 0.2)}
+
+class AddinModules:
+    def __init__(self):
+        sys.path.insert(0, os.path.dirname(ADDIN_ROOT))
+        packageName = os.path.basename(ADDIN_ROOT)
+        self.cadBackend = importlib.import_module(f'{packageName}.cadBackend')
+        self.adsk = self.cadBackend.installRecordingBackend()
+        self.config = importlib.import_module(f'{packageName}.config')
+        self.futil = importlib.import_module(f'{packageName}.lib.fusion360utils')
+        self.const = importlib.import_module(f'{packageName}.lib.gridfinityUtils.const')
+        self.binGenerator = importlib.import_module(f'{packageName}.lib.gridfinityUtils.binGenerator')
+        self.binGeneratorInput = importlib.import_module(f'{packageName}.lib.gridfinityUtils.binGeneratorInput')
+        self.binStageCache = importlib.import_module(f'{packageName}.lib.gridfinityUtils.binStageCache')
+        self.binBatchGenerator = importlib.import_module(f'{packageName}.lib.gridfinityUtils.binBatchGenerator')
+        self.binManifest = importlib.import_module(f'{packageName}.lib.gridfinityUtils.binManifest')
+        self.binBodyGenerator = importlib.import_module(f'{packageName}.lib.gridfinityUtils.binBodyGenerator')
+        self.baseplateGenerator = importlib.import_module(f'{packageName}.lib.gridfinityUtils.baseplateGenerator')
+        self.baseplateGeneratorInput = importlib.import_module(f'{packageName}.lib.gridfinityUtils.baseplateGeneratorInput')
+        self.binPreviewGenerator = importlib.import_module(f'{packageName}.lib.gridfinityUtils.binPreviewGenerator')
+        self.baseplatePreviewGenerator = importlib.import_module(f'{packageName}.lib.gridfinityUtils.baseplatePreviewGenerator')
+
+def binConfigurations():
+    for (width, length) in BIN_SIZES:
+        for (compartmentsX, compartmentsY) in BIN_COMPARTMENTS:
+            for (hasLip, hasScoop, hasTab) in itertools.product([False, True], repeat=3):
+                options = [name for (name, enabled) in [('lip', hasLip), ('scoop', hasScoop), ('tab', hasTab)] if enabled]
+                name = 'bin {}x{} c{}x{} {}'.format(width, length, compartmentsX, compartmentsY, '-'.join(options) if len(options) > 0 else 'plain')
+                yield (name, dict(width=width, length=length, compartmentsX=compartmentsX, compartmentsY=compartmentsY, hasLip=hasLip, hasScoop=hasScoop, hasTab=hasTab))
+
+def binBatchConfigurations():
+    for (count, (width, length)) in BIN_BATCHES:
+        for hasLip in [False, True]:
+            name = 'bins {} x {}x{} {}'.format(count, width, length, 'lip' if hasLip else 'plain')
+            yield (name, dict(count=count, width=width, length=length, hasLip=hasLip))
+
+# same drawer sets through the batch command, identical bins become occurrences of one component
+def manifestBatchConfigurations():
+    for (count, (width, length)) in BIN_BATCHES:
+        for hasLip in [False, True]:
+            name = 'batch {} x {}x{} {}'.format(count, width, length, 'lip' if hasLip else 'plain')
+            yield (name, dict(count=count, width=width, length=length, hasLip=hasLip))
+
+def plateConfigurations():
+    for (width, length) in PLATE_SIZES:
+        for plateType in PLATE_TYPES:
+            yield ('plate {}x{} {}'.format(width, length, plateType), dict(width=width, length=length, plateType=plateType))
+
+def plateCutterConfigurations():
+    for (width, length) in PLATE_CUTTER_SIZES:
+        for (cutterName, rowCutter) in PLATE_CUTTERS.items():
+            yield ('plate {}x{} full {} cutter'.format(width, length, cutterName), dict(width=width, length=length, plateType='full', rowCutter=rowCutter))
+
+def stageReuseConfigurations():
+    for (changeName, (field, value)) in STAGE_REUSE_CHANGES.items():
+        yield ('stage reuse 3x3 c2x2 {}'.format(changeName), dict(width=3, length=3, field=field, value=value))
+
+# simplified dialog previews, built from temporary bodies
+def previewConfigurations():
+    for (width, length) in BIN_SIZES:
+        name = 'preview bin {}x{} c2x2 lip-scoop-tab'.format(width, length)
+        yield (name, runBin, dict(width=width, length=length, compartmentsX=2, compartmentsY=2, hasLip=True, hasScoop=True, hasTab=True, isPreview=True))
+    for (width, length) in PLATE_SIZES:
+        for plateType in PLATE_TYPES:
+            yield ('preview plate {}x{} {}'.format(width, length, plateType), runPlate, dict(width=width, length=length, plateType=plateType, isPreview=True))
+
+def newComponent(modules: AddinModules, design = None):
+    if design is None:
+        design = modules.cadBackend.newRecordingDesign()
+    occurrence = design.rootComponent.occurrences.addNewComponent(modules.adsk.core.Matrix3D.create())
+    return (design, occurrence.component)
+
+@contextlib.contextmanager
+def configOverride(modules: AddinModules, name: str, value):
+    # None keeps the add-in default
+    default = getattr(modules.config, name)
+    if value is not None:
+        setattr(modules.config, name, value)
+    try:
+        yield
+    finally:
+        setattr(modules.config, name, default)
+
+def createBinInput(modules: AddinModules, width, length, compartmentsX, compartmentsY, hasLip, hasScoop, hasTab):
+    const = modules.const
+    xyClearance = const.BIN_XY_CLEARANCE
+
+    binInput = modules.binGeneratorInput.BinGeneratorInput()
+    baseInput = binInput.baseGeneratorInput
+    baseInput.originPoint = modules.adsk.core.Point3D.create(-xyClearance, -xyClearance, 0)
+    baseInput.baseWidth = const.DIMENSION_DEFAULT_WIDTH_UNIT
+    baseInput.baseLength = const.DIMENSION_DEFAULT_WIDTH_UNIT
+    baseInput.xyClearance = xyClearance
+    baseInput.hasScrewHoles = True
+    baseInput.hasMagnetCutouts = True
+
+    bodyInput = binInput.binBodyGeneratorInput
+    bodyInput.binWidth = width
+    bodyInput.binLength = length
+    bodyInput.binHeight = BIN_HEIGHT
+    bodyInput.baseWidth = const.DIMENSION_DEFAULT_WIDTH_UNIT
+    bodyInput.baseLength = const.DIMENSION_DEFAULT_WIDTH_UNIT
+    bodyInput.heightUnit = const.DIMENSION_DEFAULT_HEIGHT_UNIT
+    bodyInput.xyClearance = xyClearance
+    bodyInput.binCornerFilletRadius = const.BIN_CORNER_FILLET_RADIUS - xyClearance
+    bodyInput.hasLip = hasLip
+    bodyInput.hasLipNotches = hasLip
+    bodyInput.hasScoop = hasScoop
+    bodyInput.hasTab = hasTab
+    bodyInput.tabLength = width
+    bodyInput.tabOverhangAngle = math.radians(const.BIN_TAB_OVERHANG_ANGLE)
+    bodyInput.compartmentsByX = compartmentsX
+    bodyInput.compartmentsByY = compartmentsY
+    bodyInput.compartments = modules.binBodyGenerator.uniformCompartments(compartmentsX, compartmentsY)
+    return binInput
+
+def runBin(modules: AddinModules, name, width, length, compartmentsX, compartmentsY, hasLip, hasScoop, hasTab, isPreview = False):
+    (design, component) = newComponent(modules)
+    binInput = createBinInput(modules, width, length, compartmentsX, compartmentsY, hasLip, hasScoop, hasTab)
+
+    startTime = time.perf_counter()
+    with modules.futil.trace_run(name, component):
+        if isPreview:
+            modules.binPreviewGenerator.createGridfinityBinPreview(binInput, component)
+        else:
+            modules.binGenerator.createGridfinityBin(binInput, component)
+    return (design.recorder.snapshot(), time.perf_counter() - startTime)
+
+def runBinStageReuse(modules: AddinModules, name, width, length, field, value):
+    # only the second preview is measured, the first one fills the stage cache
+    modules.binStageCache.clearBinStageCache()
+    (design, component) = newComponent(modules)
+    binInput = createBinInput(modules, width, length, 2, 2, True, True, True)
+    modules.binGenerator.createGridfinityBin(binInput, component, modules.binStageCache.BinStages(binInput, True))
+
+    (design, component) = newComponent(modules)
+    binInput = createBinInput(modules, width, length, 2, 2, True, True, True)
+    setattr(binInput.binBodyGeneratorInput, field, value)
+    startTime = time.perf_counter()
+    with modules.futil.trace_run(name, component):
+        modules.binGenerator.createGridfinityBin(binInput, component, modules.binStageCache.BinStages(binInput, True))
+    modules.binStageCache.clearBinStageCache()
+    return (design.recorder.snapshot(), time.perf_counter() - startTime)
+
+def runBinBatch(modules: AddinModules, name, count, width, length, hasLip):
+    design = modules.cadBackend.newRecordingDesign()
+    startTime = time.perf_counter()
+    with modules.futil.trace_run(name):
+        for index in range(count):
+            (design, component) = newComponent(modules, design)
+            binInput = createBinInput(modules, width, length, 1, 1, hasLip, False, False)
+            with modules.futil.span('bin {}'.format(index + 1), component):
+                modules.binGenerator.createGridfinityBin(binInput, component)
+    return (design.recorder.snapshot(), time.perf_counter() - startTime)
+
+def runManifestBatch(modules: AddinModules, name, count, width, length, hasLip):
+    design = modules.cadBackend.newRecordingDesign()
+    entry = modules.binManifest.parseManifestEntry(dict(
+        binWidth=width,
+        binLength=length,
+        binHeight=BIN_HEIGHT,
+        hasLip=hasLip,
+        hasLipNotches=hasLip,
+        hasScrewHoles=True,
+        hasMagnetCutouts=True,
+        count=count,
+    ), 0)
+    startTime = time.perf_counter()
+    modules.binBatchGenerator.createGridfinityBinBatch([entry], design.rootComponent, 0.1)
+    return (design.recorder.snapshot(), time.perf_counter() - startTime)
+
+def runPlate(modules: AddinModules, name, width, length, plateType, isPreview = False, rowCutter = None):
+    (design, component) = newComponent(modules)
+    plateInput = modules.baseplateGeneratorInput.BaseplateGeneratorInput()
+    plateInput.baseWidth = modules.const.DIMENSION_DEFAULT_WIDTH_UNIT
+    plateInput.baseLength = modules.const.DIMENSION_DEFAULT_WIDTH_UNIT
+    plateInput.baseplateWidth = width
+    plateInput.baseplateLength = length
+    plateInput.hasExtendedBottom = not plateType == 'light'
+    plateInput.hasSkeletonizedBottom = plateType == 'skeletonized'
+    plateInput.hasMagnetCutouts = True
+    plateInput.hasScrewHoles = True
+    plateInput.hasConnectionHoles = True
+    plateInput.hasPadding = False
+    plateInput.paddingLeft = 0
+    plateInput.paddingTop = 0
+    plateInput.paddingRight = 0
+    plateInput.paddingBottom = 0
+
+    startTime = time.perf_counter()
+    with configOverride(modules, 'BASEPLATE_ROW_CUTTER_ENABLED', rowCutter), modules.futil.trace_run(name, component):
+        if isPreview:
+            modules.baseplatePreviewGenerator.createGridfinityBaseplatePreview(plateInput, component)
+        else:
+            modules.baseplateGenerator.createGridfinityBaseplate(plateInput, component)
+    return (design.recorder.snapshot(), time.perf_counter() - startTime)
+
+def runMeasured(modules: AddinModules, run, name, config: dict, deferredCompute: bool):
+    modules.futil.set_deferred_compute_enabled(deferredCompute)
+    try:
+        with modules.futil.deferred_compute():
+            return run(modules, name, **config)
+    finally:
+        modules.futil.set_deferred_compute_enabled(modules.config.DEFERRED_COMPUTE_ENABLED)
+
+def runAll(modules: AddinModules, filterText: str, compareCompute: bool = False, compareBooleans: bool = False):
+    results = {}
+    runs = [(name, runBin, config) for (name, config) in binConfigurations()] \
+        + [(name, runBinBatch, config) for (name, config) in binBatchConfigurations()] \
+        + [(name, runManifestBatch, config) for (name, config) in manifestBatchConfigurations()] \
+        + [(name, runPlate, config) for (name, config) in plateConfigurations()] \
+        + [(name, runPlate, config) for (name, config) in plateCutterConfigurations()] \
+        + [(name, runBinStageReuse, config) for (name, config) in stageReuseConfigurations()] \
+        + list(previewConfigurations())
+    for (name, run, config) in runs:
+        if filterText and not filterText in name:
+            continue
+        (counts, seconds) = runMeasured(modules, run, name, config, True)
+        results[name] = {
+            'counts': {key: counts.get(key, 0) for key in REPORTED_COUNTS},
+            'recorded': counts,
+            'seconds': seconds,
+        }
+        if not modules.futil.last_trace() is None:
+            results[name]['trace'] = modules.futil.last_trace()
+        if compareCompute:
+            (counts, seconds) = runMeasured(modules, run, name, config, False)
+            results[name]['immediateCompute'] = {
+                'solves': counts.get('sketchComputes', 0),
+                'seconds': seconds,
+            }
+        if compareBooleans:
+            with configOverride(modules, 'BOOLEAN_PLANNER_ENABLED', False):
+                (counts, seconds) = runMeasured(modules, run, name, config, True)
+            results[name]['unplannedBooleans'] = {
+                'combines': counts.get('features.combine', 0),
+                'features': counts.get('features', 0),
+            }
+    return results
+
+def printReport(results: dict):
+    nameWidth = max([len(name) for name in results] + [13])
+    # solves and time without deferred compute, when measured
+    hasImmediate = all('immediateCompute' in result for result in results.values()) and len(results) > 0
+    def immediateColumns(solves, seconds):
+        return '  {:>10}  {:>10.1f}'.format(solves, seconds * 1000) if hasImmediate else ''
+    # combines and features with every boolean operation emitted separately, when measured
+    hasUnplanned = all('unplannedBooleans' in result for result in results.values()) and len(results) > 0
+    def unplannedColumns(combines, features):
+        return '  {:>10}  {:>10}'.format(combines, features) if hasUnplanned else ''
+    header = '{:<{width}}  {}  {:>9}{}{}'.format(
+        'configuration',
+        '  '.join('{:>9}'.format(label) for label in REPORTED_COUNTS.values()),
+        'time, ms',
+        '  {:>10}  {:>10}'.format('imm solves', 'imm, ms') if hasImmediate else '',
+        '  {:>10}  {:>10}'.format('unpl comb', 'unpl feat') if hasUnplanned else '',
+        width=nameWidth,
+    )
+    print(header)
+    print('-' * len(header))
+    for (name, result) in results.items():
+        counts = '  '.join('{:>9}'.format(result['counts'][key]) for key in REPORTED_COUNTS)
+        immediate = immediateColumns(result['immediateCompute']['solves'], result['immediateCompute']['seconds']) if hasImmediate else ''
+        unplanned = unplannedColumns(result['unplannedBooleans']['combines'], result['unplannedBooleans']['features']) if hasUnplanned else ''
+        print('{:<{width}}  {}  {:>9.1f}{}{}'.format(name, counts, result['seconds'] * 1000, immediate, unplanned, width=nameWidth))
+    totals = '  '.join('{:>9}'.format(sum(result['counts'][key] for result in results.values())) for key in REPORTED_COUNTS)
+    immediateTotals = immediateColumns(
+        sum(result['immediateCompute']['solves'] for result in results.values()),
+        sum(result['immediateCompute']['seconds'] for result in results.values()),
+    ) if hasImmediate else ''
+    unplannedTotals = unplannedColumns(
+        sum(result['unplannedBooleans']['combines'] for result in results.values()),
+        sum(result['unplannedBooleans']['features'] for result in results.values()),
+    ) if hasUnplanned else ''
+    print('-' * len(header))
+    print('{:<{width}}  {}  {:>9.1f}{}{}'.format('total', totals, sum(result['seconds'] for result in results.values()) * 1000, immediateTotals, unplannedTotals, width=nameWidth))
+
+def loadBaseline():
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH, 'r') as file:
+        return json.load(file)
+
+def writeBaseline(results: dict):
+    # one configuration per line keeps baseline diffs readable in review
+    lines = ['    {}: {}'.format(json.dumps(name), json.dumps(result['counts'])) for (name, result) in results.items()]
+    with open(BASELINE_PATH, 'w') as file:
+        file.write('{\n' + ',\n'.join(lines) + '\n}\n')
+
+def compareWithBaseline(results: dict, baseline: dict):
+    regressions = []
+    improvements = []
+    for (name, result) in results.items():
+        if not name in baseline:
+            print('new configuration, not in baseline: {}'.format(name))
+            continue
+        for key in REPORTED_COUNTS:
+            before = baseline[name].get(key, 0)
+            after = result['counts'][key]
+            if after == before:
+                continue
+            line = '{}: {} {} -> {} ({:+d})'.format(name, REPORTED_COUNTS[key], before, after, after - before)
+            (regressions if after > before else improvements).append(line)
+    for line in improvements:
+        print('improved   ' + line)
+    for line in regressions:
+        print('REGRESSION ' + line)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description='Gridfinity generator feature count benchmark')
+    parser.add_argument('--filter', default='', help='only run configurations containing this text')
+    parser.add_argument('--update-baseline', action='store_true', help='overwrite baseline.json with the current counts')
+    parser.add_argument('--output', default='', help='write full results including timings and all recorded counts to a JSON file')
+    parser.add_argument('--trace', action='store_true', help='record per stage traces, printed after the report and included into --output')
+    parser.add_argument('--compare-compute', action='store_true', help='run every configuration again without deferred compute and report its solves and time')
+    parser.add_argument('--compare-booleans', action='store_true', help='run every configuration again without the boolean planner and report its combines and features')
+    args = parser.parse_args()
+
+    modules = AddinModules()
+    modules.futil.set_tracing_enabled(args.trace, '')
+    results = runAll(modules, args.filter, args.compare_compute, args.compare_booleans)
+    printReport(results)
+    if args.trace:
+        print()
+        for result in results.values():
+            print(modules.futil.format_trace_summary(result['trace']))
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+    if args.update_baseline:
+        if args.filter:
+            parser.error('--update-baseline requires the full matrix, remove --filter')
+        writeBaseline(results)
+        print('baseline updated: {}'.format(BASELINE_PATH))
+        return 0
+
+    regressions = compareWithBaseline(results, loadBaseline())
+    return 1 if len(regressions) > 0 else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
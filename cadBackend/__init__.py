@@ -0,0 +1,46 @@
+import sys
+import types
+
+# Generators only talk to the Fusion 360 API (adsk.core/adsk.fusion), which is the
+# backend interface of the add-in. Inside Fusion the real modules are used, outside
+# of it the recording backend provides the same API surface in plain python, so the
+# generation pipeline can run headless to count emitted features and time python code.
+
+def isFusionAvailable() -> bool:
+    adsk = sys.modules.get('adsk')
+    if adsk is not None:
+        return not getattr(adsk, 'isRecordingBackend', False)
+    try:
+        import adsk.core
+        return True
+    except ImportError:
+        return False
+
+def installRecordingBackend() -> types.ModuleType:
+    """
+    Registers the recording backend as `adsk`, must be called before any generator module is imported.
+    """
+    existing = sys.modules.get('adsk')
+    if existing is not None and getattr(existing, 'isRecordingBackend', False):
+        return existing
+    if isFusionAvailable():
+        raise RuntimeError('Fusion 360 API is available, recording backend must not replace it')
+
+    from . import recordingCore, recordingFusion
+    adsk = types.ModuleType('adsk')
+    adsk.isRecordingBackend = True
+    adsk.core = recordingCore
+    adsk.fusion = recordingFusion
+    sys.modules['adsk'] = adsk
+    sys.modules['adsk.core'] = recordingCore
+    sys.modules['adsk.fusion'] = recordingFusion
+    return adsk
+
+def newRecordingDesign():
+    """
+    Replaces active product with an empty recording design and returns it.
+    """
+    adsk = installRecordingBackend()
+    design = adsk.fusion.Design()
+    adsk.core.Application.get().activeProduct = design
+    return design
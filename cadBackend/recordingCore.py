@@ -0,0 +1,417 @@
+import math
+import itertools
+
+# In-memory stand-in for the subset of adsk.core used by the generators.
+# Only plain python is allowed here, the module is installed as `adsk.core`
+# when the add-in code runs outside of Fusion 360.
+
+_placeholderTypes = {}
+_tempIds = itertools.count(1)
+
+def nextTempId():
+    return next(_tempIds)
+
+class Base:
+    @classmethod
+    def classType(cls):
+        return 'adsk::core::{}'.format(cls.__name__)
+
+    @classmethod
+    def cast(cls, object):
+        return object
+
+    @property
+    def objectType(self):
+        return self.classType()
+
+    @property
+    def isValid(self):
+        return True
+
+def __getattr__(name: str):
+    # type annotations reference many API classes which are never instantiated headless
+    if name.startswith('__'):
+        raise AttributeError(name)
+    if not name in _placeholderTypes:
+        _placeholderTypes[name] = type(name, (Base,), {})
+    return _placeholderTypes[name]
+
+class LogLevels:
+    InfoLogLevel = 0
+    WarningLogLevel = 1
+    ErrorLogLevel = 2
+
+class LogTypes:
+    ConsoleLogType = 0
+    FileLogType = 1
+
+class ValueTypes:
+    RealValueType = 0
+    StringValueType = 1
+
+class DropDownStyles:
+    TextListDropDownStyle = 0
+    LabeledIconDropDownStyle = 1
+    CheckBoxDropDownStyle = 2
+
+class TablePresentationStyles:
+    itemBorderTablePresentationStyle = 0
+    nameValueTablePresentationStyle = 1
+    transparentBackgroundTablePresentationStyle = 2
+
+class Point3D(Base):
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0):
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+
+    @staticmethod
+    def create(x: float = 0.0, y: float = 0.0, z: float = 0.0):
+        return Point3D(x, y, z)
+
+    def copy(self):
+        return Point3D(self.x, self.y, self.z)
+
+    def asArray(self):
+        return [self.x, self.y, self.z]
+
+    def asVector(self):
+        return Vector3D(self.x, self.y, self.z)
+
+    def setWithArray(self, coordinates):
+        [self.x, self.y, self.z] = [float(value) for value in coordinates]
+        return True
+
+    def distanceTo(self, point: 'Point3D'):
+        return math.dist(self.asArray(), point.asArray())
+
+    def isEqualTo(self, point: 'Point3D'):
+        return self.isEqualToByTolerance(point, 1e-9)
+
+    def isEqualToByTolerance(self, point: 'Point3D', tolerance: float):
+        return self.distanceTo(point) <= tolerance
+
+    def vectorTo(self, point: 'Point3D'):
+        return Vector3D(point.x - self.x, point.y - self.y, point.z - self.z)
+
+    def translateBy(self, vector: 'Vector3D'):
+        self.x += vector.x
+        self.y += vector.y
+        self.z += vector.z
+        return True
+
+    def transformBy(self, matrix: 'Matrix3D'):
+        [self.x, self.y, self.z] = matrix.transformCoordinates(self.asArray())
+        return True
+
+    def __repr__(self):
+        return 'Point3D({:.4f}, {:.4f}, {:.4f})'.format(self.x, self.y, self.z)
+
+class Vector3D(Base):
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0):
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+
+    @staticmethod
+    def create(x: float = 0.0, y: float = 0.0, z: float = 0.0):
+        return Vector3D(x, y, z)
+
+    @property
+    def length(self):
+        return math.sqrt(self.x ** 2 + self.y ** 2 + self.z ** 2)
+
+    def copy(self):
+        return Vector3D(self.x, self.y, self.z)
+
+    def asArray(self):
+        return [self.x, self.y, self.z]
+
+    def asPoint(self):
+        return Point3D(self.x, self.y, self.z)
+
+    def add(self, vector: 'Vector3D'):
+        self.x += vector.x
+        self.y += vector.y
+        self.z += vector.z
+        return True
+
+    def subtract(self, vector: 'Vector3D'):
+        self.x -= vector.x
+        self.y -= vector.y
+        self.z -= vector.z
+        return True
+
+    def scaleBy(self, scale: float):
+        self.x *= scale
+        self.y *= scale
+        self.z *= scale
+        return True
+
+    def normalize(self):
+        length = self.length
+        if length > 0:
+            self.scaleBy(1 / length)
+        return True
+
+    def dotProduct(self, vector: 'Vector3D'):
+        return self.x * vector.x + self.y * vector.y + self.z * vector.z
+
+    def crossProduct(self, vector: 'Vector3D'):
+        return Vector3D(
+            self.y * vector.z - self.z * vector.y,
+            self.z * vector.x - self.x * vector.z,
+            self.x * vector.y - self.y * vector.x,
+        )
+
+    def isParallelTo(self, vector: 'Vector3D'):
+        return self.crossProduct(vector).length < 1e-9
+
+    def transformBy(self, matrix: 'Matrix3D'):
+        [self.x, self.y, self.z] = matrix.transformDirection(self.asArray())
+        return True
+
+class Matrix3D(Base):
+    def __init__(self):
+        self._cells = [[1.0 if row == column else 0.0 for column in range(4)] for row in range(4)]
+
+    @staticmethod
+    def create():
+        return Matrix3D()
+
+    def copy(self):
+        matrix = Matrix3D()
+        matrix._cells = [list(row) for row in self._cells]
+        return matrix
+
+    def getCell(self, row: int, column: int):
+        return self._cells[row][column]
+
+    def setCell(self, row: int, column: int, value: float):
+        self._cells[row][column] = float(value)
+        return True
+
+    def asArray(self):
+        return [value for row in self._cells for value in row]
+
+    def setWithArray(self, cells):
+        self._cells = [[float(cells[row * 4 + column]) for column in range(4)] for row in range(4)]
+        return True
+
+    @property
+    def translation(self):
+        return Vector3D(self._cells[0][3], self._cells[1][3], self._cells[2][3])
+
+    @translation.setter
+    def translation(self, value: Vector3D):
+        [self._cells[0][3], self._cells[1][3], self._cells[2][3]] = value.asArray()
+
+    def setToIdentity(self):
+        self._cells = Matrix3D()._cells
+        return True
+
+    def setToRotation(self, angle: float, axis: Vector3D, origin: Point3D):
+        direction = axis.copy()
+        direction.normalize()
+        [x, y, z] = direction.asArray()
+        c = math.cos(angle)
+        s = math.sin(angle)
+        t = 1 - c
+        rotation = [
+            [t * x * x + c, t * x * y - s * z, t * x * z + s * y],
+            [t * x * y + s * z, t * y * y + c, t * y * z - s * x],
+            [t * x * z - s * y, t * y * z + s * x, t * z * z + c],
+        ]
+        o = origin.asArray()
+        self.setToIdentity()
+        for row in range(3):
+            self._cells[row][0:3] = rotation[row]
+            self._cells[row][3] = o[row] - sum(rotation[row][column] * o[column] for column in range(3))
+        return True
+
+    def transformBy(self, matrix: 'Matrix3D'):
+        # this = matrix * this
+        self._cells = [
+            [sum(matrix._cells[row][k] * self._cells[k][column] for k in range(4)) for column in range(4)]
+            for row in range(4)
+        ]
+        return True
+
+    def transformCoordinates(self, coordinates):
+        return [
+            sum(self._cells[row][column] * coordinates[column] for column in range(3)) + self._cells[row][3]
+            for row in range(3)
+        ]
+
+    def transformDirection(self, coordinates):
+        return [sum(self._cells[row][column] * coordinates[column] for column in range(3)) for row in range(3)]
+
+class BoundingBox3D(Base):
+    def __init__(self, minPoint: Point3D, maxPoint: Point3D):
+        self.minPoint = minPoint
+        self.maxPoint = maxPoint
+
+    @staticmethod
+    def create(minPoint: Point3D, maxPoint: Point3D):
+        return BoundingBox3D(minPoint.copy(), maxPoint.copy())
+
+    def copy(self):
+        return BoundingBox3D(self.minPoint.copy(), self.maxPoint.copy())
+
+    def contains(self, point: Point3D):
+        return all(low <= value <= high for low, value, high in zip(self.minPoint.asArray(), point.asArray(), self.maxPoint.asArray()))
+
+    def intersects(self, box: 'BoundingBox3D'):
+        return all(
+            low1 <= high2 and low2 <= high1
+            for low1, high1, low2, high2 in zip(self.minPoint.asArray(), self.maxPoint.asArray(), box.minPoint.asArray(), box.maxPoint.asArray())
+        )
+
+    def combine(self, box: 'BoundingBox3D'):
+        self.minPoint = Point3D(*[min(a, b) for a, b in zip(self.minPoint.asArray(), box.minPoint.asArray())])
+        self.maxPoint = Point3D(*[max(a, b) for a, b in zip(self.maxPoint.asArray(), box.maxPoint.asArray())])
+        return True
+
+    def expand(self, point: Point3D):
+        return self.combine(BoundingBox3D(point, point))
+
+class OrientedBoundingBox3D(Base):
+    def __init__(self, centerPoint: Point3D, lengthDirection: Vector3D, widthDirection: Vector3D, length: float, width: float, height: float):
+        self.centerPoint = centerPoint
+        self.lengthDirection = lengthDirection
+        self.widthDirection = widthDirection
+        self.length = length
+        self.width = width
+        self.height = height
+
+    @staticmethod
+    def create(centerPoint: Point3D, lengthDirection: Vector3D, widthDirection: Vector3D, length: float, width: float, height: float):
+        return OrientedBoundingBox3D(centerPoint.copy(), lengthDirection.copy(), widthDirection.copy(), length, width, height)
+
+class ValueInput(Base):
+    def __init__(self, realValue: float = 0.0, stringValue: str = ''):
+        self.realValue = realValue
+        self.stringValue = stringValue
+
+    @property
+    def valueType(self):
+        return ValueTypes.StringValueType if self.stringValue else ValueTypes.RealValueType
+
+    @staticmethod
+    def createByReal(realValue: float):
+        return ValueInput(float(realValue))
+
+    @staticmethod
+    def createByString(stringValue: str):
+        [number, *units] = stringValue.split()
+        value = float(number)
+        if len(units) > 0 and units[0] == 'deg':
+            value = math.radians(value)
+        return ValueInput(value, stringValue)
+
+class ObjectCollection(Base):
+    def __init__(self, items = None):
+        self._items = list(items) if items is not None else []
+
+    @staticmethod
+    def create():
+        return ObjectCollection()
+
+    @property
+    def count(self):
+        return len(self._items)
+
+    def item(self, index: int):
+        return self._items[index]
+
+    def add(self, item):
+        self._items.append(item)
+        return True
+
+    def contains(self, item):
+        return any(existing is item for existing in self._items)
+
+    def find(self, item, startIndex: int = 0):
+        for index in range(startIndex, len(self._items)):
+            if self._items[index] is item:
+                return index
+        return -1
+
+    def removeByIndex(self, index: int):
+        del self._items[index]
+        return True
+
+    def removeByItem(self, item):
+        index = self.find(item)
+        if index < 0:
+            return False
+        return self.removeByIndex(index)
+
+    def clear(self):
+        self._items.clear()
+        return True
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+class _Event(Base):
+    def __init__(self):
+        self.handlers = []
+
+    def add(self, handler):
+        self.handlers.append(handler)
+        return True
+
+    def remove(self, handler):
+        if handler in self.handlers:
+            self.handlers.remove(handler)
+        return True
+
+class _UserInterface(Base):
+    def __init__(self):
+        self.messages: list[str] = []
+
+    def messageBox(self, text: str, *args, **kwargs):
+        self.messages.append(text)
+        return 0
+
+    @property
+    def activeSelections(self):
+        return ObjectCollection()
+
+class Application(Base):
+    _instance: 'Application' = None
+
+    def __init__(self):
+        self.userInterface = _UserInterface()
+        self.activeProduct = None
+        self.logEntries: list[tuple[str, int]] = []
+
+    @staticmethod
+    def get():
+        if Application._instance is None:
+            Application._instance = Application()
+        return Application._instance
+
+    @property
+    def activeDocument(self):
+        return None
+
+    def log(self, message: str, level: int = LogLevels.InfoLogLevel, type: int = LogTypes.ConsoleLogType):
+        self.logEntries.append((message, level))
+        return True
+
+    def registerCustomEvent(self, eventId: str):
+        return _Event()
+
+    def unregisterCustomEvent(self, eventId: str):
+        return True
+
+    def fireCustomEvent(self, eventId: str, additionalInfo: str = ''):
+        return True
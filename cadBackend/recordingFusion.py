@@ -0,0 +1,1591 @@
+import collections
+import json
+import math
+
+from . import recordingCore as core
+from .recordingCore import Base, Point3D, Vector3D, Matrix3D, BoundingBox3D, ObjectCollection, ValueInput, nextTempId
+
+# In-memory stand-in for the subset of adsk.fusion used by the generators.
+# Bodies are approximated by axis aligned boxes, which is enough to follow the
+# same code paths as in Fusion and to count every emitted timeline entity.
+
+_placeholderTypes = {}
+
+def __getattr__(name: str):
+    if name.startswith('__'):
+        raise AttributeError(name)
+    if not name in _placeholderTypes:
+        _placeholderTypes[name] = type(name, (Base,), {})
+    return _placeholderTypes[name]
+
+class FeatureOperations:
+    JoinFeatureOperation = 0
+    CutFeatureOperation = 1
+    IntersectFeatureOperation = 2
+    NewBodyFeatureOperation = 3
+    NewComponentFeatureOperation = 4
+
+class ExtentDirections:
+    PositiveExtentDirection = 0
+    NegativeExtentDirection = 1
+    SymmetricExtentDirection = 2
+
+class DimensionOrientations:
+    AlignedDimensionOrientation = 0
+    HorizontalDimensionOrientation = 1
+    VerticalDimensionOrientation = 2
+
+class PatternDistanceType:
+    ExtentPatternDistanceType = 0
+    SpacingPatternDistanceType = 1
+
+class DesignTypes:
+    DirectDesignType = 0
+    ParametricDesignType = 1
+
+class SurfaceExtendTypes:
+    NaturalSurfaceExtendType = 0
+    TangentSurfaceExtendType = 1
+    PerpendicularSurfaceExtendType = 2
+
+class BooleanTypes:
+    DifferenceBooleanType = 0
+    IntersectionBooleanType = 1
+    UnionBooleanType = 2
+
+class MeshRefinementSettings:
+    MeshRefinementHigh = 0
+    MeshRefinementMedium = 1
+    MeshRefinementLow = 2
+    MeshRefinementCustom = 3
+
+class Recorder:
+    """
+    Counts every entity the generators emit, keyed by entity kind.
+    """
+    def __init__(self):
+        self.counts = collections.Counter()
+
+    def record(self, key: str, amount: int = 1):
+        self.counts[key] += amount
+
+    def reset(self):
+        self.counts.clear()
+
+    def snapshot(self) -> dict[str, int]:
+        return dict(sorted(self.counts.items()))
+
+def _designOf(component: 'Component') -> 'Design':
+    return component.parentDesign
+
+def _record(component: 'Component', key: str, amount: int = 1):
+    _designOf(component).recorder.record(key, amount)
+
+def _recordQuery(body: 'BRepBody'):
+    # geometry reads of faces and edges are cross-process calls in Fusion, transient bodies are not recorded
+    if body.parentComponent is not None:
+        _record(body.parentComponent, 'brepQueries')
+
+def _timelineObject(component: 'Component'):
+    return _designOf(component).timeline._append()
+
+# ---------------------------------------------------------------------------
+# geometry helpers
+# ---------------------------------------------------------------------------
+
+_IN_PLANE_AXES = {0: (1, 2), 1: (0, 2), 2: (0, 1)}
+
+class _PlaneFrame:
+    def __init__(self, axis: int, coordinate: float, sign: int):
+        self.axis = axis
+        self.coordinate = coordinate
+        self.sign = sign
+
+    def offset(self, distance: float):
+        return _PlaneFrame(self.axis, self.coordinate + self.sign * distance, self.sign)
+
+    def toSketch(self, point: Point3D):
+        coordinates = point.asArray()
+        [u, v] = _IN_PLANE_AXES[self.axis]
+        return Point3D(coordinates[u], coordinates[v], self.sign * (coordinates[self.axis] - self.coordinate))
+
+    def toModel(self, point: Point3D):
+        coordinates = [0.0, 0.0, 0.0]
+        [u, v] = _IN_PLANE_AXES[self.axis]
+        coordinates[u] = point.x
+        coordinates[v] = point.y
+        coordinates[self.axis] = self.coordinate + self.sign * point.z
+        return Point3D(*coordinates)
+
+    def normal(self):
+        coordinates = [0.0, 0.0, 0.0]
+        coordinates[self.axis] = float(self.sign)
+        return Vector3D(*coordinates)
+
+    def boxFromRegion(self, uvMin: tuple, uvMax: tuple, wStart: float, wEnd: float):
+        [u, v] = _IN_PLANE_AXES[self.axis]
+        boxMin = [0.0, 0.0, 0.0]
+        boxMax = [0.0, 0.0, 0.0]
+        boxMin[u], boxMax[u] = uvMin[0], uvMax[0]
+        boxMin[v], boxMax[v] = uvMin[1], uvMax[1]
+        [nStart, nEnd] = [self.coordinate + self.sign * wStart, self.coordinate + self.sign * wEnd]
+        boxMin[self.axis], boxMax[self.axis] = min(nStart, nEnd), max(nStart, nEnd)
+        return (tuple(boxMin), tuple(boxMax))
+
+def _frameOf(entity) -> _PlaneFrame:
+    if isinstance(entity, (ConstructionPlane, BRepFace)):
+        return entity._frame
+    if isinstance(entity, Profile):
+        return entity.parentSketch._frame
+    if isinstance(entity, Sketch):
+        return entity._frame
+    raise ValueError('Unsupported planar entity {}'.format(type(entity).__name__))
+
+def _union(boxes):
+    boxes = list(boxes)
+    return (
+        tuple(min(box[0][i] for box in boxes) for i in range(3)),
+        tuple(max(box[1][i] for box in boxes) for i in range(3)),
+    )
+
+def _intersection(box1, box2):
+    boxMin = tuple(max(box1[0][i], box2[0][i]) for i in range(3))
+    boxMax = tuple(min(box1[1][i], box2[1][i]) for i in range(3))
+    if any(boxMin[i] > boxMax[i] for i in range(3)):
+        return None
+    return (boxMin, boxMax)
+
+def _mergeOverlapping(boxes):
+    # overlapping profiles of a sketch are extruded into a single body, touching ones stay apart
+    merged = []
+    for box in boxes:
+        while True:
+            overlapping = [other for other in merged if all(min(box[1][i], other[1][i]) - max(box[0][i], other[0][i]) > 1e-9 for i in range(3))]
+            if len(overlapping) == 0:
+                break
+            merged = [other for other in merged if not other in overlapping]
+            box = _union([box] + overlapping)
+        merged.append(box)
+    return merged
+
+def _transformBox(box, matrix: Matrix3D):
+    corners = [matrix.transformCoordinates([x, y, z]) for x in (box[0][0], box[1][0]) for y in (box[0][1], box[1][1]) for z in (box[0][2], box[1][2])]
+    return (
+        tuple(min(corner[i] for corner in corners) for i in range(3)),
+        tuple(max(corner[i] for corner in corners) for i in range(3)),
+    )
+
+def _translateBox(box, offset):
+    return (
+        tuple(box[0][i] + offset[i] for i in range(3)),
+        tuple(box[1][i] + offset[i] for i in range(3)),
+    )
+
+def _boundingBox(box):
+    return BoundingBox3D(Point3D(*box[0]), Point3D(*box[1]))
+
+def _asList(entities):
+    if entities is None:
+        return []
+    if isinstance(entities, (list, tuple, ObjectCollection, _ItemCollection)):
+        return list(entities)
+    return [entities]
+
+# ---------------------------------------------------------------------------
+# collections
+# ---------------------------------------------------------------------------
+
+class _ItemCollection(Base):
+    def __init__(self, items = None):
+        self._items = list(items) if items is not None else []
+
+    @property
+    def count(self):
+        return len(self._items)
+
+    def item(self, index: int):
+        return self._items[index]
+
+    def itemByName(self, name: str):
+        return next((item for item in self._items if getattr(item, 'name', None) == name), None)
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+class BRepBodies(_ItemCollection):
+    pass
+
+class _ComponentBRepBodies(BRepBodies):
+    def __init__(self, component: 'Component'):
+        super().__init__(component._bodies)
+        self._component = component
+
+    def add(self, body: 'BRepBody', baseFeature: 'BaseFeature' = None):
+        added = self._component._addBody(body._box, body.name)
+        if baseFeature is not None:
+            baseFeature._bodies.append(added)
+        return added
+
+class BRepFaces(_ItemCollection):
+    pass
+
+class BRepEdges(_ItemCollection):
+    pass
+
+class BRepVertices(_ItemCollection):
+    pass
+
+# ---------------------------------------------------------------------------
+# b-rep
+# ---------------------------------------------------------------------------
+
+class BRepVertex(Base):
+    def __init__(self, body: 'BRepBody', coordinates):
+        self.body = body
+        self._coordinates = coordinates
+        self.tempId = nextTempId()
+
+    @property
+    def geometry(self):
+        return Point3D(*self._coordinates)
+
+class _CurveEvaluator(Base):
+    def __init__(self, edge: 'BRepEdge'):
+        self._edge = edge
+
+    def getEndPoints(self):
+        return (True, self._edge.startVertex.geometry, self._edge.endVertex.geometry)
+
+class BRepEdge(Base):
+    def __init__(self, body: 'BRepBody', startVertex: BRepVertex, endVertex: BRepVertex):
+        self.body = body
+        self.startVertex = startVertex
+        self.endVertex = endVertex
+        self.tempId = nextTempId()
+        self._faces: list['BRepFace'] = []
+
+    @property
+    def length(self):
+        _recordQuery(self.body)
+        return self.startVertex.geometry.distanceTo(self.endVertex.geometry)
+
+    @property
+    def boundingBox(self):
+        _recordQuery(self.body)
+        return _boundingBox(_union([(self.startVertex._coordinates, self.startVertex._coordinates), (self.endVertex._coordinates, self.endVertex._coordinates)]))
+
+    @property
+    def evaluator(self):
+        return _CurveEvaluator(self)
+
+    @property
+    def faces(self):
+        return BRepFaces(self._faces)
+
+    @property
+    def tangentiallyConnectedEdges(self):
+        # closest analogue of a tangent chain on a box: the loop of the first adjacent face
+        return BRepEdges(self._faces[0]._edges if len(self._faces) > 0 else [self])
+
+class _Plane(Base):
+    def __init__(self, origin: Point3D, normal: Vector3D):
+        self.origin = origin
+        self.normal = normal
+
+class BRepFace(Base):
+    def __init__(self, body: 'BRepBody', axis: int, side: int, box):
+        self.body = body
+        self.tempId = nextTempId()
+        self._axis = axis
+        self._side = side
+        coordinate = box[1][axis] if side > 0 else box[0][axis]
+        self._frame = _PlaneFrame(axis, coordinate, side)
+        faceMin = list(box[0])
+        faceMax = list(box[1])
+        faceMin[axis] = faceMax[axis] = coordinate
+        self._box = (tuple(faceMin), tuple(faceMax))
+        self._edges: list[BRepEdge] = []
+
+    @property
+    def boundingBox(self):
+        _recordQuery(self.body)
+        return _boundingBox(self._box)
+
+    @property
+    def edges(self):
+        return BRepEdges(self._edges)
+
+    @property
+    def area(self):
+        [u, v] = _IN_PLANE_AXES[self._axis]
+        return (self._box[1][u] - self._box[0][u]) * (self._box[1][v] - self._box[0][v])
+
+    @property
+    def geometry(self):
+        return _Plane(self.pointOnFace, self._frame.normal())
+
+    @property
+    def pointOnFace(self):
+        return Point3D(*[(self._box[0][i] + self._box[1][i]) / 2 for i in range(3)])
+
+class BRepBody(Base):
+    def __init__(self, component: 'Component', box, name: str = 'Body'):
+        self.parentComponent = component
+        self.name = name
+        self.isVisible = True
+        self.isSolid = True
+        self.isLightBulbOn = True
+        self.tempId = nextTempId()
+        self._box = box
+        self._revision = 0
+        self._topology = None
+
+    def _setBox(self, box):
+        self._box = box
+        self._touch()
+
+    def _touch(self):
+        self._revision += 1
+        self._topology = None
+
+    @property
+    def revisionId(self):
+        return '{}.{}'.format(self.tempId, self._revision)
+
+    @property
+    def entityToken(self):
+        return str(self.tempId)
+
+    @property
+    def boundingBox(self):
+        return _boundingBox(self._box)
+
+    @property
+    def volume(self):
+        return math.prod(self._box[1][i] - self._box[0][i] for i in range(3))
+
+    @property
+    def area(self):
+        return sum(face.area for face in self.faces)
+
+    def _buildTopology(self):
+        box = self._box
+        vertices = {}
+        for corner in [(i, j, k) for i in (0, 1) for j in (0, 1) for k in (0, 1)]:
+            vertices[corner] = BRepVertex(self, tuple(box[corner[axis]][axis] for axis in range(3)))
+        edges = []
+        for axis in range(3):
+            [u, v] = _IN_PLANE_AXES[axis]
+            for sideU in (0, 1):
+                for sideV in (0, 1):
+                    start = [0, 0, 0]
+                    start[u], start[v] = sideU, sideV
+                    end = list(start)
+                    end[axis] = 1
+                    edges.append((axis, sideU, sideV, BRepEdge(self, vertices[tuple(start)], vertices[tuple(end)])))
+        faces = []
+        for axis in (2, 1, 0):
+            for side in (-1, 1):
+                face = BRepFace(self, axis, side, box)
+                sideIndex = 1 if side > 0 else 0
+                for (edgeAxis, sideU, sideV, edge) in edges:
+                    if edgeAxis == axis:
+                        continue
+                    [u, v] = _IN_PLANE_AXES[edgeAxis]
+                    edgeSide = sideU if u == axis else sideV
+                    if edgeSide == sideIndex:
+                        face._edges.append(edge)
+                        edge._faces.append(face)
+                faces.append(face)
+        self._topology = (
+            BRepFaces(faces),
+            BRepEdges([edge for (_, _, _, edge) in edges]),
+            BRepVertices(vertices.values()),
+        )
+
+    @property
+    def faces(self):
+        if self._topology is None:
+            self._buildTopology()
+        return self._topology[0]
+
+    @property
+    def edges(self):
+        if self._topology is None:
+            self._buildTopology()
+        return self._topology[1]
+
+    @property
+    def vertices(self):
+        if self._topology is None:
+            self._buildTopology()
+        return self._topology[2]
+
+    def _faceAt(self, axis: int, side: int):
+        return next(face for face in self.faces if face._axis == axis and face._side == side)
+
+    def deleteMe(self):
+        self.parentComponent._removeBody(self)
+        return True
+
+# ---------------------------------------------------------------------------
+# construction geometry
+# ---------------------------------------------------------------------------
+
+class ConstructionPlane(Base):
+    def __init__(self, component: 'Component', frame: _PlaneFrame, name: str):
+        self.parentComponent = component
+        self.name = name
+        self.isLightBulbOn = True
+        self.isVisible = True
+        self._frame = frame
+        self.timelineObject = None
+
+    @property
+    def geometry(self):
+        return _Plane(self._frame.toModel(Point3D(0, 0, 0)), self._frame.normal())
+
+class ConstructionPlaneInput(Base):
+    def __init__(self):
+        self._frame: _PlaneFrame = None
+
+    def setByOffset(self, planarEntity, offset: ValueInput):
+        self._frame = _frameOf(planarEntity).offset(offset.realValue)
+        return True
+
+    def setByPlane(self, plane):
+        self._frame = _frameOf(plane)
+        return True
+
+class ConstructionPlanes(_ItemCollection):
+    def __init__(self, component: 'Component'):
+        super().__init__()
+        self._component = component
+
+    def createInput(self, occurrenceForCreation = None):
+        return ConstructionPlaneInput()
+
+    def add(self, input: ConstructionPlaneInput):
+        plane = ConstructionPlane(self._component, input._frame, 'Plane{}'.format(len(self._items) + 1))
+        plane.timelineObject = _timelineObject(self._component)
+        self._items.append(plane)
+        _record(self._component, 'constructionPlanes')
+        return plane
+
+class ConstructionAxis(Base):
+    def __init__(self, component: 'Component', origin: Point3D, direction: Vector3D, name: str):
+        self.parentComponent = component
+        self.name = name
+        self.isLightBulbOn = True
+        self.isVisible = True
+        self._origin = origin
+        self._direction = direction
+        self.timelineObject = None
+
+class ConstructionAxisInput(Base):
+    def __init__(self):
+        self._origin: Point3D = None
+        self._direction: Vector3D = None
+
+    def setByTwoPlanes(self, planarEntityOne, planarEntityTwo):
+        frameOne = _frameOf(planarEntityOne)
+        frameTwo = _frameOf(planarEntityTwo)
+        coordinates = [0.0, 0.0, 0.0]
+        coordinates[frameOne.axis] = frameOne.coordinate
+        coordinates[frameTwo.axis] = frameTwo.coordinate
+        direction = [0.0, 0.0, 0.0]
+        direction[3 - frameOne.axis - frameTwo.axis] = 1.0
+        self._origin = Point3D(*coordinates)
+        self._direction = Vector3D(*direction)
+        return True
+
+    def setByNormalToFaceAtPoint(self, face, point):
+        self._direction = _frameOf(face).normal()
+        self._origin = point.worldGeometry if isinstance(point, SketchPoint) else point.copy()
+        return True
+
+    def setByEdge(self, edge: BRepEdge):
+        self._origin = edge.startVertex.geometry
+        self._direction = self._origin.vectorTo(edge.endVertex.geometry)
+        self._direction.normalize()
+        return True
+
+class ConstructionAxes(_ItemCollection):
+    def __init__(self, component: 'Component'):
+        super().__init__()
+        self._component = component
+
+    def createInput(self, occurrenceForCreation = None):
+        return ConstructionAxisInput()
+
+    def add(self, input: ConstructionAxisInput):
+        axis = ConstructionAxis(self._component, input._origin, input._direction, 'Axis{}'.format(len(self._items) + 1))
+        axis.timelineObject = _timelineObject(self._component)
+        self._items.append(axis)
+        _record(self._component, 'constructionAxes')
+        return axis
+
+class ConstructionPoint(Base):
+    def __init__(self, geometry: Point3D):
+        self._geometry = geometry
+
+    @property
+    def geometry(self):
+        return self._geometry.copy()
+
+# ---------------------------------------------------------------------------
+# sketches
+# ---------------------------------------------------------------------------
+
+class SketchPoint(Base):
+    def __init__(self, sketch: 'Sketch', geometry: Point3D):
+        self.parentSketch = sketch
+        self._geometry = geometry.copy()
+
+    @property
+    def geometry(self):
+        return self._geometry.copy()
+
+    @property
+    def worldGeometry(self):
+        return self.parentSketch.sketchToModelSpace(self._geometry)
+
+class SketchCurve(Base):
+    def __init__(self, sketch: 'Sketch'):
+        self.parentSketch = sketch
+        self.isConstruction = False
+        self.isFixed = False
+
+    def _points(self) -> list[Point3D]:
+        return []
+
+    @property
+    def boundingBox(self):
+        points = self._points()
+        return BoundingBox3D(
+            Point3D(*[min(point.asArray()[i] for point in points) for i in range(3)]),
+            Point3D(*[max(point.asArray()[i] for point in points) for i in range(3)]),
+        )
+
+class SketchLine(SketchCurve):
+    def __init__(self, sketch: 'Sketch', startSketchPoint: SketchPoint, endSketchPoint: SketchPoint):
+        super().__init__(sketch)
+        self.startSketchPoint = startSketchPoint
+        self.endSketchPoint = endSketchPoint
+
+    @property
+    def length(self):
+        return self.startSketchPoint.geometry.distanceTo(self.endSketchPoint.geometry)
+
+    def _points(self):
+        return [self.startSketchPoint.geometry, self.endSketchPoint.geometry]
+
+class SketchCircle(SketchCurve):
+    def __init__(self, sketch: 'Sketch', centerSketchPoint: SketchPoint, radius: float):
+        super().__init__(sketch)
+        self.centerSketchPoint = centerSketchPoint
+        self.radius = radius
+
+    def _points(self):
+        center = self.centerSketchPoint.geometry
+        return [Point3D(center.x - self.radius, center.y - self.radius, center.z), Point3D(center.x + self.radius, center.y + self.radius, center.z)]
+
+class SketchArc(SketchCurve):
+    def __init__(self, sketch: 'Sketch', centerSketchPoint: SketchPoint, startSketchPoint: SketchPoint, endSketchPoint: SketchPoint):
+        super().__init__(sketch)
+        self.centerSketchPoint = centerSketchPoint
+        self.startSketchPoint = startSketchPoint
+        self.endSketchPoint = endSketchPoint
+
+    @property
+    def radius(self):
+        return self.centerSketchPoint.geometry.distanceTo(self.startSketchPoint.geometry)
+
+    def _points(self):
+        return [self.startSketchPoint.geometry, self.endSketchPoint.geometry]
+
+class SketchLines(_ItemCollection):
+    def __init__(self, sketch: 'Sketch'):
+        super().__init__()
+        self._sketch = sketch
+
+    def addByTwoPoints(self, startPoint, endPoint):
+        line = SketchLine(self._sketch, self._sketch._point(startPoint), self._sketch._point(endPoint))
+        return self._sketch._addCurve(self, line)
+
+    def addTwoPointRectangle(self, pointOne, pointTwo):
+        [x0, y0, x1, y1] = [pointOne.x, pointOne.y, pointTwo.x, pointTwo.y]
+        corners = [self._sketch._point(Point3D(x, y, 0)) for (x, y) in [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]]
+        lines = [SketchLine(self._sketch, corners[i], corners[(i + 1) % 4]) for i in range(4)]
+        for line in lines:
+            self._sketch._addCurve(self, line, isLoose=False)
+        self._sketch._loops.append(lines)
+        return ObjectCollection(lines)
+
+class SketchCircles(_ItemCollection):
+    def __init__(self, sketch: 'Sketch'):
+        super().__init__()
+        self._sketch = sketch
+
+    def addByCenterRadius(self, centerPoint, radius: float):
+        circle = SketchCircle(self._sketch, self._sketch._point(centerPoint), radius)
+        self._sketch._addCurve(self, circle, isLoose=False)
+        self._sketch._loops.append([circle])
+        return circle
+
+class SketchArcs(_ItemCollection):
+    def __init__(self, sketch: 'Sketch'):
+        super().__init__()
+        self._sketch = sketch
+
+    def addByCenterStartSweep(self, centerPoint, startPoint, sweepAngle: float):
+        center = self._sketch._point(centerPoint)
+        start = self._sketch._point(startPoint)
+        [cx, cy] = [center.geometry.x, center.geometry.y]
+        [dx, dy] = [start.geometry.x - cx, start.geometry.y - cy]
+        end = SketchPoint(self._sketch, Point3D(
+            cx + dx * math.cos(sweepAngle) - dy * math.sin(sweepAngle),
+            cy + dx * math.sin(sweepAngle) + dy * math.cos(sweepAngle),
+            0,
+        ))
+        return self._sketch._addCurve(self, SketchArc(self._sketch, center, start, end))
+
+    def addFillet(self, firstEntity: SketchLine, firstEntityPoint: Point3D, secondEntity: SketchLine, secondEntityPoint: Point3D, radius: float):
+        corner = firstEntity.endSketchPoint
+        arc = SketchArc(self._sketch, SketchPoint(self._sketch, corner.geometry), corner, secondEntity.startSketchPoint)
+        self._sketch._addCurve(self, arc, isLoose=False)
+        # the fillet closes the same loop as the trimmed lines
+        for loop in self._sketch._loops:
+            if firstEntity in loop:
+                loop.append(arc)
+        return arc
+
+class SketchCurves(Base):
+    def __init__(self, sketch: 'Sketch'):
+        self._sketch = sketch
+        self.sketchLines = SketchLines(sketch)
+        self.sketchCircles = SketchCircles(sketch)
+        self.sketchArcs = SketchArcs(sketch)
+
+    @property
+    def count(self):
+        return len(self._sketch._curves)
+
+    def item(self, index: int):
+        return self._sketch._curves[index]
+
+    def __iter__(self):
+        return iter(list(self._sketch._curves))
+
+    def __len__(self):
+        return len(self._sketch._curves)
+
+class _SketchRelation(Base):
+    def __init__(self, kind: str, entities: tuple):
+        self.kind = kind
+        self.entities = entities
+
+    def deleteMe(self):
+        return True
+
+class _SketchRelations(Base):
+    # every add* call creates one constraint/dimension, the geometry is never solved
+    def __init__(self, sketch: 'Sketch', recordKey: str):
+        self._sketch = sketch
+        self._recordKey = recordKey
+        self._items: list[_SketchRelation] = []
+
+    @property
+    def count(self):
+        return len(self._items)
+
+    def item(self, index: int):
+        return self._items[index]
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def __getattr__(self, name: str):
+        if not name.startswith('add'):
+            raise AttributeError(name)
+        def addRelation(*entities, **kwargs):
+            relation = _SketchRelation(name[3:], entities)
+            self._items.append(relation)
+            _record(self._sketch.parentComponent, self._recordKey)
+            self._sketch._compute()
+            return relation
+        return addRelation
+
+class GeometricConstraints(_SketchRelations):
+    def __init__(self, sketch: 'Sketch'):
+        super().__init__(sketch, 'sketchConstraints')
+
+class SketchDimensions(_SketchRelations):
+    def __init__(self, sketch: 'Sketch'):
+        super().__init__(sketch, 'sketchDimensions')
+
+class Profile(Base):
+    def __init__(self, sketch: 'Sketch', uvMin: tuple, uvMax: tuple):
+        self.parentSketch = sketch
+        self._uvMin = uvMin
+        self._uvMax = uvMax
+
+    @property
+    def boundingBox(self):
+        return BoundingBox3D(Point3D(self._uvMin[0], self._uvMin[1], 0), Point3D(self._uvMax[0], self._uvMax[1], 0))
+
+class Profiles(_ItemCollection):
+    pass
+
+class Sketch(Base):
+    def __init__(self, component: 'Component', frame: _PlaneFrame, referencePlane):
+        self.parentComponent = component
+        self.referencePlane = referencePlane
+        self.name = 'Sketch'
+        self.isVisible = True
+        self.timelineObject = None
+        self._isComputeDeferred = False
+        self._hasPendingCompute = False
+        self._frame = frame
+        self._curves: list[SketchCurve] = []
+        self._looseCurves: list[SketchCurve] = []
+        self._loops: list[list[SketchCurve]] = []
+        self.sketchCurves = SketchCurves(self)
+        self.geometricConstraints = GeometricConstraints(self)
+        self.sketchDimensions = SketchDimensions(self)
+        self.originPoint = SketchPoint(self, Point3D(0, 0, 0))
+
+    def _point(self, point) -> SketchPoint:
+        if isinstance(point, SketchPoint):
+            return point
+        return SketchPoint(self, Point3D(point.x, point.y, 0))
+
+    def _addCurve(self, collection: _ItemCollection, curve: SketchCurve, isLoose: bool = True):
+        collection._items.append(curve)
+        self._curves.append(curve)
+        if isLoose:
+            self._looseCurves.append(curve)
+        _record(self.parentComponent, 'sketchCurves')
+        self._compute()
+        return curve
+
+    def _compute(self):
+        # every edit solves the sketch unless compute is deferred, then it is solved once when resumed
+        if self._isComputeDeferred:
+            self._hasPendingCompute = True
+        else:
+            _record(self.parentComponent, 'sketchComputes')
+
+    @property
+    def isComputeDeferred(self):
+        return self._isComputeDeferred
+
+    @isComputeDeferred.setter
+    def isComputeDeferred(self, value: bool):
+        if self._isComputeDeferred and not value and self._hasPendingCompute:
+            _record(self.parentComponent, 'sketchComputes')
+        self._hasPendingCompute = False
+        self._isComputeDeferred = value
+
+    def _project(self, face: BRepFace):
+        edgePoints = [(self.modelToSketchSpace(edge.startVertex.geometry), self.modelToSketchSpace(edge.endVertex.geometry)) for edge in face._edges]
+        lines = [SketchLine(self, SketchPoint(self, start), SketchPoint(self, end)) for (start, end) in edgePoints]
+        for line in lines:
+            self._addCurve(self.sketchCurves.sketchLines, line, isLoose=False)
+        self._loops.append(lines)
+
+    @property
+    def origin(self):
+        return self._frame.toModel(Point3D(0, 0, 0))
+
+    def modelToSketchSpace(self, modelCoordinate: Point3D):
+        return self._frame.toSketch(modelCoordinate)
+
+    def sketchToModelSpace(self, sketchCoordinate: Point3D):
+        return self._frame.toModel(sketchCoordinate)
+
+    def offset(self, curves, directionPoint: Point3D, offset: float):
+        curves = _asList(curves)
+        box = _union([(curve.boundingBox.minPoint.asArray(), curve.boundingBox.maxPoint.asArray()) for curve in curves])
+        isOutside = not (box[0][0] <= directionPoint.x <= box[1][0] and box[0][1] <= directionPoint.y <= box[1][1])
+        distance = offset if isOutside else -offset
+        corners = [
+            Point3D(box[0][0] - distance, box[0][1] - distance, 0),
+            Point3D(box[1][0] + distance, box[1][1] + distance, 0),
+        ]
+        offsetLines = self.sketchCurves.sketchLines.addTwoPointRectangle(*corners)
+        return offsetLines
+
+    @property
+    def profiles(self):
+        regions = []
+        for loop in self._loops:
+            if any(curve.isConstruction for curve in loop):
+                continue
+            regions.append(loop)
+        looseCurves = [curve for curve in self._looseCurves if not curve.isConstruction]
+        if len(looseCurves) > 0:
+            regions.append(looseCurves)
+        profiles = []
+        for region in regions:
+            box = _union([(curve.boundingBox.minPoint.asArray(), curve.boundingBox.maxPoint.asArray()) for curve in region])
+            profiles.append(Profile(self, box[0][0:2], box[1][0:2]))
+        return Profiles(profiles)
+
+    def deleteMe(self):
+        self.parentComponent.sketches._items.remove(self)
+        return True
+
+class Sketches(_ItemCollection):
+    def __init__(self, component: 'Component'):
+        super().__init__()
+        self._component = component
+
+    def add(self, planarEntity, occurrenceForCreation = None):
+        sketch = Sketch(self._component, _frameOf(planarEntity), planarEntity)
+        sketch.timelineObject = _timelineObject(self._component)
+        self._items.append(sketch)
+        _record(self._component, 'sketches')
+        if isinstance(planarEntity, BRepFace):
+            sketch._project(planarEntity)
+        return sketch
+
+# ---------------------------------------------------------------------------
+# features
+# ---------------------------------------------------------------------------
+
+class Feature(Base):
+    def __init__(self, component: 'Component', bodies: list[BRepBody], kind: str):
+        self.parentComponent = component
+        self.name = kind
+        self.isSuppressed = False
+        self._bodies = bodies
+        self.timelineObject = _timelineObject(component)
+
+    @property
+    def bodies(self):
+        return BRepBodies(self._bodies)
+
+    @property
+    def faces(self):
+        return BRepFaces([face for body in self._bodies for face in body.faces])
+
+    def deleteMe(self):
+        return True
+
+class ExtrudeFeature(Feature):
+    def __init__(self, component: 'Component', bodies: list[BRepBody], endFaces: list[BRepFace], startFaces: list[BRepFace]):
+        super().__init__(component, bodies, 'Extrude')
+        self._endFaces = endFaces
+        self._startFaces = startFaces
+
+    @property
+    def endFaces(self):
+        return BRepFaces(self._endFaces)
+
+    @property
+    def startFaces(self):
+        return BRepFaces(self._startFaces)
+
+    @property
+    def sideFaces(self):
+        capFaces = self._endFaces + self._startFaces
+        return BRepFaces([face for face in self.faces if not face in capFaces])
+
+class _Features(Base):
+    kind = 'feature'
+
+    def __init__(self, component: 'Component'):
+        self._component = component
+        self._items: list[Feature] = []
+
+    @property
+    def count(self):
+        return len(self._items)
+
+    def item(self, index: int):
+        return self._items[index]
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def _register(self, feature: Feature):
+        self._items.append(feature)
+        self._component.features._all.append(feature)
+        _record(self._component, 'features')
+        _record(self._component, 'features.{}'.format(self.kind))
+        return feature
+
+class DistanceExtentDefinition(Base):
+    def __init__(self, distance: ValueInput):
+        self.distance = distance
+
+    @staticmethod
+    def create(distance: ValueInput):
+        return DistanceExtentDefinition(distance)
+
+def _angle(value: ValueInput):
+    return value.realValue if value is not None else 0.0
+
+class ExtrudeFeatureInput(Base):
+    def __init__(self, profile, operation: int):
+        self.profile = profile
+        self.operation = operation
+        self.participantBodies = []
+        self.isSolid = True
+        self.creationOccurrence = None
+        self._wRange = (0.0, 0.0)
+        # taper of the side ending at each end of _wRange, positive angles taper outward
+        self._taperAngles = (0.0, 0.0)
+        self.taperAngle = None
+
+    def setOneSideExtent(self, extent: DistanceExtentDefinition, direction: int, taperAngle: ValueInput = None):
+        distance = extent.distance.realValue
+        self._wRange = (0.0, -distance if direction == ExtentDirections.NegativeExtentDirection else distance)
+        self._taperAngles = (0.0, _angle(taperAngle))
+        self.taperAngle = taperAngle
+        return True
+
+    def setTwoSidesExtent(self, sideOneExtent: DistanceExtentDefinition, sideTwoExtent: DistanceExtentDefinition, sideOneTaperAngle: ValueInput = None, sideTwoTaperAngle: ValueInput = None):
+        self._wRange = (-sideTwoExtent.distance.realValue, sideOneExtent.distance.realValue)
+        self._taperAngles = (_angle(sideTwoTaperAngle), _angle(sideOneTaperAngle))
+        self.taperAngle = sideOneTaperAngle
+        return True
+
+    def setSymmetricExtent(self, distance: ValueInput, isFullLength: bool, taperAngle: ValueInput = None):
+        halfDistance = distance.realValue / 2 if isFullLength else distance.realValue
+        self._wRange = (-halfDistance, halfDistance)
+        self._taperAngles = (_angle(taperAngle), _angle(taperAngle))
+        self.taperAngle = taperAngle
+        return True
+
+    def setDistanceExtent(self, isSymmetric: bool, distance: ValueInput):
+        if isSymmetric:
+            return self.setSymmetricExtent(distance, True)
+        self._wRange = (0.0, distance.realValue)
+        return True
+
+class ExtrudeFeatures(_Features):
+    kind = 'extrude'
+
+    def createInput(self, profile, operation: int):
+        return ExtrudeFeatureInput(profile, operation)
+
+    def addSimple(self, profile, distance: ValueInput, operation: int):
+        input = self.createInput(profile, operation)
+        input.setDistanceExtent(False, distance)
+        return self.add(input)
+
+    def add(self, input: ExtrudeFeatureInput):
+        component = self._component
+        boxes = []
+        frame: _PlaneFrame = None
+        for profile in _asList(input.profile):
+            frame = _frameOf(profile)
+            if isinstance(profile, BRepFace):
+                [u, v] = _IN_PLANE_AXES[frame.axis]
+                uvMin = (profile._box[0][u], profile._box[0][v])
+                uvMax = (profile._box[1][u], profile._box[1][v])
+            else:
+                [uvMin, uvMax] = [profile._uvMin, profile._uvMax]
+            # an outward taper widens the profile towards the end of its side
+            growth = max([0.0] + [math.tan(angle) * abs(w) for (angle, w) in zip(input._taperAngles, input._wRange)])
+            uvMin = (uvMin[0] - growth, uvMin[1] - growth)
+            uvMax = (uvMax[0] + growth, uvMax[1] + growth)
+            boxes.append(frame.boxFromRegion(uvMin, uvMax, *input._wRange))
+
+        endW = input._wRange[1]
+        endSide = 1 if frame.sign * endW >= 0 else -1
+        participants = list(input.participantBodies)
+        bodies: list[BRepBody] = []
+
+        if input.operation == FeatureOperations.NewBodyFeatureOperation:
+            for box in _mergeOverlapping(boxes):
+                bodies.append(component._addBody(box))
+        elif input.operation == FeatureOperations.JoinFeatureOperation:
+            profiles = _asList(input.profile)
+            target = participants[0] if len(participants) > 0 else (profiles[0].body if isinstance(profiles[0], BRepFace) else None)
+            if target is None:
+                target = next((body for body in component._bodies if any(_intersection(body._box, box) for box in boxes)), None)
+            if target is None:
+                bodies = [component._addBody(box) for box in boxes]
+            else:
+                target._setBox(_union([target._box] + boxes))
+                bodies.append(target)
+        else:
+            targets = participants if len(participants) > 0 else [body for body in component._bodies if any(_intersection(body._box, box) for box in boxes)]
+            _record(component, 'extrudeParticipants', len(targets))
+            for target in targets:
+                if input.operation == FeatureOperations.IntersectFeatureOperation:
+                    intersection = _intersection(target._box, _union(boxes))
+                    if intersection is not None:
+                        target._setBox(intersection)
+                else:
+                    target._touch()
+                bodies.append(target)
+
+        endFaces = []
+        startFaces = []
+        if input.operation in (FeatureOperations.NewBodyFeatureOperation, FeatureOperations.JoinFeatureOperation):
+            endFaces = [body._faceAt(frame.axis, endSide) for body in bodies]
+            startFaces = [body._faceAt(frame.axis, -endSide) for body in bodies]
+        return self._register(ExtrudeFeature(component, bodies, endFaces, startFaces))
+
+class _EdgeSetInputs(Base):
+    def __init__(self):
+        self.edges = []
+
+    @property
+    def count(self):
+        return len(self.edges)
+
+    def _addEdges(self, edges, *args):
+        self.edges = self.edges + _asList(edges)
+        return Base()
+
+    addConstantRadiusEdgeSet = _addEdges
+    addVariableRadiusEdgeSet = _addEdges
+    addChordLengthEdgeSet = _addEdges
+    addEqualDistanceChamferEdgeSet = _addEdges
+    addTwoDistancesChamferEdgeSet = _addEdges
+    addDistanceAndAngleChamferEdgeSet = _addEdges
+
+class FilletFeatureInput(Base):
+    def __init__(self):
+        self.edgeSetInputs = _EdgeSetInputs()
+        self.isRollingBallCorner = True
+        self.isTangentChain = True
+
+class FilletFeatures(_Features):
+    kind = 'fillet'
+
+    def createInput(self):
+        return FilletFeatureInput()
+
+    def add(self, input: FilletFeatureInput):
+        return self._register(Feature(self._component, _uniqueBodies(input.edgeSetInputs.edges), 'Fillet'))
+
+class ChamferFeatureInput(Base):
+    def __init__(self, edges = None):
+        self.chamferEdgeSets = _EdgeSetInputs()
+        if edges is not None:
+            self.chamferEdgeSets._addEdges(edges)
+
+    def setToEqualDistance(self, distance: ValueInput):
+        return True
+
+class ChamferFeatures(_Features):
+    kind = 'chamfer'
+
+    def createInput(self, edges, isTangentChain: bool):
+        return ChamferFeatureInput(edges)
+
+    def createInput2(self):
+        return ChamferFeatureInput()
+
+    def add(self, input: ChamferFeatureInput):
+        return self._register(Feature(self._component, _uniqueBodies(input.chamferEdgeSets.edges), 'Chamfer'))
+
+def _uniqueBodies(entities) -> list[BRepBody]:
+    bodies = []
+    for entity in entities:
+        body = entity if isinstance(entity, BRepBody) else entity.body
+        if not body in bodies:
+            bodies.append(body)
+    return bodies
+
+class CombineFeatureInput(Base):
+    def __init__(self, targetBody: BRepBody, toolBodies: ObjectCollection):
+        self.targetBody = targetBody
+        self.toolBodies = toolBodies
+        self.operation = FeatureOperations.JoinFeatureOperation
+        self.isKeepToolBodies = False
+        self.isNewComponent = False
+
+class CombineFeatures(_Features):
+    kind = 'combine'
+
+    def createInput(self, targetBody: BRepBody, toolBodies: ObjectCollection):
+        return CombineFeatureInput(targetBody, toolBodies)
+
+    def add(self, input: CombineFeatureInput):
+        target = input.targetBody
+        tools = [tool for tool in _asList(input.toolBodies) if tool is not target]
+        if input.operation == FeatureOperations.JoinFeatureOperation:
+            target._setBox(_union([target._box] + [tool._box for tool in tools]))
+        elif input.operation == FeatureOperations.IntersectFeatureOperation and len(tools) > 0:
+            intersection = _intersection(target._box, _union([tool._box for tool in tools]))
+            if intersection is not None:
+                target._setBox(intersection)
+        else:
+            target._touch()
+        if not input.isKeepToolBodies:
+            for tool in tools:
+                self._component._removeBody(tool)
+        _record(self._component, 'combineTools', len(tools))
+        return self._register(Feature(self._component, [target], 'Combine'))
+
+def _direction(entity) -> Vector3D:
+    if isinstance(entity, ConstructionAxis):
+        return entity._direction.copy()
+    if isinstance(entity, BRepEdge):
+        direction = entity.startVertex.geometry.vectorTo(entity.endVertex.geometry)
+        direction.normalize()
+        return direction
+    raise ValueError('Unsupported direction entity {}'.format(type(entity).__name__))
+
+class RectangularPatternFeatureInput(Base):
+    def __init__(self, inputEntities, directionOneEntity, quantityOne: ValueInput, distanceOne: ValueInput, patternDistanceType: int):
+        self.inputEntities = inputEntities
+        self.directionOneEntity = directionOneEntity
+        self.quantityOne = quantityOne
+        self.distanceOne = distanceOne
+        self.patternDistanceType = patternDistanceType
+        self.directionTwoEntity = None
+        self.quantityTwo = ValueInput.createByReal(1)
+        self.distanceTwo = ValueInput.createByReal(0)
+        self.isSymmetricInDirectionOne = False
+        self.isSymmetricInDirectionTwo = False
+
+class RectangularPatternFeatures(_Features):
+    kind = 'rectangularPattern'
+
+    def createInput(self, inputEntities, directionOneEntity, quantityOne: ValueInput, distanceOne: ValueInput, patternDistanceType: int):
+        return RectangularPatternFeatureInput(inputEntities, directionOneEntity, quantityOne, distanceOne, patternDistanceType)
+
+    def add(self, input: RectangularPatternFeatureInput):
+        directionOne = _direction(input.directionOneEntity)
+        directionTwo = _direction(input.directionTwoEntity) if input.directionTwoEntity is not None else Vector3D(0, 0, 0)
+        copies = []
+        for body in _asList(input.inputEntities):
+            for i in range(int(round(input.quantityOne.realValue))):
+                for j in range(int(round(input.quantityTwo.realValue))):
+                    if i == 0 and j == 0:
+                        continue
+                    offset = [
+                        directionOne.asArray()[axis] * input.distanceOne.realValue * i + directionTwo.asArray()[axis] * input.distanceTwo.realValue * j
+                        for axis in range(3)
+                    ]
+                    copies.append(self._component._addBody(_translateBox(body._box, offset), body.name))
+        return self._register(Feature(self._component, copies, 'RectangularPattern'))
+
+class CircularPatternFeatureInput(Base):
+    def __init__(self, inputEntities, axis):
+        self.inputEntities = inputEntities
+        self.axis = axis
+        self.quantity = ValueInput.createByReal(3)
+        self.totalAngle = ValueInput.createByString('360 deg')
+        self.isSymmetric = False
+
+class CircularPatternFeatures(_Features):
+    kind = 'circularPattern'
+
+    def createInput(self, inputEntities, axis):
+        return CircularPatternFeatureInput(inputEntities, axis)
+
+    def add(self, input: CircularPatternFeatureInput):
+        quantity = int(round(input.quantity.realValue))
+        totalAngle = input.totalAngle.realValue
+        step = totalAngle / quantity if math.isclose(totalAngle, math.pi * 2) else totalAngle / max(1, quantity - 1)
+        copies = []
+        for body in _asList(input.inputEntities):
+            for index in range(1, quantity):
+                rotation = Matrix3D.create()
+                rotation.setToRotation(step * index, input.axis._direction, input.axis._origin)
+                copies.append(self._component._addBody(_transformBox(body._box, rotation), body.name))
+        return self._register(Feature(self._component, copies, 'CircularPattern'))
+
+class MoveFeatureInput(Base):
+    def __init__(self, inputEntities, transform: Matrix3D = None):
+        self.inputEntities = inputEntities
+        self._transform = transform if transform is not None else Matrix3D.create()
+
+    def defineAsFreeMove(self, transform: Matrix3D):
+        self._transform = transform
+        return True
+
+    def defineAsTranslate(self, vector: Vector3D):
+        self._transform = Matrix3D.create()
+        self._transform.translation = vector
+        return True
+
+class MoveFeatures(_Features):
+    kind = 'move'
+
+    def createInput(self, inputEntities, transform: Matrix3D):
+        return MoveFeatureInput(inputEntities, transform)
+
+    def createInput2(self, inputEntities):
+        return MoveFeatureInput(inputEntities)
+
+    def add(self, input: MoveFeatureInput):
+        bodies = _asList(input.inputEntities)
+        for body in bodies:
+            body._setBox(_transformBox(body._box, input._transform))
+        return self._register(Feature(self._component, bodies, 'Move'))
+
+class MirrorFeatureInput(Base):
+    def __init__(self, inputEntities, mirrorPlane):
+        self.inputEntities = inputEntities
+        self.mirrorPlane = mirrorPlane
+        self.isCombine = False
+
+class MirrorFeatures(_Features):
+    kind = 'mirror'
+
+    def createInput(self, inputEntities, mirrorPlane):
+        return MirrorFeatureInput(inputEntities, mirrorPlane)
+
+    def add(self, input: MirrorFeatureInput):
+        frame = _frameOf(input.mirrorPlane)
+        copies = []
+        for body in _asList(input.inputEntities):
+            boxMin = list(body._box[0])
+            boxMax = list(body._box[1])
+            [boxMin[frame.axis], boxMax[frame.axis]] = [2 * frame.coordinate - body._box[1][frame.axis], 2 * frame.coordinate - body._box[0][frame.axis]]
+            copies.append(self._component._addBody((tuple(boxMin), tuple(boxMax)), body.name))
+        return self._register(Feature(self._component, copies, 'Mirror'))
+
+class ShellFeatureInput(Base):
+    def __init__(self, inputEntities, isTangentChain: bool):
+        self.inputEntities = inputEntities
+        self.isTangentChain = isTangentChain
+        self.insideThickness = ValueInput.createByReal(0)
+        self.outsideThickness = ValueInput.createByReal(0)
+
+class ShellFeatures(_Features):
+    kind = 'shell'
+
+    def createInput(self, inputEntities, isTangentChain: bool = True):
+        return ShellFeatureInput(inputEntities, isTangentChain)
+
+    def add(self, input: ShellFeatureInput):
+        bodies = _uniqueBodies(_asList(input.inputEntities))
+        for body in bodies:
+            body._touch()
+        return self._register(Feature(self._component, bodies, 'Shell'))
+
+class SplitBodyFeatureInput(Base):
+    def __init__(self, splitBodies, splittingTool, isSplittingToolExtended: bool):
+        self.splitBodies = splitBodies
+        self.splittingTool = splittingTool
+        self.isSplittingToolExtended = isSplittingToolExtended
+
+class SplitBodyFeatures(_Features):
+    kind = 'splitBody'
+
+    def createInput(self, splitBodies, splittingTool, isSplittingToolExtended: bool):
+        return SplitBodyFeatureInput(splitBodies, splittingTool, isSplittingToolExtended)
+
+    def add(self, input: SplitBodyFeatureInput):
+        frame = _frameOf(input.splittingTool)
+        bodies = []
+        for body in _asList(input.splitBodies):
+            bodies.append(body)
+            if body._box[0][frame.axis] < frame.coordinate < body._box[1][frame.axis]:
+                upperMin = list(body._box[0])
+                upperMin[frame.axis] = frame.coordinate
+                lowerMax = list(body._box[1])
+                lowerMax[frame.axis] = frame.coordinate
+                bodies.append(self._component._addBody((tuple(upperMin), body._box[1]), body.name))
+                body._setBox((body._box[0], tuple(lowerMax)))
+        return self._register(Feature(self._component, bodies, 'SplitBody'))
+
+class RemoveFeatures(_Features):
+    kind = 'remove'
+
+    def add(self, itemToRemove):
+        self._component._removeBody(itemToRemove)
+        return self._register(Feature(self._component, [], 'Remove'))
+
+class BaseFeature(Feature):
+    def __init__(self, component: 'Component'):
+        super().__init__(component, [], 'BaseFeature')
+        self.isEditing = False
+
+    def startEdit(self):
+        self.isEditing = True
+        return True
+
+    def finishEdit(self):
+        self.isEditing = False
+        return True
+
+class BaseFeatures(_Features):
+    kind = 'base'
+
+    def add(self):
+        return self._register(BaseFeature(self._component))
+
+class TemporaryBRepManager(Base):
+    _instance = None
+
+    @staticmethod
+    def get():
+        if TemporaryBRepManager._instance is None:
+            TemporaryBRepManager._instance = TemporaryBRepManager()
+        return TemporaryBRepManager._instance
+
+    def copy(self, body: BRepBody):
+        # transient bodies don't belong to a component and are not recorded
+        return BRepBody(None, body._box, body.name)
+
+    def createFromFile(self, filename: str):
+        with open(filename) as importFile:
+            storedBodies = json.load(importFile)
+        return BRepBodies([BRepBody(None, tuple(tuple(point) for point in storedBody['box']), storedBody['name']) for storedBody in storedBodies])
+
+    def transform(self, body: BRepBody, transform: Matrix3D):
+        body._setBox(_transformBox(body._box, transform))
+        return True
+
+    def createBox(self, box):
+        center = box.centerPoint.asArray()
+        size = [box.length, box.width, box.height]
+        return BRepBody(None, (
+            tuple(center[i] - size[i] / 2 for i in range(3)),
+            tuple(center[i] + size[i] / 2 for i in range(3)),
+        ))
+
+    def createCylinderOrCone(self, pointOne: Point3D, pointOneRadius: float, pointTwo: Point3D, pointTwoRadius: float):
+        radius = max(pointOneRadius, pointTwoRadius)
+        axis = [pointTwo.asArray()[i] - pointOne.asArray()[i] for i in range(3)]
+        axisLength = math.sqrt(sum(value ** 2 for value in axis)) or 1.0
+        extent = [radius * math.sqrt(max(0.0, 1 - (value / axisLength) ** 2)) for value in axis]
+        boxes = [(tuple(point.asArray()[i] - extent[i] for i in range(3)), tuple(point.asArray()[i] + extent[i] for i in range(3))) for point in [pointOne, pointTwo]]
+        return BRepBody(None, _union(boxes))
+
+    def booleanOperation(self, targetBody: BRepBody, toolBody: BRepBody, booleanType: int):
+        # difference keeps the target box, cutouts don't change the bounding box of a body
+        if booleanType == BooleanTypes.UnionBooleanType:
+            targetBody._setBox(_union([targetBody._box, toolBody._box]))
+        elif booleanType == BooleanTypes.IntersectionBooleanType:
+            box = _intersection(targetBody._box, toolBody._box)
+            if box is not None:
+                targetBody._setBox(box)
+        else:
+            targetBody._touch()
+        return True
+
+class _GenericFeatureInput(Base):
+    def __init__(self, *args):
+        self.arguments = args
+
+class _GenericFeatures(_Features):
+    # recorded but geometrically inert, e.g. offset/extend/thicken
+    def __init__(self, component: 'Component', kind: str):
+        super().__init__(component)
+        self.kind = kind
+
+    def createInput(self, *args):
+        return _GenericFeatureInput(*args)
+
+    def add(self, input):
+        return self._register(Feature(self._component, [], self.kind))
+
+class Features(Base):
+    def __init__(self, component: 'Component'):
+        self._component = component
+        self._all: list[Feature] = []
+        self.extrudeFeatures = ExtrudeFeatures(component)
+        self.filletFeatures = FilletFeatures(component)
+        self.chamferFeatures = ChamferFeatures(component)
+        self.combineFeatures = CombineFeatures(component)
+        self.rectangularPatternFeatures = RectangularPatternFeatures(component)
+        self.circularPatternFeatures = CircularPatternFeatures(component)
+        self.moveFeatures = MoveFeatures(component)
+        self.mirrorFeatures = MirrorFeatures(component)
+        self.shellFeatures = ShellFeatures(component)
+        self.splitBodyFeatures = SplitBodyFeatures(component)
+        self.removeFeatures = RemoveFeatures(component)
+        self.baseFeatures = BaseFeatures(component)
+
+    def __getattr__(self, name: str):
+        if not name.endswith('Features'):
+            raise AttributeError(name)
+        features = _GenericFeatures(self._component, name[:-len('Features')])
+        setattr(self, name, features)
+        return features
+
+    @property
+    def count(self):
+        return len(self._all)
+
+    def item(self, index: int):
+        return self._all[index]
+
+    def __iter__(self):
+        return iter(list(self._all))
+
+# ---------------------------------------------------------------------------
+# document structure
+# ---------------------------------------------------------------------------
+
+class Component(Base):
+    def __init__(self, design: 'Design', name: str):
+        self.parentDesign = design
+        self.name = name
+        self.id = str(nextTempId())
+        self._bodies: list[BRepBody] = []
+        self.features = Features(self)
+        self.sketches = Sketches(self)
+        self.constructionPlanes = ConstructionPlanes(self)
+        self.constructionAxes = ConstructionAxes(self)
+        self.occurrences = Occurrences(self)
+        self.xYConstructionPlane = ConstructionPlane(self, _PlaneFrame(2, 0.0, 1), 'XY')
+        self.xZConstructionPlane = ConstructionPlane(self, _PlaneFrame(1, 0.0, 1), 'XZ')
+        self.yZConstructionPlane = ConstructionPlane(self, _PlaneFrame(0, 0.0, 1), 'YZ')
+        self.xConstructionAxis = ConstructionAxis(self, Point3D(0, 0, 0), Vector3D(1, 0, 0), 'X')
+        self.yConstructionAxis = ConstructionAxis(self, Point3D(0, 0, 0), Vector3D(0, 1, 0), 'Y')
+        self.zConstructionAxis = ConstructionAxis(self, Point3D(0, 0, 0), Vector3D(0, 0, 1), 'Z')
+        self.originConstructionPoint = ConstructionPoint(Point3D(0, 0, 0))
+
+    @property
+    def bRepBodies(self):
+        return _ComponentBRepBodies(self)
+
+    def _addBody(self, box, name: str = None):
+        body = BRepBody(self, box, name if name is not None else 'Body{}'.format(len(self._bodies) + 1))
+        self._bodies.append(body)
+        _record(self, 'bodies')
+        return body
+
+    def _removeBody(self, body: BRepBody):
+        if body in self._bodies:
+            self._bodies.remove(body)
+
+class Occurrence(Base):
+    def __init__(self, component: Component, transform: Matrix3D, timelineObject: 'TimelineObject'):
+        self.component = component
+        self.transform = transform
+        self.timelineObject = timelineObject
+        self.isLightBulbOn = True
+        self.isVisible = True
+
+    @property
+    def name(self):
+        return '{}:1'.format(self.component.name)
+
+    def activate(self):
+        self.component.parentDesign.activeComponent = self.component
+        return True
+
+    def deleteMe(self):
+        self._collection._items.remove(self)
+        return True
+
+class Occurrences(_ItemCollection):
+    def __init__(self, component: Component):
+        super().__init__()
+        self._component = component
+
+    def addNewComponent(self, transform: Matrix3D):
+        design = self._component.parentDesign
+        component = Component(design, 'Component{}'.format(len(design._components) + 1))
+        design._components.append(component)
+        return self.addExistingComponent(component, transform)
+
+    def addExistingComponent(self, component: Component, transform: Matrix3D):
+        occurrence = Occurrence(component, transform, _timelineObject(self._component))
+        occurrence._collection = self
+        self._items.append(occurrence)
+        _record(self._component, 'occurrences')
+        return occurrence
+
+class TimelineObject(Base):
+    def __init__(self, index: int):
+        self.index = index
+        self.isSuppressed = False
+
+class TimelineGroup(TimelineObject):
+    def __init__(self, index: int, startIndex: int, endIndex: int):
+        super().__init__(index)
+        self.name = 'Group'
+        self.isCollapsed = True
+        self.startIndex = startIndex
+        self.endIndex = endIndex
+
+class TimelineGroups(_ItemCollection):
+    def add(self, startIndex: int, endIndex: int):
+        group = TimelineGroup(len(self._items), startIndex, endIndex)
+        self._items.append(group)
+        return group
+
+class Timeline(Base):
+    def __init__(self):
+        self.timelineGroups = TimelineGroups()
+        self._count = 0
+
+    def _append(self):
+        object = TimelineObject(self._count)
+        self._count += 1
+        return object
+
+    @property
+    def count(self):
+        return self._count
+
+    @property
+    def markerPosition(self):
+        return self._count
+
+class _ExportOptions(Base):
+    def __init__(self, geometry, filename: str, format: str):
+        self.geometry = geometry
+        self.filename = filename
+        self.format = format
+        self.meshRefinement = MeshRefinementSettings.MeshRefinementMedium
+
+class ExportManager(Base):
+    def __init__(self, design: 'Design'):
+        self._design = design
+
+    def createSTLExportOptions(self, geometry, filename: str = ''):
+        return _ExportOptions(geometry, filename, 'stl')
+
+    def createC3MFExportOptions(self, geometry, filename: str = ''):
+        return _ExportOptions(geometry, filename, '3mf')
+
+    def createSMTExportOptions(self, geometry, filename: str = ''):
+        return _ExportOptions(geometry, filename, 'smt')
+
+    def execute(self, exportOptions: _ExportOptions):
+        component = exportOptions.geometry
+        if exportOptions.format == 'smt':
+            # boxes of the bodies are enough to import them back with TemporaryBRepManager.createFromFile
+            bodies = list(component.bRepBodies) if isinstance(component, Component) else [component]
+            with open(exportOptions.filename, 'w') as exportFile:
+                json.dump([{'name': body.name, 'box': body._box} for body in bodies], exportFile)
+            self._design.recorder.record('exports')
+            return True
+        # writes bounding boxes of the exported bodies instead of a mesh
+        with open(exportOptions.filename, 'w') as exportFile:
+            exportFile.write('{} {} refinement={}\n'.format(exportOptions.format, component.name, exportOptions.meshRefinement))
+            for body in component.bRepBodies:
+                exportFile.write('{} {}\n'.format(body.name, body.boundingBox))
+        self._design.recorder.record('exports')
+        return True
+
+class Design(Base):
+    def __init__(self):
+        self.designType = DesignTypes.ParametricDesignType
+        self.recorder = Recorder()
+        self.timeline = Timeline()
+        self.exportManager = ExportManager(self)
+        self._components: list[Component] = []
+        self.rootComponent = Component(self, 'root')
+        self._components.append(self.rootComponent)
+        self.activeComponent = self.rootComponent
+
+    @property
+    def allComponents(self):
+        return _ItemCollection(self._components)
+
+    def computeAll(self):
+        return True
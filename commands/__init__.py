@@ -1,28 +1,33 @@
 # Here you define the commands that will be added to your add-in.
 
-# TODO Import the modules corresponding to the commands you created.
-# If you want to add an additional command, duplicate one of the existing directories and import it here.
-# You need to use aliases (import "entry" as "my_module") assuming you have the default module named "entry".
-from .commandCreateBin import entry as commandCreateBin
-from .commandCreateBaseplate import entry as commandCreateBaseplate
+# Only the lightweight commandInfo modules are imported when the add-in starts, the "entry" module
+# of a command is imported by LazyCommand when its button is clicked for the first time.
+# If you want to add an additional command, duplicate one of the existing directories and list it here.
+from ..lib.ui.lazyCommand import LazyCommand
+from .commandCreateBin import commandInfo as commandCreateBinInfo
+from .commandCreateBaseplate import commandInfo as commandCreateBaseplateInfo
+from .commandCreateBinBatch import commandInfo as commandCreateBinBatchInfo
 
-# TODO add imported modules to this list.
 # Fusion will automatically call the start() and stop() functions.
 commands = [
-    commandCreateBin,
-    commandCreateBaseplate,
+    LazyCommand(commandCreateBinInfo, '.commandCreateBin.entry', __name__),
+    LazyCommand(commandCreateBaseplateInfo, '.commandCreateBaseplate.entry', __name__),
+    LazyCommand(commandCreateBinBatchInfo, '.commandCreateBinBatch.entry', __name__),
 ]
 
 
-# Assumes you defined a "start" function in each of your modules.
 # The start function will be run when the add-in is started.
 def start():
     for command in commands:
         command.start()
 
 
-# Assumes you defined a "stop" function in each of your modules.
 # The stop function will be run when the add-in is stopped.
 def stop():
     for command in commands:
-        command.stop()
\ No newline at end of file
+        command.stop()
+
+
+# Indicates if any of the commands imported its entry module, and with it the generators
+def isAnyCommandLoaded():
+    return any(command.isLoaded for command in commands)
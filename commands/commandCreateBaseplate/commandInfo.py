@@ -0,0 +1,24 @@
+import os
+
+from ... import config
+
+# Command identity and button placement, kept free of generator imports so the add-in
+# can register the command without loading its entry module.
+CMD_ID = f'{config.COMPANY_NAME}_{config.ADDIN_NAME}_cmdBaseplate'
+CMD_NAME = 'Gridfinity baseplate'
+CMD_Description = 'Create gridfinity baseplate'
+
+# Specify that the command will be promoted to the panel.
+IS_PROMOTED = True
+
+# This is done by specifying the workspace, the tab, and the panel, and the 
+# command it will be inserted beside. Not providing the command to position it
+# will insert it at the end.
+WORKSPACE_ID = 'FusionSolidEnvironment'
+PANEL_ID = 'SolidCreatePanel'
+COMMAND_BESIDE_ID = 'ScriptsManagerCommand'
+
+# Resource location for command icons, here we assume a sub folder in this directory named "resources".
+ICON_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources', '')
+
+CONFIG_FOLDER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'commandConfig')
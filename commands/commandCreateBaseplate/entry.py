@@ -9,36 +9,23 @@ from ... import config
 from ...lib.gridfinityUtils.const import DIMENSION_DEFAULT_WIDTH_UNIT
 from ...lib.gridfinityUtils.baseplateGenerator import createGridfinityBaseplate
 from ...lib.gridfinityUtils.baseplateGeneratorInput import BaseplateGeneratorInput
+from ...lib.gridfinityUtils.baseplatePreviewGenerator import createGridfinityBaseplatePreview
+from ...lib.gridfinityUtils.baseplateTilePlanner import planBaseplateTiles, BaseplateTilingError
+from ...lib.gridfinityUtils.generatorInputHash import generatorInputHash
+from ...lib.gridfinityUtils import meshExporter, resultCache
 from ...lib.gridfinityUtils import const
 from .inputState import InputState
 from ...lib.ui.commandUiState import CommandUiState
+from ...lib.ui.previewScheduler import PreviewScheduler
 from ...lib.ui.unsupportedDesignTypeException import UnsupportedDesignTypeException
+from .commandInfo import CMD_NAME, CONFIG_FOLDER_PATH
 
 app = adsk.core.Application.get()
 ui = app.userInterface
 
 
-# The command identity information. ***
-CMD_ID = f'{config.COMPANY_NAME}_{config.ADDIN_NAME}_cmdBaseplate'
-CMD_NAME = 'Gridfinity baseplate'
-CMD_Description = 'Create gridfinity baseplate'
-
 uiState = CommandUiState(CMD_NAME)
-# Specify that the command will be promoted to the panel.
-IS_PROMOTED = True
-
-# TODO *** Define the location where the command button will be created. ***
-# This is done by specifying the workspace, the tab, and the panel, and the 
-# command it will be inserted beside. Not providing the command to position it
-# will insert it at the end.
-WORKSPACE_ID = 'FusionSolidEnvironment'
-PANEL_ID = 'SolidCreatePanel'
-COMMAND_BESIDE_ID = 'ScriptsManagerCommand'
-
-# Resource location for command icons, here we assume a sub folder in this directory named "resources".
-ICON_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources', '')
-
-CONFIG_FOLDER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'commandConfig')
+previewScheduler = PreviewScheduler(CMD_NAME, config.PREVIEW_QUIET_PERIOD)
 UI_INPUT_DEFAULTS_CONFIG_PATH = os.path.join(CONFIG_FOLDER_PATH, "ui_input_defaults.json")
 
 # Local list of event handlers used to maintain a reference so
@@ -54,6 +41,7 @@ MAGNET_SOCKET_GROUP = 'magnet_cutout_group'
 SCREW_HOLE_GROUP = 'screw_hole_group'
 SIDE_PADDING_GROUP = 'side_padding_group'
 ADVANCED_PLATE_SIZE_GROUP = 'advanced_plate_size_group'
+PRINT_BED_TILING_GROUP = 'print_bed_tiling_group'
 INPUT_CHANGES_GROUP = 'input_changes_group'
 PREVIEW_GROUP = 'preview_group'
 # Input ids
@@ -87,11 +75,27 @@ BASEPLATE_BIN_Z_CLEARANCE_INPUT = 'bin_z_clearance'
 BASEPLATE_HAS_CONNECTION_HOLE_INPUT = 'has_connection_hole'
 BASEPLATE_CONNECTION_HOLE_DIAMETER_INPUT = 'connection_hole_diameter'
 
+BASEPLATE_WITH_TILING_INPUT = 'with_print_bed_tiling'
+BASEPLATE_DRAWER_WIDTH_INPUT = 'drawer_width'
+BASEPLATE_DRAWER_LENGTH_INPUT = 'drawer_length'
+BASEPLATE_PRINT_BED_WIDTH_INPUT = 'print_bed_width'
+BASEPLATE_PRINT_BED_LENGTH_INPUT = 'print_bed_length'
+
 INPUT_CHANGES_SAVE_DEFAULTS = 'input_changes_buttons_save_new_defaults'
 INPUT_CHANGES_RESET_TO_DEFAULTS = 'input_changes_button_reset_to_defaults'
 INPUT_CHANGES_RESET_TO_FACTORY = 'input_changes_button_factory_reset'
 
 SHOW_PREVIEW_INPUT = 'show_preview'
+SHOW_DETAILED_PREVIEW_INPUT = 'show_detailed_preview'
+PREVIEW_FIDELITY_INPUT = 'preview_fidelity'
+PREVIEW_FIDELITY_DRAFT = 'Draft'
+PREVIEW_FIDELITY_STANDARD = 'Standard'
+PREVIEW_FIDELITY_FULL = 'Full'
+PREVIEW_FIDELITY_LEVELS = {
+    PREVIEW_FIDELITY_DRAFT: const.GENERATOR_FIDELITY_DRAFT,
+    PREVIEW_FIDELITY_STANDARD: const.GENERATOR_FIDELITY_STANDARD,
+    PREVIEW_FIDELITY_FULL: const.GENERATOR_FIDELITY_FULL,
+}
 
 INFO_TEXT = ("<b>Help:</b> Info for inputs can be found "
              "<a href=\"https://github.com/Le0Michine/FusionGridfinityGenerator/wiki/Baseplate-generator-options\">"
@@ -107,61 +111,10 @@ def showErrorInMessageBox(text = "An unknown error occurred, please validate you
     if ui:
         ui.messageBox(getErrorMessage(text), f"{CMD_NAME} Error")
 
-# Executed when add-in is run.
+# Executed when the command is run for the first time, its button is added by the commands package.
 def start():
     futil.log(f'{CMD_NAME} Command Start Event')
-    try:
-        addinConfig = configUtils.readConfig(CONFIG_FOLDER_PATH)
-
-        # Create a command Definition.
-        cmd_def = ui.commandDefinitions.itemById(CMD_ID)
-        if not cmd_def:
-            cmd_def = ui.commandDefinitions.addButtonDefinition(CMD_ID, CMD_NAME, CMD_Description, ICON_FOLDER)
-
-            # Define an event handler for the command created event. It will be called when the button is clicked.
-            futil.add_handler(cmd_def.commandCreated, command_created)
-
-            # ******** Add a button into the UI so the user can run the command. ********
-            # Get the target workspace the button will be created in.
-            workspace = ui.workspaces.itemById(WORKSPACE_ID)
-
-            # Get the panel the button will be created in.
-            panel = workspace.toolbarPanels.itemById(PANEL_ID)
-
-            # Create the button command control in the UI after the specified existing command.
-            control = panel.controls.addCommand(cmd_def, COMMAND_BESIDE_ID, False)
-
-            # Specify if the command is promoted to the main toolbar. 
-            control.isPromoted = addinConfig['UI'].getboolean('is_promoted')
-
-        initUiState()
-        ui.statusMessage = ""
-    except Exception as err:
-        futil.log(f'{CMD_NAME} Error occurred at the start, {err}, {getErrorMessage()}')
-        ui.statusMessage = f"{CMD_NAME} failed to initialize"
-        showErrorInMessageBox(f"{CMD_NAME} Critical error occurred at the start, the command will be unavailable, if the issue persists use <a href=\"https://github.com/Le0Michine/FusionGridfinityGenerator/issues/new\">this link</a> to report it")
-
-
-# Executed when add-in is stopped.
-def stop():
-    futil.log(f'{CMD_NAME} Command Stop Event')
-    # Get the various UI elements for this command
-    workspace = ui.workspaces.itemById(WORKSPACE_ID)
-    panel = workspace.toolbarPanels.itemById(PANEL_ID)
-    command_control: adsk.core.CommandControl = panel.controls.itemById(CMD_ID)
-    command_definition = ui.commandDefinitions.itemById(CMD_ID)
-
-    addinConfig = configUtils.readConfig(CONFIG_FOLDER_PATH)
-    addinConfig['UI']['is_promoted'] = 'yes' if command_control.isPromoted else 'no'
-    configUtils.writeConfig(addinConfig, CONFIG_FOLDER_PATH)
-
-    # Delete the button command control
-    if command_control:
-        command_control.deleteMe()
-
-    # Delete the command definition
-    if command_definition:
-        command_definition.deleteMe()
+    initUiState()
 
 
 # Function that is called when a user clicks the corresponding button in the UI.
@@ -304,7 +257,26 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
     connectionHoleSizeInput.maximumValue = 0.5
     connectionHoleSizeInput.isMaximumInclusive = True
     uiState.registerCommandInput(connectionHoleSizeInput)
-    
+
+    printBedTilingGroup = inputs.addGroupCommandInput(PRINT_BED_TILING_GROUP, 'Print bed tiling')
+    printBedTilingGroup.isExpanded = uiState.getState(PRINT_BED_TILING_GROUP)
+    uiState.registerCommandInput(printBedTilingGroup)
+    generateTilesInput = printBedTilingGroup.children.addBoolValueInput(BASEPLATE_WITH_TILING_INPUT, 'Split drawer into tiles', True, '', uiState.getState(BASEPLATE_WITH_TILING_INPUT))
+    generateTilesInput.tooltip = "Fills the drawer with baseplate tiles fitting the print bed, plate size and side padding are derived from the drawer size"
+    uiState.registerCommandInput(generateTilesInput)
+    drawerWidthInput = printBedTilingGroup.children.addValueInput(BASEPLATE_DRAWER_WIDTH_INPUT, 'Drawer width, X', defaultLengthUnits, adsk.core.ValueInput.createByReal(uiState.getState(BASEPLATE_DRAWER_WIDTH_INPUT)))
+    drawerWidthInput.tooltip = "Must be equal or greater than base width unit"
+    uiState.registerCommandInput(drawerWidthInput)
+    drawerLengthInput = printBedTilingGroup.children.addValueInput(BASEPLATE_DRAWER_LENGTH_INPUT, 'Drawer length, Y', defaultLengthUnits, adsk.core.ValueInput.createByReal(uiState.getState(BASEPLATE_DRAWER_LENGTH_INPUT)))
+    drawerLengthInput.tooltip = "Must be equal or greater than base length unit"
+    uiState.registerCommandInput(drawerLengthInput)
+    printBedWidthInput = printBedTilingGroup.children.addValueInput(BASEPLATE_PRINT_BED_WIDTH_INPUT, 'Print bed width, X', defaultLengthUnits, adsk.core.ValueInput.createByReal(uiState.getState(BASEPLATE_PRINT_BED_WIDTH_INPUT)))
+    printBedWidthInput.tooltip = "Must be equal or greater than base width unit"
+    uiState.registerCommandInput(printBedWidthInput)
+    printBedLengthInput = printBedTilingGroup.children.addValueInput(BASEPLATE_PRINT_BED_LENGTH_INPUT, 'Print bed length, Y', defaultLengthUnits, adsk.core.ValueInput.createByReal(uiState.getState(BASEPLATE_PRINT_BED_LENGTH_INPUT)))
+    printBedLengthInput.tooltip = "Must be equal or greater than base length unit"
+    uiState.registerCommandInput(printBedLengthInput)
+
     inputChangesGroup = inputs.addGroupCommandInput(INPUT_CHANGES_GROUP, 'Inputs')
     inputChangesGroup.isExpanded = uiState.getState(INPUT_CHANGES_GROUP)
     uiState.registerCommandInput(inputChangesGroup)
@@ -318,14 +290,24 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
     previewGroup = inputs.addGroupCommandInput(PREVIEW_GROUP, 'Preview')
     uiState.registerCommandInput(previewGroup)
     previewGroup.isExpanded = uiState.getState(PREVIEW_GROUP)
-    showLivePreview = previewGroup.children.addBoolValueInput(SHOW_PREVIEW_INPUT, 'Show preview (slow)', True, '', uiState.getState(SHOW_PREVIEW_INPUT))
+    showLivePreview = previewGroup.children.addBoolValueInput(SHOW_PREVIEW_INPUT, 'Show preview', True, '', uiState.getState(SHOW_PREVIEW_INPUT))
     uiState.registerCommandInput(showLivePreview)
+    showDetailedPreview = previewGroup.children.addBoolValueInput(SHOW_DETAILED_PREVIEW_INPUT, 'Detailed preview (slow)', True, '', uiState.getState(SHOW_DETAILED_PREVIEW_INPUT))
+    showDetailedPreview.tooltip = 'Build the preview with the full timeline instead of a simplified shape'
+    uiState.registerCommandInput(showDetailedPreview)
+    previewFidelityDropdown = previewGroup.children.addDropDownCommandInput(PREVIEW_FIDELITY_INPUT, 'Detailed preview fidelity', adsk.core.DropDownStyles.LabeledIconDropDownStyle)
+    previewFidelityDropdownInitialState = uiState.getState(PREVIEW_FIDELITY_INPUT)
+    for fidelityName in PREVIEW_FIDELITY_LEVELS:
+        previewFidelityDropdown.listItems.add(fidelityName, previewFidelityDropdownInitialState == fidelityName)
+    previewFidelityDropdown.tooltip = 'Draft skips fillets and chamfers. The result is always generated with full fidelity'
+    uiState.registerCommandInput(previewFidelityDropdown)
 
     futil.add_handler(args.command.execute, command_execute, local_handlers=local_handlers)
     futil.add_handler(args.command.inputChanged, command_input_changed, local_handlers=local_handlers)
     futil.add_handler(args.command.executePreview, command_preview, local_handlers=local_handlers)
     futil.add_handler(args.command.validateInputs, command_validate_input, local_handlers=local_handlers)
     futil.add_handler(args.command.destroy, command_destroy, local_handlers=local_handlers)
+    previewScheduler.start(args.command, uiState.toHash(ignoreKeys=[SHOW_PREVIEW_INPUT]))
 
 
 # This event handler is called when the user clicks the OK button in the command dialog or 
@@ -333,6 +315,7 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
 def command_execute(args: adsk.core.CommandEventArgs):
     # General logging for debug.
     futil.log(f'{CMD_NAME} Command Execute Event')
+    meshExporter.clearMeshExportQueue()
     generateBaseplate(args)
 
 
@@ -343,9 +326,16 @@ def command_preview(args: adsk.core.CommandEventArgs):
     # Get a reference to command's inputs.
     inputs = args.command.commandInputs
     showPreview: adsk.core.BoolValueCommandInput = inputs.itemById(SHOW_PREVIEW_INPUT)
+    showDetailedPreview: adsk.core.BoolValueCommandInput = inputs.itemById(SHOW_DETAILED_PREVIEW_INPUT)
     if showPreview.value:
+        design = adsk.fusion.Design.cast(app.activeProduct)
+        inputsHash = uiState.toHash(ignoreKeys=[SHOW_PREVIEW_INPUT])
+        if not previewScheduler.shouldGeneratePreview(inputsHash, design.rootComponent):
+            return
         if INPUTS_VALID:
-            generateBaseplate(args)
+            generateBaseplate(args, isPreview=not showDetailedPreview.value, fidelity=PREVIEW_FIDELITY_LEVELS[uiState.getState(PREVIEW_FIDELITY_INPUT)])
+            if not args.executeFailed:
+                previewScheduler.storePreviewResult(inputsHash, design.rootComponent.occurrences.item(design.rootComponent.occurrences.count - 1))
         else:
             args.executeFailed = True
             args.executeFailedMessage = "Some inputs are invalid, unable to generate preview"
@@ -377,6 +367,7 @@ def command_input_changed(args: adsk.core.InputChangedEventArgs):
 
     # General logging for debug.
     futil.log(f'{CMD_NAME} Input Changed Event fired from a change to {changed_input.id}')
+    previewScheduler.inputChanged(uiState.toHash(ignoreKeys=[SHOW_PREVIEW_INPUT]))
 
 
 # This event handler is called when the user interacts with any of the inputs in the dialog
@@ -397,7 +388,8 @@ def command_validate_input(args: adsk.core.ValidateInputsEventArgs):
         and (not inputsState.hasMagnetSockets or (inputsState.magnetSocketSize <= 1 and inputsState.magnetSocketSize > 0 and inputsState.magnetSocketDepth > 0)) \
         and (not inputsState.hasScrewHoles or (inputsState.screwHoleSize > 0 and inputsState.screwHoleSize <= 1 and inputsState.screwHeadSize > inputsState.screwHoleSize and inputsState.screwHeadSize <= 1.5)) \
         and (not inputsState.hasConnectionHoles or (inputsState.connectionHoleSize > 0 and inputsState.connectionHoleSize <= 0.5)) \
-        and (inputsState.extraBottomThickness > 0)
+        and (inputsState.extraBottomThickness > 0) \
+        and (not inputsState.hasTiling or (inputsState.drawerWidth >= inputsState.baseWidth and inputsState.drawerLength >= inputsState.baseLength and inputsState.printBedWidth >= inputsState.baseWidth and inputsState.printBedLength >= inputsState.baseLength))
 
 
     args.areInputsValid = INPUTS_VALID
@@ -409,9 +401,14 @@ def command_destroy(args: adsk.core.CommandEventArgs):
     global local_handlers
     local_handlers = []
     global uiState
+    previewScheduler.stop()
+    if args.terminationReason == adsk.core.CommandTerminationReason.CompletedTerminationReason:
+        meshExporter.runConfiguredMeshExports()
+    else:
+        meshExporter.clearMeshExportQueue()
 
 
-def generateBaseplate(args: adsk.core.CommandEventArgs):
+def generateBaseplate(args: adsk.core.CommandEventArgs, isPreview: bool = False, fidelity: int = const.GENERATOR_FIDELITY_FULL):
     futil.log(f'{CMD_NAME} Generating baseplate')
     inputsState = getInputsState()
 
@@ -420,57 +417,132 @@ def generateBaseplate(args: adsk.core.CommandEventArgs):
         if des.designType == 0:
             raise UnsupportedDesignTypeException('Timeline must be enabled for the generator to work, projects with disabled design history currently are not supported')
         root = adsk.fusion.Component.cast(des.rootComponent)
-        baseplateName = 'Gridfinity baseplate {}x{}'.format(int(inputsState.plateLength), int(inputsState.plateWidth))
-
-        # create new component
-        newCmpOcc = adsk.fusion.Occurrences.cast(root.occurrences).addNewComponent(adsk.core.Matrix3D.create())
-
-        newCmpOcc.component.name = baseplateName
-        newCmpOcc.activate()
-        gridfinityBaseplateComponent: adsk.fusion.Component = newCmpOcc.component
-        baseplateGeneratorInput = BaseplateGeneratorInput()
-
-        baseplateGeneratorInput.baseWidth = inputsState.baseWidth
-        baseplateGeneratorInput.baseLength = inputsState.baseLength
-        baseplateGeneratorInput.xyClearance = inputsState.xyClearance
-        baseplateGeneratorInput.baseplateWidth = inputsState.plateWidth
-        baseplateGeneratorInput.baseplateLength = inputsState.plateLength
-        baseplateGeneratorInput.hasExtendedBottom = not inputsState.plateType == BASEPLATE_TYPE_LIGHT
-        baseplateGeneratorInput.hasSkeletonizedBottom = inputsState.plateType == BASEPLATE_TYPE_SKELETONIZED
-        baseplateGeneratorInput.hasMagnetCutouts = inputsState.hasMagnetSockets
-        baseplateGeneratorInput.magnetCutoutsDiameter = inputsState.magnetSocketSize
-        baseplateGeneratorInput.magnetCutoutsDepth = inputsState.magnetSocketDepth
-        baseplateGeneratorInput.hasScrewHoles = inputsState.hasScrewHoles
-        baseplateGeneratorInput.screwHolesDiameter = inputsState.screwHoleSize
-        baseplateGeneratorInput.screwHeadCutoutDiameter = inputsState.screwHeadSize
-        baseplateGeneratorInput.hasPadding = inputsState.hasPadding
-        baseplateGeneratorInput.paddingLeft = inputsState.paddingLeft
-        baseplateGeneratorInput.paddingTop = inputsState.paddingTop
-        baseplateGeneratorInput.paddingRight = inputsState.paddingRight
-        baseplateGeneratorInput.paddingBottom = inputsState.paddingBottom
-        baseplateGeneratorInput.bottomExtensionHeight = inputsState.extraBottomThickness
-        baseplateGeneratorInput.binZClearance = inputsState.verticalClearance
-        baseplateGeneratorInput.hasConnectionHoles = inputsState.hasConnectionHoles
-        baseplateGeneratorInput.connectionScrewHolesDiameter = inputsState.connectionHoleSize
-        baseplateGeneratorInput.cornerFilletRadius = const.BIN_CORNER_FILLET_RADIUS
-
-        baseplateBody = createGridfinityBaseplate(baseplateGeneratorInput, gridfinityBaseplateComponent)
-        baseplateBody.name = baseplateName
+        if inputsState.hasTiling:
+            generateBaseplateTiles(inputsState, root, isPreview, fidelity)
+            return
 
-        if des.designType == 1:
-            # group features in timeline
-            plateGroup = des.timeline.timelineGroups.add(newCmpOcc.timelineObject.index, newCmpOcc.timelineObject.index + gridfinityBaseplateComponent.features.count + gridfinityBaseplateComponent.constructionAxes.count + gridfinityBaseplateComponent.constructionPlanes.count + gridfinityBaseplateComponent.sketches.count)
-            plateGroup.name = baseplateName
+        baseplateGeneratorInput = createBaseplateGeneratorInput(inputsState, fidelity)
+        baseplateName = 'Gridfinity baseplate {}x{}'.format(int(inputsState.plateLength), int(inputsState.plateWidth))
+        generateBaseplateComponent(baseplateGeneratorInput, baseplateName, root, adsk.core.Matrix3D.create(), isPreview)
     except UnsupportedDesignTypeException as err:
         args.executeFailed = True
         args.executeFailedMessage = 'Design type is unsupported. Projects with disabled design history are unsupported, please enable timeline feature to proceed.'
         return False
+    except BaseplateTilingError as err:
+        args.executeFailed = True
+        args.executeFailedMessage = f'Unable to split the drawer into tiles: {err}'
+        return False
     except Exception as err:
         args.executeFailed = True
         args.executeFailedMessage = getErrorMessage()
         futil.log(f'{CMD_NAME} Error occurred, {err}, {getErrorMessage()}')
         return False
 
+def createBaseplateGeneratorInput(inputsState: InputState, fidelity: int = const.GENERATOR_FIDELITY_FULL):
+    baseplateGeneratorInput = BaseplateGeneratorInput()
+
+    baseplateGeneratorInput.baseWidth = inputsState.baseWidth
+    baseplateGeneratorInput.baseLength = inputsState.baseLength
+    baseplateGeneratorInput.xyClearance = inputsState.xyClearance
+    baseplateGeneratorInput.baseplateWidth = inputsState.plateWidth
+    baseplateGeneratorInput.baseplateLength = inputsState.plateLength
+    baseplateGeneratorInput.hasExtendedBottom = not inputsState.plateType == BASEPLATE_TYPE_LIGHT
+    baseplateGeneratorInput.hasSkeletonizedBottom = inputsState.plateType == BASEPLATE_TYPE_SKELETONIZED
+    baseplateGeneratorInput.hasMagnetCutouts = inputsState.hasMagnetSockets
+    baseplateGeneratorInput.magnetCutoutsDiameter = inputsState.magnetSocketSize
+    baseplateGeneratorInput.magnetCutoutsDepth = inputsState.magnetSocketDepth
+    baseplateGeneratorInput.hasScrewHoles = inputsState.hasScrewHoles
+    baseplateGeneratorInput.screwHolesDiameter = inputsState.screwHoleSize
+    baseplateGeneratorInput.screwHeadCutoutDiameter = inputsState.screwHeadSize
+    baseplateGeneratorInput.hasPadding = inputsState.hasPadding
+    baseplateGeneratorInput.paddingLeft = inputsState.paddingLeft
+    baseplateGeneratorInput.paddingTop = inputsState.paddingTop
+    baseplateGeneratorInput.paddingRight = inputsState.paddingRight
+    baseplateGeneratorInput.paddingBottom = inputsState.paddingBottom
+    baseplateGeneratorInput.bottomExtensionHeight = inputsState.extraBottomThickness
+    baseplateGeneratorInput.binZClearance = inputsState.verticalClearance
+    baseplateGeneratorInput.hasConnectionHoles = inputsState.hasConnectionHoles
+    baseplateGeneratorInput.connectionScrewHolesDiameter = inputsState.connectionHoleSize
+    baseplateGeneratorInput.cornerFilletRadius = const.BIN_CORNER_FILLET_RADIUS
+    baseplateGeneratorInput.fidelity = fidelity
+    return baseplateGeneratorInput
+
+def generateBaseplateComponent(
+    baseplateGeneratorInput: BaseplateGeneratorInput,
+    baseplateName: str,
+    parentComponent: adsk.fusion.Component,
+    transform: adsk.core.Matrix3D,
+    isPreview: bool,
+):
+    des = parentComponent.parentDesign
+    # create new component
+    newCmpOcc = adsk.fusion.Occurrences.cast(parentComponent.occurrences).addNewComponent(transform)
+
+    newCmpOcc.component.name = baseplateName
+    newCmpOcc.activate()
+    gridfinityBaseplateComponent: adsk.fusion.Component = newCmpOcc.component
+
+    with futil.trace_run(baseplateName, gridfinityBaseplateComponent), futil.deferred_compute():
+        if isPreview:
+            baseplateBody = createGridfinityBaseplatePreview(baseplateGeneratorInput, gridfinityBaseplateComponent)
+        elif baseplateGeneratorInput.fidelity < const.GENERATOR_FIDELITY_FULL:
+            baseplateBody = createGridfinityBaseplate(baseplateGeneratorInput, gridfinityBaseplateComponent)
+        else:
+            baseplateBody = resultCache.generateWithResultCache(
+                resultCache.resultCacheKey('baseplate', baseplateGeneratorInput),
+                baseplateName,
+                gridfinityBaseplateComponent,
+                lambda: createGridfinityBaseplate(baseplateGeneratorInput, gridfinityBaseplateComponent),
+            )
+        baseplateBody.name = baseplateName
+
+        if des.designType == 1:
+            # group features in timeline
+            with futil.span('timeline group'):
+                plateGroup = des.timeline.timelineGroups.add(newCmpOcc.timelineObject.index, newCmpOcc.timelineObject.index + gridfinityBaseplateComponent.features.count + gridfinityBaseplateComponent.constructionAxes.count + gridfinityBaseplateComponent.constructionPlanes.count + gridfinityBaseplateComponent.sketches.count)
+                plateGroup.name = baseplateName
+    if not isPreview and baseplateGeneratorInput.fidelity == const.GENERATOR_FIDELITY_FULL and config.EXPORT_ENABLED:
+        meshExporter.queueMeshExport(gridfinityBaseplateComponent, baseplateName, generatorInputHash(baseplateGeneratorInput))
+    return newCmpOcc
+
+def generateBaseplateTiles(inputsState: InputState, root: adsk.fusion.Component, isPreview: bool, fidelity: int = const.GENERATOR_FIDELITY_FULL):
+    # every distinct tile is generated once, its other copies are occurrences of the same component
+    tiles = planBaseplateTiles(
+        inputsState.drawerWidth,
+        inputsState.drawerLength,
+        inputsState.printBedWidth,
+        inputsState.printBedLength,
+        inputsState.baseWidth,
+        inputsState.baseLength,
+        inputsState.xyClearance,
+    )
+    tilesCount = sum([len(tile.positions) for tile in tiles])
+    futil.log(f'{CMD_NAME} Drawer split into {tilesCount} tiles of {len(tiles)} distinct shapes')
+    tilesOccurrence = root.occurrences.addNewComponent(adsk.core.Matrix3D.create())
+    tilesComponent = tilesOccurrence.component
+    tilesComponent.name = 'Gridfinity baseplate tiles {}x{}'.format(round(inputsState.drawerLength * 10), round(inputsState.drawerWidth * 10))
+
+    for (index, tile) in enumerate(tiles):
+        baseplateGeneratorInput = createBaseplateGeneratorInput(inputsState, fidelity)
+        baseplateGeneratorInput.baseplateWidth = tile.plateWidth
+        baseplateGeneratorInput.baseplateLength = tile.plateLength
+        baseplateGeneratorInput.hasPadding = tile.hasPadding
+        baseplateGeneratorInput.paddingLeft = tile.paddingLeft
+        baseplateGeneratorInput.paddingTop = tile.paddingTop
+        baseplateGeneratorInput.paddingRight = tile.paddingRight
+        baseplateGeneratorInput.paddingBottom = tile.paddingBottom
+        tileName = 'Gridfinity baseplate tile {} {}x{}'.format(index + 1, tile.plateLength, tile.plateWidth)
+
+        transforms = []
+        for (positionX, positionY) in tile.positions:
+            transform = adsk.core.Matrix3D.create()
+            transform.translation = adsk.core.Vector3D.create(positionX, positionY, 0)
+            transforms.append(transform)
+        tileOccurrence = generateBaseplateComponent(baseplateGeneratorInput, tileName, tilesComponent, transforms[0], isPreview)
+        for transform in transforms[1:]:
+            tilesComponent.occurrences.addExistingComponent(tileOccurrence.component, transform)
+    tilesOccurrence.activate()
+
 def initUiState():
     global uiState
     uiState.initValue(INFO_GROUP, True, adsk.core.GroupCommandInput.classType())
@@ -483,6 +555,7 @@ def initUiState():
     uiState.initValue(INPUT_CHANGES_GROUP, True, adsk.core.GroupCommandInput.classType())
     uiState.initValue(SIDE_PADDING_GROUP, True, adsk.core.GroupCommandInput.classType())
     uiState.initValue(PREVIEW_GROUP, True, adsk.core.GroupCommandInput.classType())
+    uiState.initValue(PRINT_BED_TILING_GROUP, False, adsk.core.GroupCommandInput.classType())
 
     uiState.initValue(BASEPLATE_BASE_UNIT_WIDTH_INPUT, DIMENSION_DEFAULT_WIDTH_UNIT, adsk.core.ValueCommandInput.classType())
     uiState.initValue(BASEPLATE_BASE_UNIT_LENGTH_INPUT, DIMENSION_DEFAULT_WIDTH_UNIT, adsk.core.ValueCommandInput.classType())
@@ -510,7 +583,14 @@ def initUiState():
     uiState.initValue(BASEPLATE_BIN_Z_CLEARANCE_INPUT, const.BASEPLATE_BIN_Z_CLEARANCE, adsk.core.ValueCommandInput.classType())
     uiState.initValue(BASEPLATE_HAS_CONNECTION_HOLE_INPUT, False, adsk.core.BoolValueCommandInput.classType())
     uiState.initValue(BASEPLATE_CONNECTION_HOLE_DIAMETER_INPUT, const.DIMENSION_PLATE_CONNECTION_SCREW_HOLE_DIAMETER, adsk.core.ValueCommandInput.classType())
+    uiState.initValue(BASEPLATE_WITH_TILING_INPUT, False, adsk.core.BoolValueCommandInput.classType())
+    uiState.initValue(BASEPLATE_DRAWER_WIDTH_INPUT, const.BASEPLATE_DEFAULT_DRAWER_WIDTH, adsk.core.ValueCommandInput.classType())
+    uiState.initValue(BASEPLATE_DRAWER_LENGTH_INPUT, const.BASEPLATE_DEFAULT_DRAWER_LENGTH, adsk.core.ValueCommandInput.classType())
+    uiState.initValue(BASEPLATE_PRINT_BED_WIDTH_INPUT, const.DEFAULT_PRINT_BED_SIZE, adsk.core.ValueCommandInput.classType())
+    uiState.initValue(BASEPLATE_PRINT_BED_LENGTH_INPUT, const.DEFAULT_PRINT_BED_SIZE, adsk.core.ValueCommandInput.classType())
     uiState.initValue(SHOW_PREVIEW_INPUT, False, adsk.core.BoolValueCommandInput.classType())
+    uiState.initValue(SHOW_DETAILED_PREVIEW_INPUT, False, adsk.core.BoolValueCommandInput.classType())
+    uiState.initValue(PREVIEW_FIDELITY_INPUT, PREVIEW_FIDELITY_FULL, adsk.core.DropDownCommandInput.classType())
 
     recordedDefaults = configUtils.readJsonConfig(UI_INPUT_DEFAULTS_CONFIG_PATH)
     if recordedDefaults:
@@ -558,4 +638,9 @@ def getInputsState():
         uiState.getState(BASEPLATE_BIN_Z_CLEARANCE_INPUT),
         uiState.getState(BASEPLATE_HAS_CONNECTION_HOLE_INPUT),
         uiState.getState(BASEPLATE_CONNECTION_HOLE_DIAMETER_INPUT),
+        uiState.getState(BASEPLATE_WITH_TILING_INPUT),
+        uiState.getState(BASEPLATE_DRAWER_WIDTH_INPUT),
+        uiState.getState(BASEPLATE_DRAWER_LENGTH_INPUT),
+        uiState.getState(BASEPLATE_PRINT_BED_WIDTH_INPUT),
+        uiState.getState(BASEPLATE_PRINT_BED_LENGTH_INPUT),
     )
\ No newline at end of file
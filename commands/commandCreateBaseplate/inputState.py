@@ -30,3 +30,9 @@ class InputState:
 
     hasConnectionHoles: bool
     connectionHoleSize: float
+
+    hasTiling: bool
+    drawerWidth: float
+    drawerLength: float
+    printBedWidth: float
+    printBedLength: float
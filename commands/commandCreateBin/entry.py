@@ -6,50 +6,32 @@ import math
 from ...lib import configUtils
 from ...lib import fusion360utils as futil
 from ... import config
-from ...lib.gridfinityUtils import combineUtils
 from ...lib.gridfinityUtils import geometryUtils
-from ...lib.gridfinityUtils import faceUtils
-from ...lib.gridfinityUtils import shellUtils
-from ...lib.gridfinityUtils import commonUtils
-from ...lib.gridfinityUtils import const
-from ...lib.gridfinityUtils.baseGenerator import createSingleGridfinityBaseBody, createBaseBodyPattern, cutBaseClearance
+from ...lib.gridfinityUtils import const, binLayoutSolver
 from ...lib.gridfinityUtils.baseGeneratorInput import BaseGeneratorInput
-from ...lib.gridfinityUtils.binBodyGenerator import createGridfinityBinBody, uniformCompartments
+from ...lib.gridfinityUtils.binBodyGenerator import uniformCompartments
 from ...lib.gridfinityUtils.binBodyGeneratorInput import BinBodyGeneratorInput, BinBodyCompartmentDefinition
-from ...lib.gridfinityUtils.binBodyTabGeneratorInput import BinBodyTabGeneratorInput
-from ...lib.gridfinityUtils.binBodyTabGenerator import createGridfinityBinBodyTab
+from ...lib.gridfinityUtils.binGenerator import createGridfinityBin
+from ...lib.gridfinityUtils.binGeneratorInput import BinGeneratorInput
+from ...lib.gridfinityUtils.binPreviewGenerator import createGridfinityBinPreview
+from ...lib.gridfinityUtils.binStageCache import BinStages
+from ...lib.gridfinityUtils.generatorInputHash import generatorInputHash
+from ...lib.gridfinityUtils import meshExporter, resultCache
 from ...lib.ui.commandUiState import CommandUiState
+from ...lib.ui.previewScheduler import PreviewScheduler
 from ...lib.ui.unsupportedDesignTypeException import UnsupportedDesignTypeException
+from .commandInfo import CMD_NAME, CONFIG_FOLDER_PATH
 
 app = adsk.core.Application.get()
 ui = app.userInterface
 
 
-# *** The command identity information. ***
-CMD_ID = f'{config.COMPANY_NAME}_{config.ADDIN_NAME}_cmdBin'
-CMD_NAME = 'Gridfinity bin'
-CMD_Description = 'Create simple gridfinity bin'
-
 commandUIState = CommandUiState(CMD_NAME)
 actualDimensionsTableUiState = CommandUiState(CMD_NAME)
 actualCompartmentDimensionsUiState = CommandUiState(CMD_NAME)
 commandCompartmentsTableUIState: list[CommandUiState] = []
+previewScheduler = PreviewScheduler(CMD_NAME, config.PREVIEW_QUIET_PERIOD)
 
-# Specify that the command will be promoted to the panel.
-IS_PROMOTED = True
-
-# TODO *** Define the location where the command button will be created. ***
-# This is done by specifying the workspace, the tab, and the panel, and the 
-# command it will be inserted beside. Not providing the command to position it
-# will insert it at the end.
-WORKSPACE_ID = 'FusionSolidEnvironment'
-PANEL_ID = 'SolidCreatePanel'
-COMMAND_BESIDE_ID = 'ScriptsManagerCommand'
-
-# Resource location for command icons, here we assume a sub folder in this directory named "resources".
-ICON_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources', '')
-
-CONFIG_FOLDER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'commandConfig')
 UI_INPUT_DEFAULTS_CONFIG_PATH = os.path.join(CONFIG_FOLDER_PATH, "ui_input_defaults.json")
 
 # Local list of event handlers used to maintain a reference so
@@ -127,6 +109,16 @@ PRESERVE_CHAGES_RADIO_GROUP_RESET = 'Reset inputs after creation'
 RESET_CHAGES_INPUT = 'reset_changes'
 SHOW_PREVIEW_INPUT = 'show_preview'
 SHOW_PREVIEW_MANUAL_INPUT = 'show_preview_manual'
+SHOW_DETAILED_PREVIEW_INPUT = 'show_detailed_preview'
+PREVIEW_FIDELITY_INPUT = 'preview_fidelity'
+PREVIEW_FIDELITY_DRAFT = 'Draft'
+PREVIEW_FIDELITY_STANDARD = 'Standard'
+PREVIEW_FIDELITY_FULL = 'Full'
+PREVIEW_FIDELITY_LEVELS = {
+    PREVIEW_FIDELITY_DRAFT: const.GENERATOR_FIDELITY_DRAFT,
+    PREVIEW_FIDELITY_STANDARD: const.GENERATOR_FIDELITY_STANDARD,
+    PREVIEW_FIDELITY_FULL: const.GENERATOR_FIDELITY_FULL,
+}
 
 INFO_TEXT = ("<b>Help:</b> Info for inputs can be found "
              "<a href=\"https://github.com/Le0Michine/FusionGridfinityGenerator/wiki/Bin-generator-options\">"
@@ -140,6 +132,12 @@ def refreshUi():
     update_actual_bin_dimensions()
     onChangeValidate()
 
+def previewInputsHash():
+    global commandUIState
+    global commandCompartmentsTableUIState
+    inputsHash = commandUIState.toHash(ignoreKeys=[SHOW_PREVIEW_MANUAL_INPUT, SHOW_PREVIEW_INPUT])
+    return inputsHash + ''.join([rowState.toHash() for rowState in commandCompartmentsTableUIState])
+
 def initDefaultUiState():
     global commandUIState
     global actualDimensionsTableUiState
@@ -223,60 +221,10 @@ def showErrorInMessageBox(text = "An unknown error occurred, please validate you
     if ui:
         ui.messageBox(getErrorMessage(text), f"{CMD_NAME} Error")
 
-# Executed when add-in is run.
+# Executed when the command is run for the first time, its button is added by the commands package.
 def start():
-    try:
-        futil.log(f'{CMD_NAME} Command Start Event')
-        addinConfig = configUtils.readConfig(CONFIG_FOLDER_PATH)
-
-        # Create a command Definition.
-        cmd_def = ui.commandDefinitions.itemById(CMD_ID)
-        if not cmd_def:
-            cmd_def = ui.commandDefinitions.addButtonDefinition(CMD_ID, CMD_NAME, CMD_Description, ICON_FOLDER)
-
-            # Define an event handler for the command created event. It will be called when the button is clicked.
-            futil.add_handler(cmd_def.commandCreated, command_created)
-
-            # ******** Add a button into the UI so the user can run the command. ********
-            # Get the target workspace the button will be created in.
-            workspace = ui.workspaces.itemById(WORKSPACE_ID)
-
-            # Get the panel the button will be created in.
-            panel = workspace.toolbarPanels.itemById(PANEL_ID)
-
-            # Create the button command control in the UI after the specified existing command.
-            control = panel.controls.addCommand(cmd_def, COMMAND_BESIDE_ID, False)
-
-            # Specify if the command is promoted to the main toolbar.
-            control.isPromoted = addinConfig['UI'].getboolean('is_promoted')
-        initDefaultUiState()
-        ui.statusMessage = ""
-    except Exception as err:
-        futil.log(f'{CMD_NAME} Error occurred at the start, {err}, {getErrorMessage()}')
-        ui.statusMessage = f"{CMD_NAME} failed to initialize"
-        showErrorInMessageBox(f"{CMD_NAME} Critical error occurred at the start, the command will be unavailable, if the issue persists use <a href=\"https://github.com/Le0Michine/FusionGridfinityGenerator/issues/new\">this link</a> to report it")
-
-# Executed when add-in is stopped.
-def stop():
-    futil.log(f'{CMD_NAME} Command Stop Event')
-    # Get the various UI elements for this command
-    workspace = ui.workspaces.itemById(WORKSPACE_ID)
-    panel = workspace.toolbarPanels.itemById(PANEL_ID)
-    command_control: adsk.core.CommandControl = panel.controls.itemById(CMD_ID)
-    command_definition = ui.commandDefinitions.itemById(CMD_ID)
-
-    addinConfig = configUtils.readConfig(CONFIG_FOLDER_PATH)
-    addinConfig['UI']['is_promoted'] = 'yes' if command_control.isPromoted else 'no'
-    configUtils.writeConfig(addinConfig, CONFIG_FOLDER_PATH)
-        
-
-    # Delete the button command control
-    if command_control:
-        command_control.deleteMe()
-
-    # Delete the command definition
-    if command_definition:
-        command_definition.deleteMe()
+    futil.log(f'{CMD_NAME} Command Start Event')
+    initDefaultUiState()
 
 def render_actual_bin_dimensions_table(inputs: adsk.core.CommandInputs):
     global actualDimensionsTableUiState
@@ -335,12 +283,17 @@ def update_actual_compartment_unit_dimensions():
     gridWidth: int = commandUIState.getState(BIN_COMPARTMENTS_GRID_BASE_WIDTH_ID)
     gridLength: int = commandUIState.getState(BIN_COMPARTMENTS_GRID_BASE_LENGTH_ID)
     wallThickness: float = commandUIState.getState(BIN_WALL_THICKNESS_INPUT_ID)
-    xyClearance: float = commandUIState.getState(BIN_WITH_LIP_INPUT_ID)
+    xyClearance: float = commandUIState.getState(BIN_XY_CLEARANCE_INPUT_ID)
+    hasLip: bool = commandUIState.getState(BIN_WITH_LIP_INPUT_ID)
+    hasScoop: bool = commandUIState.getState(BIN_HAS_SCOOP_INPUT_ID) and commandUIState.getState(BIN_TYPE_DROPDOWN_ID) == BIN_TYPE_HOLLOW
     try:
         minCompartmentDimensionLimit = (const.BIN_CORNER_FILLET_RADIUS - wallThickness) * 2 * 10
-        cellWidth = round((baseWidth * binWidth - wallThickness * 2 - xyClearance * 2 - wallThickness * (gridWidth - 1)) / gridWidth * 10, 2)
+        actualWidth = binLayoutSolver.actualBinSize(baseWidth, binWidth, xyClearance)
+        cellWidth = round(binLayoutSolver.compartmentUnitSize(actualWidth - wallThickness * 2, gridWidth, wallThickness) * 10, 2)
         actualCompartmentDimensionsUiState.updateValue(BIN_COMPARTMENT_REAL_DIMENSIONS_WIDTH, formatString(f'Grid cell width: {cellWidth}mm', '' if cellWidth >= minCompartmentDimensionLimit else 'red'))
-        cellLength = round((baseLength * binLength - wallThickness * 2 - xyClearance * 2 - wallThickness * (gridLength - 1)) / gridLength * 10, 2)
+        actualLength = binLayoutSolver.actualBinSize(baseLength, binLength, xyClearance)
+        compartmentsMinY = binLayoutSolver.compartmentsMinY(wallThickness, xyClearance, hasLip, hasScoop)
+        cellLength = round(binLayoutSolver.compartmentUnitSize(actualLength - wallThickness - compartmentsMinY, gridLength, wallThickness) * 10, 2)
         actualCompartmentDimensionsUiState.updateValue(BIN_COMPARTMENT_REAL_DIMENSIONS_LENGTH, formatString(f'Grid cell length: {cellLength}mm', '' if cellLength >= minCompartmentDimensionLimit else 'red'))
     except:
         showErrorInMessageBox()
@@ -348,9 +301,10 @@ def update_actual_compartment_unit_dimensions():
 def update_actual_bin_dimensions():
     global actualDimensionsTableUiState
     try:
-        actualWidth = commandUIState.getState(BIN_BASE_WIDTH_UNIT_INPUT_ID) * commandUIState.getState(BIN_WIDTH_INPUT_ID) - const.BIN_XY_CLEARANCE * 2
-        actualLength = commandUIState.getState(BIN_BASE_LENGTH_UNIT_INPUT_ID) * commandUIState.getState(BIN_LENGTH_INPUT_ID) - const.BIN_XY_CLEARANCE * 2
-        actualHeight = commandUIState.getState(BIN_HEIGHT_UNIT_INPUT_ID) * commandUIState.getState(BIN_HEIGHT_INPUT_ID) + ((const.BIN_LIP_EXTRA_HEIGHT - const.BIN_LIP_TOP_RECESS_HEIGHT) if commandUIState.getState(BIN_WITH_LIP_INPUT_ID) else 0)
+        xyClearance = commandUIState.getState(BIN_XY_CLEARANCE_INPUT_ID)
+        actualWidth = binLayoutSolver.actualBinSize(commandUIState.getState(BIN_BASE_WIDTH_UNIT_INPUT_ID), commandUIState.getState(BIN_WIDTH_INPUT_ID), xyClearance)
+        actualLength = binLayoutSolver.actualBinSize(commandUIState.getState(BIN_BASE_LENGTH_UNIT_INPUT_ID), commandUIState.getState(BIN_LENGTH_INPUT_ID), xyClearance)
+        actualHeight = binLayoutSolver.binTotalHeight(commandUIState.getState(BIN_HEIGHT_INPUT_ID), commandUIState.getState(BIN_HEIGHT_UNIT_INPUT_ID), commandUIState.getState(BIN_WITH_LIP_INPUT_ID))
         totalWidthValue = round(actualWidth * 10, 2)
         totalLengthValue = round(actualLength * 10, 2)
         totalHeightValue = round(actualHeight * 10, 2)
@@ -484,6 +438,11 @@ def is_all_input_valid(inputs: adsk.core.CommandInputs):
             result = result and binTabWidth.value > 0
             result = result and binTabPosition.value >= 0
             result = result and binTabAngle.value >= math.radians(30) and binTabAngle.value <= math.radians(65)
+        compartmentsMinY = binLayoutSolver.compartmentsMinY(bin_wall_thickness.value, xy_tolerance.value, with_lip.value, has_scoop.value)
+        compartmentsWidth = binLayoutSolver.actualBinSize(base_width_unit.value, bin_width.value, xy_tolerance.value) - bin_wall_thickness.value * 2
+        compartmentsLength = binLayoutSolver.actualBinSize(base_length_unit.value, bin_length.value, xy_tolerance.value) - bin_wall_thickness.value - compartmentsMinY
+        result = result and binLayoutSolver.compartmentUnitSize(compartmentsWidth, compartmentsX.value, bin_wall_thickness.value) > 0
+        result = result and binLayoutSolver.compartmentUnitSize(compartmentsLength, compartmentsY.value, bin_wall_thickness.value) > 0
         if binCompartmentGridTypeDropdownInput.selectedItem.name == BIN_COMPARTMENTS_GRID_TYPE_CUSTOM:
             for i in range(1, binCompartmentsTable.rowCount):
                 posX: adsk.core.IntegerSpinnerCommandInput = binCompartmentsTable.getInputAtPosition(i, 0)
@@ -668,8 +627,16 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
     previewGroup = inputs.addGroupCommandInput(PREVIEW_GROUP_ID, 'Preview')
     previewGroup.isExpanded = commandUIState.getState(PREVIEW_GROUP_ID)
     commandUIState.registerCommandInput(userChangesGroup)
-    showPreviewCheckboxInput =  previewGroup.children.addBoolValueInput(SHOW_PREVIEW_INPUT, 'Show auto update preview (slow)', True, '', False)
+    showPreviewCheckboxInput =  previewGroup.children.addBoolValueInput(SHOW_PREVIEW_INPUT, 'Show auto update preview', True, '', False)
     commandUIState.registerCommandInput(showPreviewCheckboxInput)
+    showDetailedPreviewCheckboxInput = previewGroup.children.addBoolValueInput(SHOW_DETAILED_PREVIEW_INPUT, 'Detailed preview (slow)', True, '', False)
+    showDetailedPreviewCheckboxInput.tooltip = 'Build the preview with the full timeline instead of a simplified shape'
+    commandUIState.registerCommandInput(showDetailedPreviewCheckboxInput)
+    previewFidelityDropdown = previewGroup.children.addDropDownCommandInput(PREVIEW_FIDELITY_INPUT, 'Detailed preview fidelity', adsk.core.DropDownStyles.LabeledIconDropDownStyle)
+    for fidelityName in PREVIEW_FIDELITY_LEVELS:
+        previewFidelityDropdown.listItems.add(fidelityName, fidelityName == PREVIEW_FIDELITY_FULL)
+    previewFidelityDropdown.tooltip = 'Draft skips fillets, chamfers, print helper grooves and lip notches, standard skips only grooves and notches. Only a full preview is kept as the result'
+    commandUIState.registerCommandInput(previewFidelityDropdown)
     showPreviewManual = previewGroup.children.addBoolValueInput(SHOW_PREVIEW_MANUAL_INPUT, 'Update preview once', False, '', False)
     showPreviewManual.isFullWidth = True
     commandUIState.registerCommandInput(showPreviewManual)
@@ -681,12 +648,14 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
     futil.add_handler(args.command.executePreview, command_preview, local_handlers=local_handlers)
     futil.add_handler(args.command.validateInputs, command_validate_input, local_handlers=local_handlers)
     futil.add_handler(args.command.destroy, command_destroy, local_handlers=local_handlers)
+    previewScheduler.start(args.command, previewInputsHash())
 
 
 # This event handler is called when the user clicks the OK button in the command dialog or 
 # is immediately called after the created event not command inputs were created for the dialog.
 def command_execute(args: adsk.core.CommandEventArgs):
     futil.log(f'{CMD_NAME} Command Execute Event')
+    meshExporter.clearMeshExportQueue()
     generateBin(args)
 
 # This event handler is called when the command needs to compute a new preview in the graphics window.
@@ -696,8 +665,28 @@ def command_preview(args: adsk.core.CommandEventArgs):
     if is_all_input_valid(inputs):
         showPreview: adsk.core.BoolValueCommandInput = inputs.itemById(SHOW_PREVIEW_INPUT)
         showPreviewManual: adsk.core.BoolValueCommandInput = inputs.itemById(SHOW_PREVIEW_MANUAL_INPUT)
+        showDetailedPreview: adsk.core.BoolValueCommandInput = inputs.itemById(SHOW_DETAILED_PREVIEW_INPUT)
         if showPreview.value or showPreviewManual.value:
-            args.isValidResult = generateBin(args)
+            design = adsk.fusion.Design.cast(app.activeProduct)
+            inputsHash = previewInputsHash()
+            if not previewScheduler.shouldGeneratePreview(inputsHash, design.rootComponent):
+                if previewScheduler.isSettled:
+                    showPreviewManual.value = False
+                return
+            previewFidelity: adsk.core.DropDownCommandInput = inputs.itemById(PREVIEW_FIDELITY_INPUT)
+            fidelity = PREVIEW_FIDELITY_LEVELS[previewFidelity.selectedItem.name]
+            if showDetailedPreview.value and fidelity < const.GENERATOR_FIDELITY_FULL:
+                # reduced fidelity preview lacks features, execute runs the full generation
+                generateBin(args, fidelity=fidelity, reuseStages=True)
+            elif showDetailedPreview.value:
+                # detailed preview can become the result, only the latest one is exported
+                meshExporter.clearMeshExportQueue()
+                args.isValidResult = generateBin(args, reuseStages=True)
+            else:
+                # simplified preview can't be reused as a result, execute runs the full generation
+                generateBin(args, isPreview=True)
+            if not args.executeFailed:
+                previewScheduler.storePreviewResult(inputsHash, design.rootComponent.occurrences.item(design.rootComponent.occurrences.count - 1))
             showPreviewManual.value = False
     else:
         args.executeFailed = True
@@ -766,6 +755,7 @@ def command_input_changed(args: adsk.core.InputChangedEventArgs):
     except:
         showErrorInMessageBox()
 
+    previewScheduler.inputChanged(previewInputsHash())
 
 
 # This event handler is called when the user interacts with any of the inputs in the dialog
@@ -787,6 +777,11 @@ def command_destroy(args: adsk.core.CommandEventArgs):
     futil.log(f'{CMD_NAME} Command Destroy Event "{args.terminationReason}"')
     global local_handlers
     local_handlers = []
+    previewScheduler.stop()
+    if args.terminationReason == adsk.core.CommandTerminationReason.CompletedTerminationReason:
+        meshExporter.runConfiguredMeshExports()
+    else:
+        meshExporter.clearMeshExportQueue()
 
 def deleteTableRow(rowToDelete: int, tableInput: adsk.core.TableCommandInput, inputState: list[CommandUiState]):
     inputState.pop(rowToDelete - 1)
@@ -839,11 +834,12 @@ def onChangeValidate():
 
     showPreview: bool = commandUIState.getInput(SHOW_PREVIEW_INPUT).value
     commandUIState.getInput(SHOW_PREVIEW_MANUAL_INPUT).isVisible = not showPreview
+    commandUIState.getInput(PREVIEW_FIDELITY_INPUT).isVisible = commandUIState.getInput(SHOW_DETAILED_PREVIEW_INPUT).value
 
 def saveUIInputsAsDefaults():
     futil.log(f'{CMD_NAME} Saving UI state to file')
     result = configUtils.dumpJsonConfig(UI_INPUT_DEFAULTS_CONFIG_PATH, {
-        'static_ui': commandUIState.toDict(ignoreKeys=[SHOW_PREVIEW_MANUAL_INPUT, SHOW_PREVIEW_INPUT]),
+        'static_ui': commandUIState.toDict(ignoreKeys=[SHOW_PREVIEW_MANUAL_INPUT, SHOW_PREVIEW_INPUT, SHOW_DETAILED_PREVIEW_INPUT, PREVIEW_FIDELITY_INPUT]),
         'compartments_table': [x.toDict() for x in commandCompartmentsTableUIState]
         })
     if result:
@@ -851,7 +847,7 @@ def saveUIInputsAsDefaults():
     else:
         futil.log(f'{CMD_NAME} UI state failed to save')
 
-def generateBin(args: adsk.core.CommandEventArgs):
+def generateBin(args: adsk.core.CommandEventArgs, isPreview: bool = False, fidelity: int = const.GENERATOR_FIDELITY_FULL, reuseStages: bool = False):
     inputs = args.command.commandInputs
     base_width_unit: adsk.core.ValueCommandInput = inputs.itemById(BIN_BASE_WIDTH_UNIT_INPUT_ID)
     base_length_unit: adsk.core.ValueCommandInput = inputs.itemById(BIN_BASE_LENGTH_UNIT_INPUT_ID)
@@ -901,7 +897,6 @@ def generateBin(args: adsk.core.CommandEventArgs):
         newCmpOcc.component.name = binName
         newCmpOcc.activate()
         gridfinityBinComponent: adsk.fusion.Component = newCmpOcc.component
-        features: adsk.fusion.Features = gridfinityBinComponent.features
 
         # create base interface
         baseGeneratorInput = BaseGeneratorInput()
@@ -919,15 +914,7 @@ def generateBin(args: adsk.core.CommandEventArgs):
         baseGeneratorInput.screwHolesDiameter = bin_screw_hole_diameter.value
         baseGeneratorInput.magnetCutoutsDiameter = bin_magnet_cutout_diameter.value
         baseGeneratorInput.magnetCutoutsDepth = bin_magnet_cutout_depth.value
-
-        baseBodies: list[adsk.fusion.BRepBody]
-        if bin_generate_base.value:
-            baseBodies = createBaseBodyPattern(
-                baseGeneratorInput,
-                bin_width.value,
-                bin_length.value,
-                gridfinityBinComponent,
-            )
+        baseGeneratorInput.fidelity = fidelity
 
         # create bin body
         binBodyInput = BinBodyGeneratorInput()
@@ -945,13 +932,15 @@ def generateBin(args: adsk.core.CommandEventArgs):
         binBodyInput.wallThickness = bin_wall_thickness.value
         binBodyInput.hasScoop = has_scoop.value and isHollow
         binBodyInput.scoopMaxRadius = binScoopMaxRadius.value
-        binBodyInput.hasTab = hasTabInput.value and isHollow
+        # shelled bins get a single tab added after shelling
+        binBodyInput.hasTab = hasTabInput.value and not isSolid
         binBodyInput.tabLength = binTabLength.value
         binBodyInput.tabWidth = binTabWidth.value
         binBodyInput.tabPosition = binTabPosition.value
         binBodyInput.tabOverhangAngle = binTabAngle.value
         binBodyInput.compartmentsByX = compartmentsX.value
         binBodyInput.compartmentsByY = compartmentsY.value
+        binBodyInput.fidelity = fidelity
 
         if binCompartmentGridTypeDropdownInput.selectedItem.name == BIN_COMPARTMENTS_GRID_TYPE_UNIFORM:
             binBodyInput.compartments = uniformCompartments(binBodyInput.compartmentsByX, binBodyInput.compartmentsByY)
@@ -965,83 +954,35 @@ def generateBin(args: adsk.core.CommandEventArgs):
                 depth: adsk.core.ValueCommandInput = binCompartmentsTable.getInputAtPosition(i, 4)
                 binBodyInput.compartments.append(BinBodyCompartmentDefinition(positionX.value, positionY.value, width.value, length.value, depth.value))
 
-        binBody: adsk.fusion.BRepBody
-
-        if bin_generate_body.value:
-            binBody = createGridfinityBinBody(
-                binBodyInput,
-                gridfinityBinComponent,
-            )
-        if bin_generate_body.value or bin_generate_base.value:
-            cutBaseClearance(
-                baseGeneratorInput,
-                bin_width.value,
-                bin_length.value,
-                gridfinityBinComponent,
-            )
-
-        # merge everything
-        if bin_generate_body.value and bin_generate_base.value:
-            toolBodies = commonUtils.objectCollectionFromList(baseBodies)
-            combineFeatures = gridfinityBinComponent.features.combineFeatures
-            combineFeatureInput = combineFeatures.createInput(binBody, toolBodies)
-            combineFeatures.add(combineFeatureInput)
-            gridfinityBinComponent.bRepBodies.item(0).name = binName
-
-        if isShelled and bin_generate_body.value:
-            # face.boundingBox.maxPoint.z ~ face.boundingBox.minPoint.z => face horizontal
-            # largest horizontal face
-            horizontalFaces = [face for face in binBody.faces if geometryUtils.isHorizontal(face)]
-            topFace = faceUtils.maxByArea(horizontalFaces)
-            topFaceMinPoint = topFace.boundingBox.minPoint
-            if binBodyInput.hasLip:
-                splitBodyFeatures = features.splitBodyFeatures
-                splitBodyInput = splitBodyFeatures.createInput(
-                    binBody,
-                    topFace,
-                    True
-                )
-                splitBodies = splitBodyFeatures.add(splitBodyInput)
-                bottomBody = min(splitBodies.bodies, key=lambda x: x.boundingBox.minPoint.z)
-                topBody = max(splitBodies.bodies, key=lambda x: x.boundingBox.minPoint.z)
-                horizontalFaces = [face for face in bottomBody.faces if geometryUtils.isHorizontal(face)]
-                topFace = faceUtils.maxByArea(horizontalFaces)
-                shellUtils.simpleShell([topFace], binBodyInput.wallThickness - xyClearance, gridfinityBinComponent)
-                toolBodies = adsk.core.ObjectCollection.create()
-                toolBodies.add(topBody)
-                combineAfterShellFeatureInput = combineFeatures.createInput(bottomBody, toolBodies)
-                combineFeatures.add(combineAfterShellFeatureInput)
-                binBody = gridfinityBinComponent.bRepBodies.item(0)
+        binGeneratorInput = BinGeneratorInput()
+        binGeneratorInput.baseGeneratorInput = baseGeneratorInput
+        binGeneratorInput.binBodyGeneratorInput = binBodyInput
+        binGeneratorInput.hasBase = bin_generate_base.value
+        binGeneratorInput.hasBody = bin_generate_body.value
+        binGeneratorInput.isShelled = isShelled
+        stages = BinStages(binGeneratorInput, reuseStages)
+
+        with futil.trace_run(binName, gridfinityBinComponent), futil.deferred_compute():
+            if isPreview:
+                createGridfinityBinPreview(binGeneratorInput, gridfinityBinComponent)
+            elif fidelity < const.GENERATOR_FIDELITY_FULL:
+                createGridfinityBin(binGeneratorInput, gridfinityBinComponent, stages)
             else:
-                shellUtils.simpleShell([topFace], binBodyInput.wallThickness - xyClearance, gridfinityBinComponent)
-            
-            if hasTabInput.value:
-                compartmentTabInput = BinBodyTabGeneratorInput()
-                tabOriginPoint = adsk.core.Point3D.create(
-                    binBodyInput.wallThickness + max(0, min(binBodyInput.tabPosition, binBodyInput.binWidth - binBodyInput.tabLength)) * binBodyInput.baseWidth,
-                    const.BIN_LIP_WALL_THICKNESS if binBodyInput.hasLip and binBodyInput.hasScoop else binBodyInput.wallThickness + binBodyInput.binLength * binBodyInput.baseLength - binBodyInput.wallThickness - binBodyInput.xyClearance * 2,
-                    (binBodyInput.binHeight - 1) * binBodyInput.heightUnit + max(0, binBodyInput.heightUnit - const.BIN_BASE_HEIGHT),
+                resultCache.generateWithResultCache(
+                    resultCache.resultCacheKey('bin', binGeneratorInput),
+                    binName,
+                    gridfinityBinComponent,
+                    lambda: createGridfinityBin(binGeneratorInput, gridfinityBinComponent, stages),
                 )
-                compartmentTabInput.origin = tabOriginPoint
-                compartmentTabInput.length = max(0, min(binBodyInput.tabLength, binBodyInput.binWidth)) * binBodyInput.baseWidth - binBodyInput.wallThickness * 2 - binBodyInput.xyClearance * 2
-                compartmentTabInput.width = binBodyInput.tabWidth
-                compartmentTabInput.overhangAngle = binBodyInput.tabOverhangAngle
-                compartmentTabInput.topClearance = const.BIN_TAB_TOP_CLEARANCE
-                tabBody = createGridfinityBinBodyTab(compartmentTabInput, gridfinityBinComponent)
-                combineInput = combineFeatures.createInput(tabBody, commonUtils.objectCollectionFromList([binBody]))
-                combineInput.operation = adsk.fusion.FeatureOperations.CutFeatureOperation
-                combineInput.isKeepToolBodies = True
-                combineFeature = combineFeatures.add(combineInput)
-                tabBodies = [body for body in combineFeature.bodies if body.faces != binBody.faces]
-                tabMainBody = max([body for body in tabBodies], key=lambda x: x.edges.count)
-                bodiesToRemove = [body for body in tabBodies if body is not tabMainBody]
-                for body in bodiesToRemove:
-                    gridfinityBinComponent.features.removeFeatures.add(body)
-                combineUtils.joinBodies(binBody, commonUtils.objectCollectionFromList([tabMainBody]), gridfinityBinComponent)
-
-        # group features in timeline
-        binGroup = des.timeline.timelineGroups.add(newCmpOcc.timelineObject.index, newCmpOcc.timelineObject.index + gridfinityBinComponent.features.count + gridfinityBinComponent.constructionPlanes.count + gridfinityBinComponent.constructionAxes.count + gridfinityBinComponent.sketches.count)
-        binGroup.name = binName
+            if binGeneratorInput.hasBody and binGeneratorInput.hasBase:
+                gridfinityBinComponent.bRepBodies.item(0).name = binName
+
+            # group features in timeline
+            with futil.span('timeline group'):
+                binGroup = des.timeline.timelineGroups.add(newCmpOcc.timelineObject.index, newCmpOcc.timelineObject.index + gridfinityBinComponent.features.count + gridfinityBinComponent.constructionPlanes.count + gridfinityBinComponent.constructionAxes.count + gridfinityBinComponent.sketches.count)
+                binGroup.name = binName
+        if not isPreview and fidelity == const.GENERATOR_FIDELITY_FULL and config.EXPORT_ENABLED:
+            meshExporter.queueMeshExport(gridfinityBinComponent, binName, generatorInputHash(binGeneratorInput))
     except UnsupportedDesignTypeException as err:
         args.executeFailed = True
         args.executeFailedMessage = 'Design type is unsupported. Projects with disabled design history are unsupported, please enable timeline feature to proceed.'
@@ -1051,4 +992,5 @@ def generateBin(args: adsk.core.CommandEventArgs):
         args.executeFailedMessage = getErrorMessage()
         futil.log(f'{CMD_NAME} Error occurred, {err}, {getErrorMessage()}')
         return False
-    return True
\ No newline at end of file
+    # reused stages have no feature history, such a bin is rebuilt on execute
+    return len(stages.reusedStages) == 0
\ No newline at end of file
@@ -0,0 +1,125 @@
+import adsk.core, adsk.fusion, traceback
+import os
+
+from ...lib import fusion360utils as futil
+from ... import config
+from ...lib.gridfinityUtils.binBatchGenerator import createGridfinityBinBatch, formatBinBatchSummary
+from ...lib.gridfinityUtils.binManifest import readBinManifest, BinManifestError
+from ...lib.gridfinityUtils import meshExporter
+from ...lib.ui.unsupportedDesignTypeException import UnsupportedDesignTypeException
+from .commandInfo import CMD_NAME
+
+app = adsk.core.Application.get()
+ui = app.userInterface
+
+
+# Local list of event handlers used to maintain a reference so
+# they are not released and garbage collected.
+local_handlers = []
+
+MANIFEST_PATH_INPUT_ID = 'manifest_path'
+MANIFEST_SELECT_INPUT_ID = 'manifest_select'
+BINS_SPACING_INPUT_ID = 'bins_spacing'
+INFO_TEXT_INPUT_ID = 'info_text'
+
+INFO_TEXT = ("Manifest lists bins using the bin generator input names, one bin per CSV row or JSON list item, "
+             "e.g. <i>binWidth, binLength, binHeight, hasLip, hasScrewHoles, compartmentsByX, count</i>. "
+             "Sizes are in mm, custom compartments are written as <i>x y w l depth</i> groups separated by ';'.")
+
+lastManifestPath = ''
+
+def getErrorMessage(text = "An unknown error occurred, please validate your inputs and try again"):
+    stackTrace = traceback.format_exc()
+    return f"{text}:<br>{stackTrace}"
+
+def showErrorInMessageBox(text = "An unknown error occurred, please validate your inputs and try again"):
+    if ui:
+        ui.messageBox(getErrorMessage(text), f"{CMD_NAME} Error")
+
+# Executed when the command is run for the first time, its button is added by the commands package.
+def start():
+    futil.log(f'{CMD_NAME} Command Start Event')
+
+
+# Function that is called when a user clicks the corresponding button in the UI.
+# This defines the contents of the command dialog and connects to the command related events.
+def command_created(args: adsk.core.CommandCreatedEventArgs):
+    futil.log(f'{CMD_NAME} Command Created Event')
+
+    args.command.setDialogInitialSize(400, 300)
+    inputs = args.command.commandInputs
+    defaultLengthUnits = app.activeProduct.unitsManager.defaultLengthUnits
+
+    inputs.addTextBoxCommandInput(INFO_TEXT_INPUT_ID, 'Info', INFO_TEXT, 4, True)
+    manifestPathInput = inputs.addStringValueInput(MANIFEST_PATH_INPUT_ID, 'Manifest', lastManifestPath)
+    manifestPathInput.isReadOnly = True
+    inputs.addBoolValueInput(MANIFEST_SELECT_INPUT_ID, 'Select manifest', False, '', False)
+    spacingInput = inputs.addValueInput(BINS_SPACING_INPUT_ID, 'Spacing between bins (mm)', defaultLengthUnits, adsk.core.ValueInput.createByReal(1))
+    spacingInput.minimumValue = 0
+    spacingInput.isMinimumInclusive = True
+
+    futil.add_handler(args.command.execute, command_execute, local_handlers=local_handlers)
+    futil.add_handler(args.command.inputChanged, command_input_changed, local_handlers=local_handlers)
+    futil.add_handler(args.command.validateInputs, command_validate_input, local_handlers=local_handlers)
+    futil.add_handler(args.command.destroy, command_destroy, local_handlers=local_handlers)
+
+
+# This event handler is called when the user clicks the OK button in the command dialog.
+def command_execute(args: adsk.core.CommandEventArgs):
+    futil.log(f'{CMD_NAME} Command Execute Event')
+    inputs = args.command.commandInputs
+    manifestPathInput: adsk.core.StringValueCommandInput = inputs.itemById(MANIFEST_PATH_INPUT_ID)
+    spacingInput: adsk.core.ValueCommandInput = inputs.itemById(BINS_SPACING_INPUT_ID)
+
+    try:
+        des = adsk.fusion.Design.cast(app.activeProduct)
+        if des.designType == 0:
+            raise UnsupportedDesignTypeException('Timeline must be enabled for the generator to work, projects with disabled design history currently are not supported')
+        entries = readBinManifest(manifestPathInput.value)
+        meshExporter.clearMeshExportQueue()
+        results = createGridfinityBinBatch(entries, des.rootComponent, spacingInput.value)
+        summary = formatBinBatchSummary(results)
+        exportResults = meshExporter.runConfiguredMeshExports()
+        if len(exportResults) > 0:
+            summary += '\n' + meshExporter.formatMeshExportSummary(exportResults)
+        futil.log(f'{CMD_NAME} {summary}')
+        ui.messageBox(summary, CMD_NAME)
+    except UnsupportedDesignTypeException as err:
+        args.executeFailed = True
+        args.executeFailedMessage = 'Design type is unsupported. Projects with disabled design history are unsupported, please enable timeline feature to proceed.'
+    except BinManifestError as err:
+        args.executeFailed = True
+        args.executeFailedMessage = f'Invalid manifest: {err}'
+    except Exception as err:
+        args.executeFailed = True
+        args.executeFailedMessage = getErrorMessage()
+        futil.log(f'{CMD_NAME} Error occurred, {err}, {getErrorMessage()}')
+
+
+# This event handler is called when the user changes anything in the command dialog.
+def command_input_changed(args: adsk.core.InputChangedEventArgs):
+    changed_input = args.input
+    global lastManifestPath
+    futil.log(f'{CMD_NAME} Input Changed Event fired from a change to {changed_input.id}')
+    if changed_input.id == MANIFEST_SELECT_INPUT_ID:
+        fileDialog = ui.createFileDialog()
+        fileDialog.title = 'Select bin manifest'
+        fileDialog.filter = 'Bin manifest (*.json;*.csv)'
+        if fileDialog.showOpen() == adsk.core.DialogResults.DialogOK:
+            lastManifestPath = fileDialog.filename
+            manifestPathInput: adsk.core.StringValueCommandInput = args.inputs.itemById(MANIFEST_PATH_INPUT_ID)
+            manifestPathInput.value = lastManifestPath
+
+
+# This event handler is called when the user interacts with any of the inputs in the dialog
+# which allows you to verify that all of the inputs are valid and enables the OK button.
+def command_validate_input(args: adsk.core.ValidateInputsEventArgs):
+    manifestPathInput: adsk.core.StringValueCommandInput = args.inputs.itemById(MANIFEST_PATH_INPUT_ID)
+    args.areInputsValid = os.path.isfile(manifestPathInput.value)
+
+
+# This event handler is called when the command terminates.
+def command_destroy(args: adsk.core.CommandEventArgs):
+    futil.log(f'{CMD_NAME} Command Destroy Event')
+    global local_handlers
+    local_handlers = []
@@ -17,5 +17,65 @@ DEBUG = True
 ADDIN_NAME = 'GridfinityGenerator'
 COMPANY_NAME = 'LevMishin'
 
+# Flag that enables per stage timing of the generators. When enabled each generation
+# writes a JSON trace into TRACE_FOLDER_PATH and a summary line into the log.
+TRACE_ENABLED = False
+TRACE_FOLDER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'traces')
+
+# Flag that enables deferred sketch compute during generation. Sketches are solved once after all
+# of their curves, constraints and dimensions are added instead of after every single one.
+DEFERRED_COMPUTE_ENABLED = True
+
+# Flag that enables reuse of identical gridfinity bases within a design. The first base
+# keeps full feature history, the following ones are copies added with a single base feature.
+BASE_BODY_CACHE_ENABLED = True
+
+# Offset construction planes shared within a component, sketches at the same height
+# relative to the same origin plane or face are placed on one plane.
+CONSTRUCTION_PLANE_REGISTRY_ENABLED = True
+
+# Sketches of tool bodies, e.g. hole cylinders and compartment cutouts, drawn without constraints and dimensions.
+# When disabled every sketch is fully constrained regardless of the policy chosen by the generator.
+GEOMETRY_ONLY_TOOL_SKETCHES_ENABLED = True
+
+# Combines of a generation planned together: joins and cuts of the same body are emitted as one
+# combine feature whenever the operations recorded between them allow it. When disabled every
+# recorded operation is a separate combine in the order it was recorded.
+# BOOLEAN_PLAN_LOG_ENABLED writes every executed plan, its operations and the combines they ended up in, into the log.
+BOOLEAN_PLANNER_ENABLED = True
+BOOLEAN_PLAN_LOG_ENABLED = False
+
+# Bodies which can't intersect a boolean target are dropped before the boolean is issued, checked
+# on cached bounding boxes: the base clearance cut only gets the bodies which reach into the clearance around the bin.
+BOUNDING_BOX_PRUNING_ENABLED = True
+
+# Reuse of unchanged bin generation stages (base pattern, body, lip, compartments, tabs, shell)
+# between consecutive detailed previews. Reused stages are added with a single base feature,
+# so a preview which reused any stage is rebuilt with full history when the command is executed.
+BIN_STAGE_CACHE_ENABLED = True
+
+# Baseplate cutter built from rows: cell cutters of a row are joined into one body and the row
+# is patterned, so the final cut uses one tool body per row instead of one per cell.
+BASEPLATE_ROW_CUTTER_ENABLED = True
+
+# Quiet period in seconds the command dialogs wait after the last input change before
+# regenerating the preview, so a burst of spinner clicks results in a single rebuild.
+PREVIEW_QUIET_PERIOD = 0.4
+
+# Mesh export of generated bins and baseplates. When enabled every created component is
+# written to EXPORT_FOLDER_PATH in each of EXPORT_FORMATS ('stl', '3mf'), unchanged ones are skipped.
+# EXPORT_MESH_REFINEMENT is one of 'low', 'medium', 'high'.
+EXPORT_ENABLED = False
+EXPORT_FOLDER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'exports')
+EXPORT_FORMATS = ['stl']
+EXPORT_MESH_REFINEMENT = 'medium'
+
+# Cache of finished bins and baseplates on disk, keyed by the hash of generator inputs.
+# A cache hit imports the stored bodies with a single base feature, so the result has
+# no parametric history. Least recently used files are removed above RESULT_CACHE_MAX_SIZE_MB.
+RESULT_CACHE_ENABLED = False
+RESULT_CACHE_FOLDER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resultCache')
+RESULT_CACHE_MAX_SIZE_MB = 200
+
 # Palettes
 sample_palette_id = f'{COMPANY_NAME}_{ADDIN_NAME}_palette_id'
\ No newline at end of file
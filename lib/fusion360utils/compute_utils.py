@@ -0,0 +1,97 @@
+import adsk.core
+from .general_utils import log
+
+# Attempt to read the deferred compute flag from parent config.
+try:
+    from ... import config
+    DEFERRED_COMPUTE_ENABLED = config.DEFERRED_COMPUTE_ENABLED
+except:
+    DEFERRED_COMPUTE_ENABLED = False
+
+_active_scope: '_DeferredCompute' = None
+
+
+class _NoopScope:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        return False
+
+
+_NOOP_SCOPE = _NoopScope()
+
+
+class _DeferredCompute:
+    def __init__(self):
+        self.sketches = []
+
+    def __enter__(self):
+        global _active_scope
+        _active_scope = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        global _active_scope
+        _active_scope = None
+        # sketches left deferred by an interrupted drawing are computed once here
+        for sketch in self.sketches:
+            try:
+                if sketch.isValid and sketch.isComputeDeferred:
+                    sketch.isComputeDeferred = False
+            except Exception as err:
+                log(f'Couldn\'t compute deferred sketch, error: {err}')
+        self.sketches = []
+        return False
+
+
+class _SketchDrawing:
+    def __init__(self, scope: _DeferredCompute, sketch):
+        self.scope = scope
+        self.sketch = sketch
+
+    def __enter__(self):
+        self.was_deferred = self.sketch.isComputeDeferred
+        if not self.was_deferred:
+            self.sketch.isComputeDeferred = True
+            self.scope.sketches.append(self.sketch)
+        return self.sketch
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        if not self.was_deferred:
+            self.sketch.isComputeDeferred = False
+            self.scope.sketches.remove(self.sketch)
+        return False
+
+
+def set_deferred_compute_enabled(enabled: bool):
+    """Overrides the DEFERRED_COMPUTE_ENABLED config flag at runtime.
+
+    Arguments:
+    enabled -- Indicates if deferred_compute should defer sketch compute.
+    """
+    global DEFERRED_COMPUTE_ENABLED
+    DEFERRED_COMPUTE_ENABLED = enabled
+
+
+def deferred_compute():
+    """Starts a generation scope in which sketches drawn inside sketch_drawing are solved once per drawing
+    instead of after every added curve, constraint and dimension. Sketches still deferred when the scope exits,
+    also on exceptions, are computed. Nested scopes join the outer one.
+    Returns a no-op context manager when deferred compute is disabled.
+    """
+    if not DEFERRED_COMPUTE_ENABLED or _active_scope is not None:
+        return _NOOP_SCOPE
+    return _DeferredCompute()
+
+
+def sketch_drawing(sketch):
+    """Defers compute of the sketch while its curves and constraints are added inside of a deferred_compute scope,
+    the sketch is computed when the block exits. Returns a no-op context manager outside of a scope.
+
+    Arguments:
+    sketch -- The sketch to draw into.
+    """
+    if _active_scope is None:
+        return _NOOP_SCOPE
+    return _SketchDrawing(_active_scope, sketch)
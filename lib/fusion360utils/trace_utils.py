@@ -0,0 +1,193 @@
+import json
+import os
+import re
+import time
+from datetime import datetime
+
+import adsk.core
+from .general_utils import log
+
+app = adsk.core.Application.get()
+
+# Attempt to read tracing flags from parent config.
+try:
+    from ... import config
+    TRACE_ENABLED = config.TRACE_ENABLED
+    TRACE_FOLDER_PATH = config.TRACE_FOLDER_PATH
+except:
+    TRACE_ENABLED = False
+    TRACE_FOLDER_PATH = ''
+
+_active_trace: '_Trace' = None
+_last_trace: dict = None
+
+
+class _NoopSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        return False
+
+
+# Shared instance returned while tracing is disabled, so instrumented code only pays for a function call.
+_NOOP_SPAN = _NoopSpan()
+
+
+def _timeline_count():
+    try:
+        return app.activeProduct.timeline.count
+    except:
+        return None
+
+
+def _features_count(component):
+    try:
+        return component.features.count
+    except:
+        return None
+
+
+def _delta(before, after):
+    if before is None or after is None:
+        return None
+    return after - before
+
+
+class _Span:
+    def __init__(self, trace: '_Trace', name: str, component):
+        self.trace = trace
+        self.name = name
+        self.component = component
+        self.children: list[_Span] = []
+        self.duration = 0.0
+        self.features = None
+        self.timeline = None
+
+    def __enter__(self):
+        parent = self.trace.stack[-1] if len(self.trace.stack) > 0 else None
+        if parent is not None:
+            parent.children.append(self)
+            if self.component is None:
+                self.component = parent.component
+        self.trace.stack.append(self)
+        self._start_features = _features_count(self.component)
+        self._start_timeline = _timeline_count()
+        self._start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.duration = time.perf_counter() - self._start_time
+        self.features = _delta(self._start_features, _features_count(self.component))
+        self.timeline = _delta(self._start_timeline, _timeline_count())
+        self.trace.stack.pop()
+        if exc_type is not None:
+            self.error = str(exc_value)
+        return False
+
+    def to_dict(self):
+        result = {
+            'name': self.name,
+            'ms': round(self.duration * 1000, 3),
+            'features': self.features,
+            'timeline': self.timeline,
+        }
+        if hasattr(self, 'error'):
+            result['error'] = self.error
+        if len(self.children) > 0:
+            result['children'] = [child.to_dict() for child in self.children]
+        return result
+
+
+class _Trace:
+    def __init__(self, name: str, component):
+        self.stack: list[_Span] = []
+        self.root = _Span(self, name, component)
+
+    def __enter__(self):
+        global _active_trace
+        self.previous_trace = _active_trace
+        _active_trace = self
+        self.root.__enter__()
+        return self.root
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        global _active_trace, _last_trace
+        self.root.__exit__(exc_type, exc_value, exc_traceback)
+        _active_trace = self.previous_trace
+        _last_trace = self.root.to_dict()
+        _last_trace['timestamp'] = datetime.now().isoformat(timespec='seconds')
+        log(format_trace_summary(_last_trace))
+        _dump_trace(_last_trace)
+        return False
+
+
+def _dump_trace(trace: dict):
+    if not TRACE_FOLDER_PATH:
+        return
+    try:
+        if not os.path.exists(TRACE_FOLDER_PATH):
+            os.makedirs(TRACE_FOLDER_PATH)
+        file_name = '{}-{}.json'.format(re.sub(r'[^\w\-]+', '_', trace['name']), datetime.now().strftime('%Y%m%d-%H%M%S-%f'))
+        with open(os.path.join(TRACE_FOLDER_PATH, file_name), 'w') as trace_file:
+            json.dump(trace, trace_file, indent=2)
+    except Exception as err:
+        log(f'Couldn\'t write trace to {TRACE_FOLDER_PATH}, error: {err}')
+
+
+def format_trace_summary(trace: dict):
+    """Formats a one line summary of a trace with its top level stages.
+
+    Arguments:
+    trace -- The trace dictionary produced by trace_run.
+    """
+    def format_span(span: dict):
+        features = '' if span['features'] is None else ', {} features'.format(span['features'])
+        return '{} {:.1f} ms{}'.format(span['name'], span['ms'], features)
+    stages = '; '.join(format_span(child) for child in trace.get('children', []))
+    return 'Trace {}{}'.format(format_span(trace), ' | ' + stages if stages else '')
+
+
+def set_tracing_enabled(enabled: bool, folder_path: str = None):
+    """Overrides the TRACE_ENABLED config flag at runtime.
+
+    Arguments:
+    enabled -- Indicates if trace_run should collect stages.
+    folder_path -- Folder to dump JSON traces into, empty string disables dumping.
+    """
+    global TRACE_ENABLED, TRACE_FOLDER_PATH
+    TRACE_ENABLED = enabled
+    if folder_path is not None:
+        TRACE_FOLDER_PATH = folder_path
+
+
+def trace_run(name: str, component = None):
+    """Starts a traced run, stages inside of it are recorded with span.
+    When the run finishes the trace is written into TRACE_FOLDER_PATH as JSON and a summary line is logged.
+    Returns a no-op context manager when tracing is disabled.
+
+    Arguments:
+    name -- A name of the run, used in the log and in the trace file name.
+    component -- Component to count added features in, can be set later by nested spans.
+    """
+    if not TRACE_ENABLED:
+        return _NOOP_SPAN
+    return _Trace(name, component)
+
+
+def span(name: str, component = None):
+    """Records wall time, added features and timeline objects of a stage of the active traced run.
+    Returns a no-op context manager outside of a traced run.
+
+    Arguments:
+    name -- A name of the stage.
+    component -- Component to count added features in, inherited from the parent stage if omitted.
+    """
+    if _active_trace is None:
+        return _NOOP_SPAN
+    return _Span(_active_trace, name, component)
+
+
+def last_trace():
+    """Returns the trace dictionary of the most recently finished run or None."""
+    return _last_trace
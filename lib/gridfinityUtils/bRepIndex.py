@@ -0,0 +1,153 @@
+import adsk.core, adsk.fusion, traceback
+import bisect
+import collections
+import math
+
+from .const import DEFAULT_FILTER_TOLERANCE
+
+# Bounding boxes and edge lengths of faces and edges, read from the API once per body revision.
+# Any modification of a body changes its revisionId, so a snapshot never outlives the geometry
+# it was taken from. Only the most recently used BREP_INDEX_MAX_BODIES snapshots are kept.
+BREP_INDEX_MAX_BODIES = 256
+# edge lengths are bucketed by rounding to this many decimal places
+EDGE_LENGTH_DIGITS = 4
+# axis of edges which are not straight lines along x, y or z
+NO_AXIS = -1
+
+class BRepEntityBox():
+    def __init__(self, box: adsk.core.BoundingBox3D):
+        self.minPoint = box.minPoint.asArray()
+        self.maxPoint = box.maxPoint.asArray()
+
+    def size(self, axis: int):
+        return self.maxPoint[axis] - self.minPoint[axis]
+
+    def isFlat(self, axis: int):
+        return abs(self.size(axis)) <= DEFAULT_FILTER_TOLERANCE
+
+    def lineAxis(self):
+        flatAxes = [axis for axis in range(3) if self.isFlat(axis)]
+        if len(flatAxes) != 2:
+            return NO_AXIS
+        return next(axis for axis in range(3) if not axis in flatAxes)
+
+class BRepEdgeIndex():
+    # edges deduplicated by temp id, length and axis buckets are built on the first query
+    # which needs them, so an axis only selection never reads edge lengths and vice versa
+    def __init__(self, edges: list[adsk.fusion.BRepEdge], bodyIndex: 'BRepBodyIndex'):
+        self.bodyIndex = bodyIndex
+        self.edges: list[adsk.fusion.BRepEdge] = []
+        visited = set()
+        for edge in edges:
+            if edge.tempId in visited:
+                continue
+            visited.add(edge.tempId)
+            self.edges.append(edge)
+        self.lengthBuckets: dict[float, list[adsk.fusion.BRepEdge]] = None
+        self.lengthKeys: list[float] = None
+        self.axisBuckets: dict[int, list[adsk.fusion.BRepEdge]] = None
+
+    def axis(self, edge: adsk.fusion.BRepEdge):
+        return self.bodyIndex.boundingBox(edge).lineAxis()
+
+    def alongAxis(self, axis: int) -> list[adsk.fusion.BRepEdge]:
+        if self.axisBuckets is None:
+            self.axisBuckets = {}
+            for edge in self.edges:
+                self.axisBuckets.setdefault(self.axis(edge), []).append(edge)
+        return self.axisBuckets.get(axis, [])
+
+    def byLength(self, length: float, tolerance: float, axis: int = None) -> list[adsk.fusion.BRepEdge]:
+        if self.lengthBuckets is None:
+            self.lengthBuckets = {}
+            for edge in self.edges:
+                self.lengthBuckets.setdefault(round(self.bodyIndex.length(edge), EDGE_LENGTH_DIGITS), []).append(edge)
+            self.lengthKeys = sorted(self.lengthBuckets.keys())
+        # rounded keys can be up to half a bucket away from the actual length
+        margin = tolerance + 10 ** -EDGE_LENGTH_DIGITS
+        edges: list[adsk.fusion.BRepEdge] = []
+        for lengthKey in self.lengthKeys[bisect.bisect_left(self.lengthKeys, length - margin):bisect.bisect_right(self.lengthKeys, length + margin)]:
+            edges += [
+                edge for edge in self.lengthBuckets[lengthKey]
+                if math.isclose(self.bodyIndex.length(edge), length, abs_tol=tolerance) and (axis is None or self.axis(edge) == axis)
+            ]
+        return edges
+
+class BRepBodyIndex():
+    def __init__(self):
+        self.boxes: dict[tuple, BRepEntityBox] = {}
+        self.lengths: dict[int, float] = {}
+        self.edges: BRepEdgeIndex = None
+        self.bodyBox: BRepEntityBox = None
+
+    def boundingBox(self, entity: adsk.core.Base) -> BRepEntityBox:
+        # faces and edges have independent temp ids
+        key = (type(entity), entity.tempId)
+        if not key in self.boxes:
+            self.boxes[key] = BRepEntityBox(entity.boundingBox)
+        return self.boxes[key]
+
+    def length(self, edge: adsk.fusion.BRepEdge) -> float:
+        key = edge.tempId
+        if not key in self.lengths:
+            self.lengths[key] = edge.length
+        return self.lengths[key]
+
+    def edgeIndex(self, body: adsk.fusion.BRepBody) -> BRepEdgeIndex:
+        if self.edges is None:
+            self.edges = BRepEdgeIndex(body.edges, self)
+        return self.edges
+
+_indexes: collections.OrderedDict[str, BRepBodyIndex] = collections.OrderedDict()
+
+def bodyIndex(body: adsk.fusion.BRepBody) -> BRepBodyIndex:
+    revisionId = body.revisionId if body is not None else None
+    if not revisionId:
+        # temporary bodies have no revision to key on
+        return BRepBodyIndex()
+    index = _indexes.get(revisionId)
+    if index is None:
+        index = BRepBodyIndex()
+        _indexes[revisionId] = index
+        if len(_indexes) > BREP_INDEX_MAX_BODIES:
+            _indexes.popitem(last=False)
+    else:
+        _indexes.move_to_end(revisionId)
+    return index
+
+def boundingBox(entity: adsk.core.Base) -> BRepEntityBox:
+    return bodyIndex(entity.body).boundingBox(entity)
+
+def bodyBoundingBox(body: adsk.fusion.BRepBody) -> BRepEntityBox:
+    index = bodyIndex(body)
+    if index.bodyBox is None:
+        index.bodyBox = BRepEntityBox(body.boundingBox)
+    return index.bodyBox
+
+def edgeLength(edge: adsk.fusion.BRepEdge) -> float:
+    return bodyIndex(edge.body).length(edge)
+
+def isFlat(entity: adsk.core.Base, *axes: int):
+    box = boundingBox(entity)
+    return all(box.isFlat(axis) for axis in axes)
+
+def edgeIndexes(faces: list[adsk.fusion.BRepFace]) -> list[BRepEdgeIndex]:
+    # one index per body, faces covering a whole body use the cached index of its revision
+    facesByBody: dict[str, tuple[adsk.fusion.BRepBody, list[adsk.fusion.BRepFace]]] = {}
+    for face in faces:
+        body = face.body
+        key = body.revisionId
+        if not key in facesByBody:
+            facesByBody[key] = (body, [])
+        facesByBody[key][1].append(face)
+    indexes: list[BRepEdgeIndex] = []
+    for (body, bodyFaces) in facesByBody.values():
+        index = bodyIndex(body)
+        if len(bodyFaces) == body.faces.count:
+            indexes.append(index.edgeIndex(body))
+        else:
+            indexes.append(BRepEdgeIndex([edge for face in bodyFaces for edge in face.edges], index))
+    return indexes
+
+def clearBRepIndex():
+    _indexes.clear()
@@ -0,0 +1,69 @@
+import adsk.core, adsk.fusion, traceback
+import collections
+
+from .baseGeneratorInput import BaseGeneratorInput
+from . import temporaryShapeUtils
+
+# Template base bodies stored as temporary b-rep copies, keyed by design and base parameters.
+# The first base of a kind in a design is built with the full feature history,
+# every next one is stamped from the stored copy with a single base feature.
+# Only the most recently used BASE_BODY_CACHE_MAX_TEMPLATES templates are kept, so copies
+# stored for designs which were closed since are dropped instead of living for the whole session.
+BASE_BODY_CACHE_MAX_TEMPLATES = 32
+
+_templates: collections.OrderedDict[tuple, tuple[adsk.fusion.BRepBody, float]] = collections.OrderedDict()
+
+def _round(value: float):
+    return round(value, 6)
+
+def baseBodyCacheKey(input: BaseGeneratorInput, targetComponent: adsk.fusion.Component):
+    # screw holes and the cutouts pattern axis are placed relative to the component origin,
+    # so only bases with the same xy origin are identical, z offset is applied on stamping
+    return (
+        targetComponent.parentDesign.rootComponent.id,
+        _round(input.originPoint.x),
+        _round(input.originPoint.y),
+        _round(input.baseWidth),
+        _round(input.baseLength),
+        _round(input.cornerFilletRadius),
+        _round(input.xyClearance),
+        input.hasBottomChamfer,
+        input.hasScrewHoles,
+        _round(input.screwHolesDiameter) if input.hasScrewHoles else None,
+        input.hasMagnetCutouts,
+        input.hasMagnetCutoutsTabs if input.hasMagnetCutouts else None,
+        _round(input.magnetCutoutsDiameter) if input.hasMagnetCutouts else None,
+        _round(input.magnetCutoutsDepth) if input.hasMagnetCutouts else None,
+        input.fidelity,
+    )
+
+def storeBaseBody(
+    input: BaseGeneratorInput,
+    baseBody: adsk.fusion.BRepBody,
+    targetComponent: adsk.fusion.Component,
+):
+    temporaryBRep = adsk.fusion.TemporaryBRepManager.get()
+    key = baseBodyCacheKey(input, targetComponent)
+    _templates[key] = (temporaryBRep.copy(baseBody), input.originPoint.z)
+    _templates.move_to_end(key)
+    if len(_templates) > BASE_BODY_CACHE_MAX_TEMPLATES:
+        _templates.popitem(last=False)
+
+def stampBaseBody(
+    input: BaseGeneratorInput,
+    targetComponent: adsk.fusion.Component,
+) -> adsk.fusion.BRepBody:
+    key = baseBodyCacheKey(input, targetComponent)
+    template = _templates.get(key)
+    if template is None:
+        return None
+    _templates.move_to_end(key)
+    templateBody, templateZ = template
+
+    bodyCopy = temporaryShapeUtils.translatedCopy(templateBody, byZ=input.originPoint.z - templateZ)
+    baseBody = temporaryShapeUtils.addToComponent([bodyCopy], 'Base copy', targetComponent)[0]
+    baseBody.name = 'Base'
+    return baseBody
+
+def clearBaseBodyCache():
+    _templates.clear()
@@ -3,7 +3,7 @@ import os
 
 from .sketchUtils import createRectangle
 from ...lib.gridfinityUtils.baseGeneratorInput import BaseGeneratorInput
-from . import sketchUtils, const, edgeUtils, commonUtils, combineUtils, faceUtils, extrudeUtils, shapeUtils, geometryUtils
+from . import sketchUtils, const, edgeUtils, commonUtils, combineUtils, faceUtils, extrudeUtils, shapeUtils, geometryUtils, baseBodyCache, constructionPlaneRegistry, bodySpatialIndex
 from ...lib import fusion360utils as futil
 from ... import config
 
@@ -15,35 +15,39 @@ def createCircleAtPointSketch(
     radius: float,
     circleCenterPoint: adsk.core.Point3D,
     targetComponent: adsk.fusion.Component,
+    policy: str = const.SKETCH_POLICY_CONSTRAINED,
 ):
     sketches: adsk.fusion.Sketches = targetComponent.sketches
     circleSketch: adsk.fusion.Sketch = sketches.add(plane)
-    circleCenterOnSketch = circleSketch.modelToSketchSpace(circleCenterPoint)
-    dimensions: adsk.fusion.SketchDimensions = circleSketch.sketchDimensions
-    sketchUtils.convertToConstruction(circleSketch.sketchCurves)
-    circle = circleSketch.sketchCurves.sketchCircles.addByCenterRadius(
-        adsk.core.Point3D.create(circleCenterOnSketch.x, circleCenterOnSketch.y, 0),
-        radius,
-    )
-    dimensions.addDiameterDimension(
-        circle,
-        adsk.core.Point3D.create(0, circle.centerSketchPoint.geometry.y * 2, 0),
-        True,
-    )
-    dimensions.addDistanceDimension(
-        circleSketch.originPoint,
-        circle.centerSketchPoint,
-        adsk.fusion.DimensionOrientations.HorizontalDimensionOrientation,
-        adsk.core.Point3D.create(circle.centerSketchPoint.geometry.x, 0, 0),
-        True
+    with futil.sketch_drawing(circleSketch):
+        circleCenterOnSketch = circleSketch.modelToSketchSpace(circleCenterPoint)
+        dimensions: adsk.fusion.SketchDimensions = circleSketch.sketchDimensions
+        sketchUtils.convertToConstruction(circleSketch.sketchCurves)
+        circle = circleSketch.sketchCurves.sketchCircles.addByCenterRadius(
+            adsk.core.Point3D.create(circleCenterOnSketch.x, circleCenterOnSketch.y, 0),
+            radius,
         )
-    dimensions.addDistanceDimension(
-        circleSketch.originPoint,
-        circle.centerSketchPoint,
-        adsk.fusion.DimensionOrientations.VerticalDimensionOrientation,
-        adsk.core.Point3D.create(0, circle.centerSketchPoint.geometry.y, 0),
-        True
+        if not sketchUtils.isConstrained(policy):
+            return (circleSketch, circle)
+        dimensions.addDiameterDimension(
+            circle,
+            adsk.core.Point3D.create(0, circle.centerSketchPoint.geometry.y * 2, 0),
+            True,
         )
+        dimensions.addDistanceDimension(
+            circleSketch.originPoint,
+            circle.centerSketchPoint,
+            adsk.fusion.DimensionOrientations.HorizontalDimensionOrientation,
+            adsk.core.Point3D.create(circle.centerSketchPoint.geometry.x, 0, 0),
+            True
+            )
+        dimensions.addDistanceDimension(
+            circleSketch.originPoint,
+            circle.centerSketchPoint,
+            adsk.fusion.DimensionOrientations.VerticalDimensionOrientation,
+            adsk.core.Point3D.create(0, circle.centerSketchPoint.geometry.y, 0),
+            True
+            )
 
     return (circleSketch, circle)
 
@@ -52,75 +56,110 @@ def createTabAtCircleEdgeSketch(
     radius: float,
     circleCenterPoint: adsk.core.Point3D,
     targetComponent: adsk.fusion.Component,
+    policy: str = const.SKETCH_POLICY_CONSTRAINED,
 ):
     circleSketch, circle = createCircleAtPointSketch(
         plane,
         radius,
         circleCenterPoint,
         targetComponent,
+        policy,
     )
     circleCenterOnSketch = geometryUtils.pointToXY(circleSketch.modelToSketchSpace(circleCenterPoint))
     angularPointOnSketch = geometryUtils.pointToXY(circleSketch.modelToSketchSpace(
         adsk.core.Point3D.create(circleCenterPoint.x + radius, circleCenterPoint.y + radius, circleCenterPoint.z)
     ))
-    dimensions: adsk.fusion.SketchDimensions = circleSketch.sketchDimensions
-    constraints: adsk.fusion.GeometricConstraints = circleSketch.geometricConstraints
-    sketchUtils.convertToConstruction(circleSketch.sketchCurves)
-    verticalConstructionLine = circleSketch.sketchCurves.sketchLines.addByTwoPoints(
-        circleCenterOnSketch,
-        adsk.core.Point3D.create(circleCenterOnSketch.x, circleCenterOnSketch.y + radius, circleCenterOnSketch.z)
-    )
-    verticalConstructionLine.isConstruction = True
-    diagonalConstructionLine = circleSketch.sketchCurves.sketchLines.addByTwoPoints(
-        circleCenterOnSketch,
-        angularPointOnSketch,
-    )
-    diagonalConstructionLine.isConstruction = True
-    constraints.addVertical(verticalConstructionLine)
-    dimensions.addAngularDimension(
-        diagonalConstructionLine,
-        verticalConstructionLine,
-        angularPointOnSketch,
-    )
-    constraints.addCoincident(
-        verticalConstructionLine.startSketchPoint,
-        circle.centerSketchPoint,
-    )
-    constraints.addCoincident(
-        verticalConstructionLine.endSketchPoint,
-        circle,
-    )
-    constraints.addCoincident(
-        diagonalConstructionLine.startSketchPoint,
-        circle.centerSketchPoint,
-    )
-    constraints.addCoincident(
-        diagonalConstructionLine.endSketchPoint,
-        circle,
-    )
-    circle = circleSketch.sketchCurves.sketchCircles.addByCenterRadius(
-        diagonalConstructionLine.endSketchPoint,
-        radius / 2,
-    )
-    dimensions.addRadialDimension(
-        circle,
-        circleCenterOnSketch,
-    )
+    with futil.sketch_drawing(circleSketch):
+        dimensions: adsk.fusion.SketchDimensions = circleSketch.sketchDimensions
+        constraints: adsk.fusion.GeometricConstraints = circleSketch.geometricConstraints
+        sketchUtils.convertToConstruction(circleSketch.sketchCurves)
+        if not sketchUtils.isConstrained(policy):
+            # tab center where the diagonal construction line would meet the circle
+            diagonal = circleCenterOnSketch.vectorTo(angularPointOnSketch)
+            diagonal.normalize()
+            diagonal.scaleBy(radius)
+            tabCenterOnSketch = circleCenterOnSketch.copy()
+            tabCenterOnSketch.translateBy(diagonal)
+            circleSketch.sketchCurves.sketchCircles.addByCenterRadius(tabCenterOnSketch, radius / 2)
+            return circleSketch
+        verticalConstructionLine = circleSketch.sketchCurves.sketchLines.addByTwoPoints(
+            circleCenterOnSketch,
+            adsk.core.Point3D.create(circleCenterOnSketch.x, circleCenterOnSketch.y + radius, circleCenterOnSketch.z)
+        )
+        verticalConstructionLine.isConstruction = True
+        diagonalConstructionLine = circleSketch.sketchCurves.sketchLines.addByTwoPoints(
+            circleCenterOnSketch,
+            angularPointOnSketch,
+        )
+        diagonalConstructionLine.isConstruction = True
+        constraints.addVertical(verticalConstructionLine)
+        dimensions.addAngularDimension(
+            diagonalConstructionLine,
+            verticalConstructionLine,
+            angularPointOnSketch,
+        )
+        constraints.addCoincident(
+            verticalConstructionLine.startSketchPoint,
+            circle.centerSketchPoint,
+        )
+        constraints.addCoincident(
+            verticalConstructionLine.endSketchPoint,
+            circle,
+        )
+        constraints.addCoincident(
+            diagonalConstructionLine.startSketchPoint,
+            circle.centerSketchPoint,
+        )
+        constraints.addCoincident(
+            diagonalConstructionLine.endSketchPoint,
+            circle,
+        )
+        circle = circleSketch.sketchCurves.sketchCircles.addByCenterRadius(
+            diagonalConstructionLine.endSketchPoint,
+            radius / 2,
+        )
+        dimensions.addRadialDimension(
+            circle,
+            circleCenterOnSketch,
+        )
 
     return circleSketch
 
 def createSingleGridfinityBaseBody(
     input: BaseGeneratorInput,
     targetComponent: adsk.fusion.Component,
+):
+    if config.BASE_BODY_CACHE_ENABLED:
+        baseBody = baseBodyCache.stampBaseBody(input, targetComponent)
+        if not baseBody is None:
+            return baseBody
+    baseBody = buildSingleGridfinityBaseBody(input, targetComponent)
+    if config.BASE_BODY_CACHE_ENABLED:
+        baseBodyCache.storeBaseBody(input, baseBody, targetComponent)
+    return baseBody
+
+def buildSingleGridfinityBaseBody(
+    input: BaseGeneratorInput,
+    targetComponent: adsk.fusion.Component,
+):
+    baseBody, baseBottomPlane = createChamferedBaseProfile(input, targetComponent)
+    cutBaseHoles(input, baseBody, baseBottomPlane, targetComponent)
+    return baseBody
+
+def createChamferedBaseProfile(
+    input: BaseGeneratorInput,
+    targetComponent: adsk.fusion.Component,
 ):
     actual_base_width = input.baseWidth
     actual_base_length = input.baseLength
     features: adsk.fusion.Features = targetComponent.features
     extrudeFeatures: adsk.fusion.ExtrudeFeatures = features.extrudeFeatures
-    baseConstructionPlaneInput: adsk.fusion.ConstructionPlaneInput = targetComponent.constructionPlanes.createInput()
-    baseConstructionPlaneInput.setByOffset(targetComponent.xYConstructionPlane, adsk.core.ValueInput.createByReal(input.originPoint.z))
-    baseConstructionPlane = targetComponent.constructionPlanes.add(baseConstructionPlaneInput)
-    baseConstructionPlane.name = 'Base plate construction plane'
+    baseConstructionPlane = constructionPlaneRegistry.offsetPlane(
+        targetComponent.xYConstructionPlane,
+        input.originPoint.z,
+        targetComponent,
+        'Base plate construction plane',
+    )
     # create rectangle for the base
     sketches: adsk.fusion.Sketches = targetComponent.sketches
     basePlateSketch: adsk.fusion.Sketch = sketches.add(baseConstructionPlane)
@@ -140,24 +179,25 @@ def createSingleGridfinityBaseBody(
     baseBody = topSectionExtrudeFeature.bodies.item(0)
     baseBody.name = 'Base'
 
-    # fillet on corners
-    filletFeatures: adsk.fusion.FilletFeatures = features.filletFeatures
-    filletInput = filletFeatures.createInput()
-    filletInput.isRollingBallCorner = True
-    fillet_edges = edgeUtils.selectEdgesByLength(baseBody.faces, const.BIN_BASE_TOP_SECTION_HEIGH, const.DEFAULT_FILTER_TOLERANCE)
-    filletInput.edgeSetInputs.addConstantRadiusEdgeSet(fillet_edges, adsk.core.ValueInput.createByReal(input.cornerFilletRadius), True)
-    filletFeatures.add(filletInput).name = 'Base corner fillet'
-
-    # chamfer top section
-    chamferFeatures: adsk.fusion.ChamferFeatures = features.chamferFeatures
-    chamferInput = chamferFeatures.createInput2()
-    chamfer_edges = adsk.core.ObjectCollection.create()
-    # use one edge for chamfer, the rest will be automatically detected with tangent chain condition
-    chamfer_edges.add(topSectionExtrudeFeature.endFaces.item(0).edges.item(0))
-    chamferInput.chamferEdgeSets.addEqualDistanceChamferEdgeSet(chamfer_edges,
-        topSectionExtrudeDepth,
-        True)
-    chamferFeatures.add(chamferInput)
+    if input.fidelity >= const.GENERATOR_FIDELITY_STANDARD:
+        # fillet on corners
+        filletFeatures: adsk.fusion.FilletFeatures = features.filletFeatures
+        filletInput = filletFeatures.createInput()
+        filletInput.isRollingBallCorner = True
+        fillet_edges = edgeUtils.selectEdgesByLength(baseBody.faces, const.BIN_BASE_TOP_SECTION_HEIGH, const.DEFAULT_FILTER_TOLERANCE)
+        filletInput.edgeSetInputs.addConstantRadiusEdgeSet(fillet_edges, adsk.core.ValueInput.createByReal(input.cornerFilletRadius), True)
+        filletFeatures.add(filletInput).name = 'Base corner fillet'
+
+        # chamfer top section
+        chamferFeatures: adsk.fusion.ChamferFeatures = features.chamferFeatures
+        chamferInput = chamferFeatures.createInput2()
+        chamfer_edges = adsk.core.ObjectCollection.create()
+        # use one edge for chamfer, the rest will be automatically detected with tangent chain condition
+        chamfer_edges.add(topSectionExtrudeFeature.endFaces.item(0).edges.item(0))
+        chamferInput.chamferEdgeSets.addEqualDistanceChamferEdgeSet(chamfer_edges,
+            topSectionExtrudeDepth,
+            True)
+        chamferFeatures.add(chamferInput)
 
     # extrude mid/bottom section
     baseBottomExtrude = extrudeUtils.simpleDistanceExtrude(
@@ -169,7 +209,7 @@ def createSingleGridfinityBaseBody(
         targetComponent
     )
 
-    if input.hasBottomChamfer:
+    if input.hasBottomChamfer and input.fidelity >= const.GENERATOR_FIDELITY_STANDARD:
         # chamfer bottom section
         chamferFeatures: adsk.fusion.ChamferFeatures = features.chamferFeatures
         chamferInput = chamferFeatures.createInput2()
@@ -179,11 +219,19 @@ def createSingleGridfinityBaseBody(
             True)
         chamferFeatures.add(chamferInput)
     
+    return (baseBody, baseBottomExtrude.endFaces.item(0))
+
+def cutBaseHoles(
+    input: BaseGeneratorInput,
+    baseBody: adsk.fusion.BRepBody,
+    baseBottomPlane: adsk.fusion.BRepFace,
+    targetComponent: adsk.fusion.Component,
+):
+    features: adsk.fusion.Features = targetComponent.features
     # screw holes
     circularPatternFeatures = features.circularPatternFeatures
     cutoutBodies = adsk.core.ObjectCollection.create()
 
-    baseBottomPlane = baseBottomExtrude.endFaces.item(0)
     baseHoleCenterPoint = adsk.core.Point3D.create(
         const.DIMENSION_SCREW_HOLES_OFFSET - input.xyClearance,
         const.DIMENSION_SCREW_HOLES_OFFSET - input.xyClearance,
@@ -198,6 +246,7 @@ def createSingleGridfinityBaseBody(
             input.screwHolesDiameter / 2,
             cutoutCenterPoint,
             targetComponent,
+            const.SKETCH_POLICY_GEOMETRY_ONLY,
         )
         cutoutBodies.add(screwHoleBody)
 
@@ -210,6 +259,7 @@ def createSingleGridfinityBaseBody(
             input.magnetCutoutsDiameter / 2,
             cutoutCenterPoint,
             targetComponent,
+            const.SKETCH_POLICY_GEOMETRY_ONLY,
         )
         cutoutBodies.add(magnetSocketBody)
 
@@ -220,6 +270,7 @@ def createSingleGridfinityBaseBody(
                 input.magnetCutoutsDiameter / 2,
                 cutoutCenterPoint,
                 targetComponent,
+                const.SKETCH_POLICY_GEOMETRY_ONLY,
             )
             magnetTabCutoutSketch.name = "Cutout tab sketch"
 
@@ -233,7 +284,8 @@ def createSingleGridfinityBaseBody(
             )
             cutoutBodies.add(magnetTabCutoutExtrude.bodies.item(0))
         
-        if input.hasScrewHoles and (const.BIN_BASE_HEIGHT - input.magnetCutoutsDepth) > const.BIN_MAGNET_HOLE_GROOVE_DEPTH:
+        # print helper grooves
+        if input.hasScrewHoles and (const.BIN_BASE_HEIGHT - input.magnetCutoutsDepth) > const.BIN_MAGNET_HOLE_GROOVE_DEPTH and input.fidelity >= const.GENERATOR_FIDELITY_FULL:
             grooveBody = shapeUtils.simpleCylinder(
                 baseBottomPlane,
                 -input.magnetCutoutsDepth,
@@ -241,6 +293,7 @@ def createSingleGridfinityBaseBody(
                 input.magnetCutoutsDiameter / 2,
                 cutoutCenterPoint,
                 targetComponent,
+                const.SKETCH_POLICY_GEOMETRY_ONLY,
             )
             grooveBody.name = "Groove body"
             grooveLayer1 = shapeUtils.simpleBox(
@@ -251,6 +304,7 @@ def createSingleGridfinityBaseBody(
                 -const.BIN_MAGNET_HOLE_GROOVE_DEPTH / 2,
                 adsk.core.Point3D.create(baseHoleCenterPoint.x + input.magnetCutoutsDiameter / 2, baseHoleCenterPoint.y - input.screwHolesDiameter / 2, 0),
                 targetComponent,
+                const.SKETCH_POLICY_GEOMETRY_ONLY,
             )
             grooveLayer1.name = "Groove layer 1 body"
             grooveLayer2 = shapeUtils.simpleBox(
@@ -261,6 +315,7 @@ def createSingleGridfinityBaseBody(
                 -const.BIN_MAGNET_HOLE_GROOVE_DEPTH / 2,
                 adsk.core.Point3D.create(baseHoleCenterPoint.x + input.screwHolesDiameter / 2, baseHoleCenterPoint.y - input.screwHolesDiameter / 2, 0),
                 targetComponent,
+                const.SKETCH_POLICY_GEOMETRY_ONLY,
             )
             grooveLayer2.name = "Groove layer 2 body"
             combineUtils.intersectBody(grooveBody, commonUtils.objectCollectionFromList([grooveLayer1, grooveLayer2]), targetComponent)
@@ -281,15 +336,9 @@ def createSingleGridfinityBaseBody(
             joinFeature = combineUtils.joinBodies(cutoutBodies.item(0), commonUtils.objectCollectionFromList(list(cutoutBodies)[1:]), targetComponent)
             cutoutBodies = commonUtils.objectCollectionFromList(joinFeature.bodies)
 
-        baseXZMidPlaneInput = targetComponent.constructionPlanes.createInput()
-        baseXZMidPlaneInput.setByOffset(targetComponent.xZConstructionPlane, adsk.core.ValueInput.createByReal(input.baseLength / 2 - input.xyClearance))
-        baseXZMidPlane = targetComponent.constructionPlanes.add(baseXZMidPlaneInput)
-        baseXZMidPlane.name = "Base XZ mid plane"
+        baseXZMidPlane = constructionPlaneRegistry.offsetPlane(targetComponent.xZConstructionPlane, input.baseLength / 2 - input.xyClearance, targetComponent, "Base XZ mid plane")
         baseXZMidPlane.isLightBulbOn = False
-        baseYZMidPlaneInput = targetComponent.constructionPlanes.createInput()
-        baseYZMidPlaneInput.setByOffset(targetComponent.yZConstructionPlane, adsk.core.ValueInput.createByReal(input.baseWidth / 2 - input.xyClearance))
-        baseYZMidPlane = targetComponent.constructionPlanes.add(baseYZMidPlaneInput)
-        baseYZMidPlane.name = "Base YZ mid plane"
+        baseYZMidPlane = constructionPlaneRegistry.offsetPlane(targetComponent.yZConstructionPlane, input.baseWidth / 2 - input.xyClearance, targetComponent, "Base YZ mid plane")
         baseYZMidPlane.isLightBulbOn = False
         patternAxisInput = targetComponent.constructionAxes.createInput()
         patternAxisInput.setByTwoPlanes(
@@ -362,6 +411,7 @@ def createSingleBaseBodyWithClearance(input: BaseGeneratorInput, targetComponent
         -const.BIN_BASE_HEIGHT,
         targetComponent,
         adsk.core.Point3D.create(input.originPoint.x - input.xyClearance, input.originPoint.y - input.xyClearance, input.originPoint.z),
+        const.SKETCH_POLICY_GEOMETRY_ONLY,
         )
     clearanceBoundingBox.name = "clearance bounding box"
     clearanceBoundingBox.bodies.item(0).name = "clearance bounding box"
@@ -405,40 +455,28 @@ def cutBaseClearance(
 ):
     actual_base_width = baseConfiguration.baseWidth * basesXCount - baseConfiguration.xyClearance * 2
     actual_base_length = baseConfiguration.baseLength * basesYCount - baseConfiguration.xyClearance * 2
+    participantBodies = baseClearanceParticipants(baseConfiguration, actual_base_width, actual_base_length, targetComponent)
+    if len(participantBodies) == 0:
+        return
     features = targetComponent.features
-    baseConstructionPlaneInput: adsk.fusion.ConstructionPlaneInput = targetComponent.constructionPlanes.createInput()
-    baseConstructionPlaneInput.setByOffset(targetComponent.xYConstructionPlane, adsk.core.ValueInput.createByReal(baseConfiguration.originPoint.z))
-    baseConstructionPlane = targetComponent.constructionPlanes.add(baseConstructionPlaneInput)
+    baseConstructionPlane = constructionPlaneRegistry.offsetPlane(targetComponent.xYConstructionPlane, baseConfiguration.originPoint.z, targetComponent)
     sketches: adsk.fusion.Sketches = targetComponent.sketches
     baseClearanceCutSketch: adsk.fusion.Sketch = sketches.add(baseConstructionPlane)
     baseClearanceCutSketch.name = "Base clearance cut sketch"
-    innerRectangle = createRectangle(
-        actual_base_width,
-        actual_base_length,
-        adsk.core.Point3D.create(
-            baseConfiguration.originPoint.x + baseConfiguration.xyClearance,
-            baseConfiguration.originPoint.y + baseConfiguration.xyClearance,
-            baseConfiguration.originPoint.z,
-        ),
-        baseClearanceCutSketch
-    )
-    sketchArcs = baseClearanceCutSketch.sketchCurves.sketchArcs
-    geometricConstraints = baseClearanceCutSketch.geometricConstraints
-    sketchDimensions = baseClearanceCutSketch.sketchDimensions
-
-    [side1, side2, side3, side4] = list(innerRectangle)
-    filletRadius = baseConfiguration.cornerFilletRadius - baseConfiguration.xyClearance
-    fillet1 = sketchArcs.addFillet(side1, side1.endSketchPoint.geometry, side2, side2.startSketchPoint.geometry, filletRadius)
-    fillet2 = sketchArcs.addFillet(side2, side2.endSketchPoint.geometry, side3, side3.startSketchPoint.geometry, filletRadius)
-    fillet3 = sketchArcs.addFillet(side3, side3.endSketchPoint.geometry, side4, side4.startSketchPoint.geometry, filletRadius)
-    fillet4 = sketchArcs.addFillet(side4, side4.endSketchPoint.geometry, side1, side1.startSketchPoint.geometry, filletRadius)
-
-    geometricConstraints.addEqual(fillet1, fillet2)
-    geometricConstraints.addEqual(fillet2, fillet3)
-    geometricConstraints.addEqual(fillet3, fillet4)
-    sketchDimensions.addRadialDimension(fillet1, fillet1.startSketchPoint.geometry)
-
-    baseClearanceCutSketch.offset(commonUtils.objectCollectionFromList([fillet1, fillet2, fillet3, fillet4, side1, side2, side3, side4]), baseConfiguration.originPoint, 1)
+    with futil.sketch_drawing(baseClearanceCutSketch):
+        roundedRectangle = sketchUtils.createRoundedRectangle(
+            actual_base_width,
+            actual_base_length,
+            adsk.core.Point3D.create(
+                baseConfiguration.originPoint.x + baseConfiguration.xyClearance,
+                baseConfiguration.originPoint.y + baseConfiguration.xyClearance,
+                baseConfiguration.originPoint.z,
+            ),
+            baseConfiguration.cornerFilletRadius - baseConfiguration.xyClearance,
+            baseClearanceCutSketch,
+            const.SKETCH_POLICY_GEOMETRY_ONLY,
+        )
+        baseClearanceCutSketch.offset(commonUtils.objectCollectionFromList(roundedRectangle), baseConfiguration.originPoint, 1)
 
     cuttingProfile = min(list(baseClearanceCutSketch.profiles), key=lambda x: x.boundingBox.minPoint.x)
     clearanceCutExtrudeInput = features.extrudeFeatures.createInput(
@@ -449,6 +487,33 @@ def cutBaseClearance(
         adsk.fusion.DistanceExtentDefinition.create(adsk.core.ValueInput.createByReal(100)),
         adsk.fusion.DistanceExtentDefinition.create(adsk.core.ValueInput.createByReal(100)),
     )
-    clearanceCutExtrudeInput.participantBodies = list(targetComponent.bRepBodies)
+    clearanceCutExtrudeInput.participantBodies = participantBodies
     clearanceCutExtrude = features.extrudeFeatures.add(clearanceCutExtrudeInput)
-    clearanceCutExtrude.name = "Base side clearance cut"
\ No newline at end of file
+    clearanceCutExtrude.name = "Base side clearance cut"
+
+def baseClearanceParticipants(
+    baseConfiguration: BaseGeneratorInput,
+    actualBaseWidth: float,
+    actualBaseLength: float,
+    targetComponent: adsk.fusion.Component,
+) -> list[adsk.fusion.BRepBody]:
+    bodies = list(targetComponent.bRepBodies)
+    if not config.BOUNDING_BOX_PRUNING_ENABLED:
+        return bodies
+    # the clearance cut profile is the 1cm wide ring around the rounded outline, bodies within the outline
+    # away from its rounded corners are never touched, only bodies reaching into the border strips take part
+    minX = baseConfiguration.originPoint.x + baseConfiguration.xyClearance
+    minY = baseConfiguration.originPoint.y + baseConfiguration.xyClearance
+    maxX = minX + actualBaseWidth
+    maxY = minY + actualBaseLength
+    cornerRadius = max(baseConfiguration.cornerFilletRadius - baseConfiguration.xyClearance, 0)
+    (bottom, top) = (baseConfiguration.originPoint.z - 100, baseConfiguration.originPoint.z + 100)
+    borderStrips = [
+        bodySpatialIndex.createBox((minX - 1, minY - 1, bottom), (minX + cornerRadius, maxY + 1, top)),
+        bodySpatialIndex.createBox((maxX - cornerRadius, minY - 1, bottom), (maxX + 1, maxY + 1, top)),
+        bodySpatialIndex.createBox((minX - 1, minY - 1, bottom), (maxX + 1, minY + cornerRadius, top)),
+        bodySpatialIndex.createBox((minX - 1, maxY - cornerRadius, bottom), (maxX + 1, maxY + 1, top)),
+    ]
+    bodyIndex = bodySpatialIndex.BodyGridIndex(bodies)
+    reachingIndexes = set([index for strip in borderStrips for index in bodyIndex.queryIndexes(strip)])
+    return [body for (index, body) in enumerate(bodies) if index in reachingIndexes]
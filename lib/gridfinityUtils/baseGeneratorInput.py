@@ -1,16 +1,18 @@
 import adsk.core, adsk.fusion, traceback
 
-from .const import DIMENSION_MAGNET_CUTOUT_DEPTH, DIMENSION_MAGNET_CUTOUT_DIAMETER, DIMENSION_SCREW_HOLE_DIAMETER, BIN_CORNER_FILLET_RADIUS
+from .const import DIMENSION_MAGNET_CUTOUT_DEPTH, DIMENSION_MAGNET_CUTOUT_DIAMETER, DIMENSION_SCREW_HOLE_DIAMETER, BIN_CORNER_FILLET_RADIUS, GENERATOR_FIDELITY_FULL
 
 class BaseGeneratorInput():
     def __init__(self):
         self.hasMagnetCutouts = False
+        self.hasMagnetCutoutsTabs = False
         self.hasScrewHoles = False
         self.hasBottomChamfer = True
         self.screwHolesDiameter = DIMENSION_SCREW_HOLE_DIAMETER
         self.magnetCutoutsDiameter = DIMENSION_MAGNET_CUTOUT_DIAMETER
         self.magnetCutoutsDepth = DIMENSION_MAGNET_CUTOUT_DEPTH
         self.cornerFilletRadius = BIN_CORNER_FILLET_RADIUS
+        self.fidelity = GENERATOR_FIDELITY_FULL
 
     @property
     def originPoint(self) -> adsk.core.Point3D:
@@ -84,6 +86,14 @@ class BaseGeneratorInput():
     def hasMagnetCutouts(self, value: bool):
         self._hasMagnetCutouts = value
 
+    @property
+    def hasMagnetCutoutsTabs(self) -> bool:
+        return self._hasMagnetCutoutsTabs
+
+    @hasMagnetCutoutsTabs.setter
+    def hasMagnetCutoutsTabs(self, value: bool):
+        self._hasMagnetCutoutsTabs = value
+
     @property
     def magnetCutoutsDiameter(self) -> float:
         return self._magnetCutoutsDiameter
@@ -98,4 +108,12 @@ class BaseGeneratorInput():
 
     @magnetCutoutsDepth.setter
     def magnetCutoutsDepth(self, value: float):
-        self._magnetCutoutsDepth = value
\ No newline at end of file
+        self._magnetCutoutsDepth = value
+
+    @property
+    def fidelity(self) -> int:
+        return self._fidelity
+
+    @fidelity.setter
+    def fidelity(self, value: int):
+        self._fidelity = value
@@ -16,6 +16,7 @@ class BaseplateGeneratorInput():
         self.binZClearance = const.BASEPLATE_BIN_Z_CLEARANCE
         self.connectionScrewHolesDiameter = const.DIMENSION_PLATE_CONNECTION_SCREW_HOLE_DIAMETER
         self.cornerFilletRadius = const.BIN_CORNER_FILLET_RADIUS
+        self.fidelity = const.GENERATOR_FIDELITY_FULL
 
     @property
     def baseWidth(self) -> float:
@@ -200,3 +201,11 @@ class BaseplateGeneratorInput():
     @magnetCutoutsDepth.setter
     def magnetCutoutsDepth(self, value: float):
         self._magnetCutoutsDepth = value
+
+    @property
+    def fidelity(self) -> int:
+        return self._fidelity
+
+    @fidelity.setter
+    def fidelity(self, value: int):
+        self._fidelity = value
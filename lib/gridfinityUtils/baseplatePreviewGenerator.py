@@ -0,0 +1,72 @@
+import adsk.core, adsk.fusion, traceback
+
+from . import const, geometryUtils, temporaryShapeUtils
+from .baseGeneratorInput import BaseGeneratorInput
+from .baseplateGeneratorInput import BaseplateGeneratorInput
+from .binPreviewGenerator import createGridfinityBasePreviewBody
+
+# Preview geometry is approximated the same way as bin previews,
+# skeletonized bottom and connection holes are omitted.
+
+def createGridfinityBaseplatePreview(
+    input: BaseplateGeneratorInput,
+    targetComponent: adsk.fusion.Component,
+) -> adsk.fusion.BRepBody:
+    cutoutInput = BaseGeneratorInput()
+    cutoutInput.xyClearance = input.xyClearance
+    cutoutInput.originPoint = geometryUtils.createOffsetPoint(
+        targetComponent.originConstructionPoint.geometry,
+        byX=-cutoutInput.xyClearance * 2,
+        byY=-cutoutInput.xyClearance * 2,
+    )
+    cutoutInput.baseWidth = input.baseWidth + cutoutInput.xyClearance * 2
+    cutoutInput.baseLength = input.baseLength + cutoutInput.xyClearance * 2
+    cutoutInput.cornerFilletRadius = input.cornerFilletRadius + cutoutInput.xyClearance
+    cutterBody = createGridfinityBasePreviewBody(cutoutInput)
+
+    if input.hasExtendedBottom:
+        holeBodies: list[adsk.fusion.BRepBody] = []
+        holeSpacingX = input.baseWidth - const.DIMENSION_SCREW_HOLES_OFFSET * 2
+        holeSpacingY = input.baseLength - const.DIMENSION_SCREW_HOLES_OFFSET * 2
+        for i in range(2):
+            for j in range(2):
+                holeCenter = adsk.core.Point3D.create(
+                    const.DIMENSION_SCREW_HOLES_OFFSET - input.xyClearance + i * holeSpacingX,
+                    const.DIMENSION_SCREW_HOLES_OFFSET - input.xyClearance + j * holeSpacingY,
+                    -const.BIN_BASE_HEIGHT,
+                )
+                if input.hasMagnetCutouts:
+                    holeBodies.append(temporaryShapeUtils.simpleCylinder(holeCenter, input.magnetCutoutsDiameter / 2, -input.magnetCutoutsDepth))
+                if input.hasScrewHoles:
+                    holeBodies.append(temporaryShapeUtils.simpleCylinder(holeCenter, input.screwHolesDiameter / 2, -input.bottomExtensionHeight))
+                    screwHeadHeight = const.DIMENSION_SCREW_HEAD_CUTOUT_OFFSET_HEIGHT + (input.screwHeadCutoutDiameter - input.screwHolesDiameter) / 2
+                    holeBodies.append(temporaryShapeUtils.simpleCylinder(
+                        geometryUtils.createOffsetPoint(holeCenter, byZ=-input.bottomExtensionHeight),
+                        input.screwHeadCutoutDiameter / 2,
+                        screwHeadHeight,
+                    ))
+        temporaryShapeUtils.joinBodies(cutterBody, holeBodies)
+
+    baseplateTrueWidth = input.baseplateWidth * input.baseWidth - input.xyClearance * 2
+    baseplateTrueLength = input.baseplateLength * input.baseLength - input.xyClearance * 2
+    paddingLeft = input.paddingLeft if input.hasPadding else 0
+    paddingTop = input.paddingTop if input.hasPadding else 0
+    paddingRight = input.paddingRight if input.hasPadding else 0
+    paddingBottom = input.paddingBottom if input.hasPadding else 0
+    plateBottom = -const.BIN_BASE_HEIGHT - (input.bottomExtensionHeight if input.hasExtendedBottom else 0)
+    plateTop = -max(0, input.binZClearance)
+    plateBody = temporaryShapeUtils.roundedBox(
+        adsk.core.Point3D.create(-paddingLeft, -paddingBottom, plateBottom),
+        baseplateTrueWidth + paddingLeft + paddingRight,
+        baseplateTrueLength + paddingBottom + paddingTop,
+        plateTop - plateBottom,
+        input.cornerFilletRadius - input.xyClearance,
+    )
+
+    cutterBodies: list[adsk.fusion.BRepBody] = []
+    for i in range(int(input.baseplateWidth)):
+        for j in range(int(input.baseplateLength)):
+            cutterBodies.append(temporaryShapeUtils.translatedCopy(cutterBody, byX=i * input.baseWidth, byY=j * input.baseLength))
+    temporaryShapeUtils.cutBody(plateBody, cutterBodies)
+
+    return temporaryShapeUtils.addToComponent([plateBody], 'Baseplate preview', targetComponent)[0]
@@ -0,0 +1,120 @@
+import math
+
+# Splits a drawer sized baseplate into tiles that fit the print bed. All sizes are in cm.
+# Space left after the last full grid unit is split equally between both drawer sides and
+# added as padding to the outer tiles, inner tiles of the same size share one shape.
+
+class BaseplateTilingError(Exception):
+    pass
+
+class BaseplateTileSegment():
+    def __init__(self, units: int, paddingStart: float, paddingEnd: float):
+        self.units = units
+        self.paddingStart = paddingStart
+        self.paddingEnd = paddingEnd
+
+    def size(self, baseSize: float, xyClearance: float):
+        return self.units * baseSize - xyClearance * 2 + self.paddingStart + self.paddingEnd
+
+    @property
+    def key(self):
+        return (self.units, round(self.paddingStart, 6), round(self.paddingEnd, 6))
+
+class BaseplateTile():
+    def __init__(self, segmentX: BaseplateTileSegment, segmentY: BaseplateTileSegment):
+        self.segmentX = segmentX
+        self.segmentY = segmentY
+        # grid origins of every copy of the tile relative to the drawer corner
+        self.positions: list[tuple[float, float]] = []
+
+    @property
+    def plateWidth(self):
+        return self.segmentX.units
+
+    @property
+    def plateLength(self):
+        return self.segmentY.units
+
+    @property
+    def paddingLeft(self):
+        return self.segmentX.paddingStart
+
+    @property
+    def paddingRight(self):
+        return self.segmentX.paddingEnd
+
+    @property
+    def paddingBottom(self):
+        return self.segmentY.paddingStart
+
+    @property
+    def paddingTop(self):
+        return self.segmentY.paddingEnd
+
+    @property
+    def hasPadding(self):
+        return max(self.paddingLeft, self.paddingRight, self.paddingBottom, self.paddingTop) > 0
+
+def splitUnits(units: int, count: int, edgeCapacity: int, innerCapacity: int):
+    # even split with the bigger parts in the middle, parts over the edge capacity move inwards
+    (quotient, remainder) = divmod(units, count)
+    centerOrder = sorted(range(count), key=lambda index: abs(index - (count - 1) / 2))
+    sizes = [quotient] * count
+    for index in centerOrder[:remainder]:
+        sizes[index] += 1
+    capacities = [innerCapacity] * count
+    capacities[0] = min(capacities[0], edgeCapacity)
+    capacities[-1] = min(capacities[-1], edgeCapacity)
+    excess = sum([max(0, size - capacity) for (size, capacity) in zip(sizes, capacities)])
+    sizes = [min(size, capacity) for (size, capacity) in zip(sizes, capacities)]
+    for index in centerOrder:
+        moved = min(excess, capacities[index] - sizes[index])
+        sizes[index] += moved
+        excess -= moved
+    if excess > 0 or min(sizes) < 1:
+        return None
+    return sizes
+
+def planAxisSegments(drawerSize: float, bedSize: float, baseSize: float, xyClearance: float) -> list[BaseplateTileSegment]:
+    units = math.floor((drawerSize + xyClearance * 2) / baseSize + 1e-9)
+    if units < 1:
+        raise BaseplateTilingError('Drawer is smaller than a single grid unit')
+    padding = (drawerSize - (units * baseSize - xyClearance * 2)) / 2
+    innerCapacity = math.floor((bedSize + xyClearance * 2) / baseSize + 1e-9)
+    edgeCapacity = math.floor((bedSize + xyClearance * 2 - padding) / baseSize + 1e-9)
+    for count in range(1, units + 1):
+        if count == 1:
+            sizes = [units] if BaseplateTileSegment(units, padding, padding).size(baseSize, xyClearance) <= bedSize + 1e-9 else None
+        else:
+            sizes = splitUnits(units, count, edgeCapacity, innerCapacity)
+        if sizes is None:
+            continue
+        return [
+            BaseplateTileSegment(size, padding if index == 0 else 0, padding if index == count - 1 else 0)
+            for (index, size) in enumerate(sizes)
+        ]
+    raise BaseplateTilingError('A single grid unit with the drawer padding does not fit the print bed')
+
+def planBaseplateTiles(
+    drawerWidth: float,
+    drawerLength: float,
+    bedWidth: float,
+    bedLength: float,
+    baseWidth: float,
+    baseLength: float,
+    xyClearance: float,
+) -> list[BaseplateTile]:
+    segmentsX = planAxisSegments(drawerWidth, bedWidth, baseWidth, xyClearance)
+    segmentsY = planAxisSegments(drawerLength, bedLength, baseLength, xyClearance)
+    tiles: dict[tuple, BaseplateTile] = {}
+    positionY = segmentsY[0].paddingStart
+    for segmentY in segmentsY:
+        positionX = segmentsX[0].paddingStart
+        for segmentX in segmentsX:
+            key = (segmentX.key, segmentY.key)
+            if not key in tiles:
+                tiles[key] = BaseplateTile(segmentX, segmentY)
+            tiles[key].positions.append((positionX, positionY))
+            positionX += segmentX.units * baseWidth
+        positionY += segmentY.units * baseLength
+    return list(tiles.values())
@@ -0,0 +1,102 @@
+import adsk.core, adsk.fusion, traceback
+import math
+import time
+
+from ...lib import fusion360utils as futil
+from ... import config
+from . import meshExporter, resultCache
+from .binGenerator import createGridfinityBin
+from .binManifest import createBinGeneratorInputFromManifest
+from .generatorInputHash import generatorInputHash
+
+class BinBatchResult():
+    def __init__(self, name: str, seconds: float, error: str = None):
+        self.name = name
+        self.seconds = seconds
+        self.error = error
+
+    @property
+    def isSuccessful(self) -> bool:
+        return self.error is None
+
+def binFootprint(entry: dict):
+    return (entry['binWidth'] * entry['baseWidth'] / 10, entry['binLength'] * entry['baseLength'] / 10)
+
+def gridLayout(footprints: list[tuple[float, float]], spacing: float):
+    # rows of roughly square overall shape, each row is as tall as its longest bin so nothing overlaps
+    columns = max(1, math.ceil(math.sqrt(len(footprints))))
+    positions: list[tuple[float, float]] = []
+    rowY = 0
+    for rowStart in range(0, len(footprints), columns):
+        rowX = 0
+        rowFootprints = footprints[rowStart:rowStart + columns]
+        for (width, length) in rowFootprints:
+            positions.append((rowX, rowY))
+            rowX += width + spacing
+        rowY += max([length for (width, length) in rowFootprints]) + spacing
+    return positions
+
+def createGridfinityBinBatch(
+    entries: list[dict],
+    targetComponent: adsk.fusion.Component,
+    spacing: float,
+) -> list[BinBatchResult]:
+    # every distinct bin gets its own component, copies with identical inputs are occurrences of it
+    results: list[BinBatchResult] = [BinBatchResult(entry['name'], 0, entry['error']) for entry in entries if not entry['error'] is None]
+    expandedEntries = [entry for entry in entries if entry['error'] is None for copyIndex in range(entry['count'])]
+    positions = gridLayout([binFootprint(entry) for entry in expandedEntries], spacing)
+    design = targetComponent.parentDesign
+    # input hash -> component of the generated bin, None when its generation failed
+    generatedBins: dict[str, adsk.fusion.Component] = {}
+
+    for (entry, (positionX, positionY)) in zip(expandedEntries, positions):
+        startTime = time.perf_counter()
+        transform = adsk.core.Matrix3D.create()
+        transform.translation = adsk.core.Vector3D.create(positionX, positionY, 0)
+        binGeneratorInput = createBinGeneratorInputFromManifest(entry, adsk.core.Point3D.create(0, 0, 0))
+        parametersHash = generatorInputHash(binGeneratorInput)
+        if parametersHash in generatedBins:
+            if generatedBins[parametersHash] is None:
+                results.append(BinBatchResult(entry['name'], 0, 'same inputs as a bin which failed to generate'))
+            else:
+                targetComponent.occurrences.addExistingComponent(generatedBins[parametersHash], transform)
+                results.append(BinBatchResult(entry['name'], time.perf_counter() - startTime))
+            futil.log(f'Batch bin "{entry["name"]}" {"placed as a copy" if results[-1].isSuccessful else "skipped"} in {results[-1].seconds * 1000:.0f}ms')
+            continue
+
+        occurrence: adsk.fusion.Occurrence = None
+        try:
+            occurrence = targetComponent.occurrences.addNewComponent(transform)
+            binComponent = occurrence.component
+            binComponent.name = entry['name']
+            with futil.trace_run(entry['name'], binComponent), futil.deferred_compute():
+                resultCache.generateWithResultCache(
+                    resultCache.resultCacheKey('bin', binGeneratorInput),
+                    entry['name'],
+                    binComponent,
+                    lambda: createGridfinityBin(binGeneratorInput, binComponent),
+                )
+                if binGeneratorInput.hasBody and binGeneratorInput.hasBase:
+                    binComponent.bRepBodies.item(0).name = entry['name']
+                with futil.span('timeline group'):
+                    binGroup = design.timeline.timelineGroups.add(occurrence.timelineObject.index, occurrence.timelineObject.index + binComponent.features.count + binComponent.constructionPlanes.count + binComponent.constructionAxes.count + binComponent.sketches.count)
+                    binGroup.name = entry['name']
+            if config.EXPORT_ENABLED:
+                meshExporter.queueMeshExport(binComponent, entry['name'], parametersHash)
+            generatedBins[parametersHash] = binComponent
+            results.append(BinBatchResult(entry['name'], time.perf_counter() - startTime))
+        except Exception as err:
+            futil.log(f'Failed to generate "{entry["name"]}", {traceback.format_exc()}')
+            if occurrence is not None:
+                occurrence.deleteMe()
+            generatedBins[parametersHash] = None
+            results.append(BinBatchResult(entry['name'], time.perf_counter() - startTime, str(err)))
+        futil.log(f'Batch bin "{entry["name"]}" {"done" if results[-1].isSuccessful else "failed"} in {results[-1].seconds * 1000:.0f}ms')
+    return results
+
+def formatBinBatchSummary(results: list[BinBatchResult]):
+    failed = [result for result in results if not result.isSuccessful]
+    lines = ['Generated {} of {} bins in {:.1f}s'.format(len(results) - len(failed), len(results), sum([result.seconds for result in results]))]
+    for result in failed:
+        lines.append('Failed "{}": {}'.format(result.name, result.error))
+    return '\n'.join(lines)
@@ -5,7 +5,7 @@ import math
 from ...lib.gridfinityUtils import geometryUtils
 from ...lib import fusion360utils as futil
 from ...lib.gridfinityUtils import filletUtils
-from . import const, combineUtils, faceUtils, commonUtils, sketchUtils, extrudeUtils, baseGenerator, edgeUtils
+from . import const, combineUtils, faceUtils, commonUtils, sketchUtils, extrudeUtils, baseGenerator, edgeUtils, bRepIndex, constructionPlaneRegistry
 from .baseGeneratorInput import BaseGeneratorInput
 from .binBodyCutoutGeneratorInput import BinBodyCutoutGeneratorInput
 from ... import config
@@ -17,8 +17,8 @@ def getInnerCutoutScoopFace(
     innerCutout: adsk.fusion.BRepBody
     ) -> tuple[adsk.fusion.BRepFace, adsk.fusion.BRepFace]:
     innerCutoutYNormalFaces = [face for face in innerCutout.faces if faceUtils.isYNormal(face)]
-    scoopFace = min(innerCutoutYNormalFaces, key=lambda x: x.boundingBox.minPoint.y)
-    oppositeFace = max(innerCutoutYNormalFaces, key=lambda x: x.boundingBox.minPoint.y)
+    scoopFace = min(innerCutoutYNormalFaces, key=lambda x: bRepIndex.boundingBox(x).minPoint[1])
+    oppositeFace = max(innerCutoutYNormalFaces, key=lambda x: bRepIndex.boundingBox(x).minPoint[1])
     return (scoopFace, oppositeFace)
 
 def createGridfinityBinBodyCutout(
@@ -26,12 +26,7 @@ def createGridfinityBinBodyCutout(
     targetComponent: adsk.fusion.Component,
 ):
 
-    cutoutPlaneInput: adsk.fusion.ConstructionPlaneInput = targetComponent.constructionPlanes.createInput()
-    cutoutPlaneInput.setByOffset(
-        targetComponent.xYConstructionPlane,
-        adsk.core.ValueInput.createByReal(input.origin.z)
-    )
-    cutoutConstructionPlane = targetComponent.constructionPlanes.add(cutoutPlaneInput)
+    cutoutConstructionPlane = constructionPlaneRegistry.offsetPlane(targetComponent.xYConstructionPlane, input.origin.z, targetComponent)
     innerCutoutSketch: adsk.fusion.Sketch = targetComponent.sketches.add(cutoutConstructionPlane)
     innerCutoutSketch.name = 'Inner cutout sketch'
     sketchUtils.createRectangle(
@@ -39,6 +34,7 @@ def createGridfinityBinBodyCutout(
         input.length,
         adsk.core.Point3D.create(input.origin.x, input.origin.y, 0),
         innerCutoutSketch,
+        const.SKETCH_POLICY_GEOMETRY_ONLY,
     )
 
     innerCutout = extrudeUtils.simpleDistanceExtrude(
@@ -53,6 +49,9 @@ def createGridfinityBinBodyCutout(
     innerCutoutBody = innerCutout.bodies.item(0)
     innerCutoutBody.name = 'Inner cutout'
 
+    if input.fidelity < const.GENERATOR_FIDELITY_STANDARD:
+        return innerCutoutBody
+
     # scoop
     if input.hasScoop:
         [innerCutoutScoopFace, innerCutoputScoopOppositeFace] = getInnerCutoutScoopFace(innerCutoutBody)
@@ -86,3 +85,107 @@ def createGridfinityBinBodyCutout(
         )
 
     return innerCutoutBody
+
+def createGridfinityBinBodyCutouts(
+    inputs: list[BinBodyCutoutGeneratorInput],
+    targetComponent: adsk.fusion.Component,
+) -> list[adsk.fusion.BRepBody]:
+    # all cutouts share depth, top plane, scoop and fillet settings, they are drawn in one sketch,
+    # extruded with one feature and filleted with one feature per edge set
+    # returns cutout bodies in the same order as inputs
+    if len(inputs) == 1:
+        return [createGridfinityBinBodyCutout(inputs[0], targetComponent)]
+    cutoutGroups = separateCutoutGroups(inputs)
+    if len(cutoutGroups) > 1:
+        groupBodies = [createGridfinityBinBodyCutouts(cutoutGroup, targetComponent) for cutoutGroup in cutoutGroups]
+        bodiesByInput = {id(input): body for (cutoutGroup, bodies) in zip(cutoutGroups, groupBodies) for (input, body) in zip(cutoutGroup, bodies)}
+        return [bodiesByInput[id(input)] for input in inputs]
+    commonInput = inputs[0]
+
+    cutoutConstructionPlane = constructionPlaneRegistry.offsetPlane(targetComponent.xYConstructionPlane, commonInput.origin.z, targetComponent)
+    innerCutoutSketch: adsk.fusion.Sketch = targetComponent.sketches.add(cutoutConstructionPlane)
+    innerCutoutSketch.name = 'Inner cutouts sketch'
+    with futil.sketch_drawing(innerCutoutSketch):
+        for input in inputs:
+            sketchUtils.createRectangle(
+                input.width,
+                input.length,
+                adsk.core.Point3D.create(input.origin.x, input.origin.y, 0),
+                innerCutoutSketch,
+                const.SKETCH_POLICY_GEOMETRY_ONLY,
+            )
+
+    innerCutout = extrudeUtils.simpleDistanceExtrude(
+        commonUtils.objectCollectionFromList(list(innerCutoutSketch.profiles)),
+        adsk.fusion.FeatureOperations.NewBodyFeatureOperation,
+        commonInput.height,
+        adsk.fusion.ExtentDirections.NegativeExtentDirection,
+        [],
+        targetComponent,
+    )
+    innerCutout.name = 'Inner cutouts extrude'
+    innerCutoutBodies = list(innerCutout.bodies)
+    for innerCutoutBody in innerCutoutBodies:
+        innerCutoutBody.name = 'Inner cutout'
+
+    if commonInput.fidelity < const.GENERATOR_FIDELITY_STANDARD:
+        return [cutoutBodyForInput(input, innerCutoutBodies) for input in inputs]
+
+    # scoop
+    if commonInput.hasScoop:
+        scoopEdges = [faceUtils.getBottomHorizontalEdge(getInnerCutoutScoopFace(body)[0].edges) for body in innerCutoutBodies]
+        scoopMaxRadius = min(commonInput.scoopMaxRadius, commonInput.height) if min(commonInput.scoopMaxRadius, commonInput.height) >= commonInput.filletRadius else commonInput.filletRadius
+        filletUtils.createFillet(
+            scoopEdges,
+            scoopMaxRadius,
+            False,
+            targetComponent
+        )
+    # fillet inner cutouts
+    filletUtils.createFillet(
+        [edge for body in innerCutoutBodies for edge in faceUtils.getVerticalEdges(body.faces)],
+        commonInput.filletRadius,
+        True,
+        targetComponent
+    )
+    if commonInput.hasBottomFillet:
+        # recalculate faces after fillet
+        filletUtils.createFillet(
+            [faceUtils.getBottomHorizontalEdge(getInnerCutoutScoopFace(body)[1].edges) for body in innerCutoutBodies],
+            commonInput.filletRadius,
+            True,
+            targetComponent
+        )
+
+    return [cutoutBodyForInput(input, innerCutoutBodies) for input in inputs]
+
+def cutoutsTouch(first: BinBodyCutoutGeneratorInput, second: BinBodyCutoutGeneratorInput):
+    return min(first.origin.x + first.width, second.origin.x + second.width) - max(first.origin.x, second.origin.x) > -const.DEFAULT_FILTER_TOLERANCE \
+        and min(first.origin.y + first.length, second.origin.y + second.length) - max(first.origin.y, second.origin.y) > -const.DEFAULT_FILTER_TOLERANCE
+
+def separateCutoutGroups(inputs: list[BinBodyCutoutGeneratorInput]) -> list[list[BinBodyCutoutGeneratorInput]]:
+    # rectangles overlapping or touching in one sketch are extruded into one body and filleted as one shape,
+    # such custom compartments go to different groups so each of them keeps its own fillets and scoop
+    groups: list[list[BinBodyCutoutGeneratorInput]] = []
+    for input in inputs:
+        group = next((group for group in groups if not any(cutoutsTouch(input, other) for other in group)), None)
+        if group is None:
+            groups.append([input])
+        else:
+            group.append(input)
+    return groups
+
+def cutoutBodyForInput(input: BinBodyCutoutGeneratorInput, bodies: list[adsk.fusion.BRepBody]):
+    # cutout bodies of overlapping compartments contain each other's center, the body with the closest bounds is used
+    centerX = input.origin.x + input.width / 2
+    centerY = input.origin.y + input.length / 2
+    containingBodies = [body for body in bodies if
+        body.boundingBox.minPoint.x <= centerX <= body.boundingBox.maxPoint.x
+        and body.boundingBox.minPoint.y <= centerY <= body.boundingBox.maxPoint.y]
+    if len(containingBodies) == 0:
+        raise ValueError(f'No cutout body contains the compartment center at ({centerX:.2f}, {centerY:.2f})')
+    return min(containingBodies, key=lambda body:
+        abs(body.boundingBox.minPoint.x - input.origin.x)
+        + abs(body.boundingBox.minPoint.y - input.origin.y)
+        + abs(body.boundingBox.maxPoint.x - input.origin.x - input.width)
+        + abs(body.boundingBox.maxPoint.y - input.origin.y - input.length))
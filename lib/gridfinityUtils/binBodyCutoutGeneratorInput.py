@@ -11,6 +11,7 @@ class BinBodyCutoutGeneratorInput():
         self.tabLength = 1
         self.tabWidth = const.BIN_TAB_WIDTH
         self.hasBottomFillet = True
+        self.fidelity = const.GENERATOR_FIDELITY_FULL
 
 
     @property
@@ -117,4 +118,10 @@ class BinBodyCutoutGeneratorInput():
     def tabOverhangAngle(self, value: float):
         self._tabOverhangAngle = value
 
-    
\ No newline at end of file
+    @property
+    def fidelity(self) -> int:
+        return self._fidelity
+
+    @fidelity.setter
+    def fidelity(self, value: int):
+        self._fidelity = value
@@ -4,8 +4,8 @@ import math
 import copy
 
 from ...lib import fusion360utils as futil
-from . import const, combineUtils, faceUtils, commonUtils, sketchUtils, extrudeUtils, baseGenerator, edgeUtils, filletUtils, geometryUtils
-from .binBodyCutoutGenerator import createGridfinityBinBodyCutout
+from . import const, combineUtils, faceUtils, commonUtils, sketchUtils, extrudeUtils, baseGenerator, edgeUtils, filletUtils, geometryUtils, bRepIndex
+from .binBodyCutoutGenerator import createGridfinityBinBodyCutout, createGridfinityBinBodyCutouts, cutoutBodyForInput
 from .binBodyCutoutGeneratorInput import BinBodyCutoutGeneratorInput
 from .baseGeneratorInput import BaseGeneratorInput
 from .binBodyGeneratorInput import BinBodyGeneratorInput, BinBodyCompartmentDefinition
@@ -13,6 +13,9 @@ from .binBodyTabGeneratorInput import BinBodyTabGeneratorInput
 from .binBodyTabGenerator import createGridfinityBinBodyTab
 from .binBodyLipGeneratorInput import BinBodyLipGeneratorInput
 from .binBodyLipGenerator import createGridfinityBinBodyLip
+from .booleanPlanner import BooleanPlan
+from .binLayoutSolver import solveBinBodyLayout, BinBodyLayout, BinCutoutLayout, BinTabLayout
+from .binStageCache import BinStages, BIN_STAGE_OUTER_BODY, BIN_STAGE_LIP, BIN_STAGE_COMPARTMENTS, BIN_STAGE_TABS
 from ... import config
 
 app = adsk.core.Application.get()
@@ -28,241 +31,196 @@ def uniformCompartments(countX, countY):
 def createGridfinityBinBody(
     input: BinBodyGeneratorInput,
     targetComponent: adsk.fusion.Component,
-) -> tuple[adsk.fusion.BRepBody, adsk.fusion.BRepBody]:
-
-    actualBodyWidth = (input.baseWidth * input.binWidth) - input.xyClearance * 2.0
-    actualBodyLength = (input.baseLength * input.binLength) - input.xyClearance * 2.0
-    binHeightWithoutBase = input.binHeight - 1
-    binBodyTotalHeight = binHeightWithoutBase * input.heightUnit + max(0, input.heightUnit - const.BIN_BASE_HEIGHT)
-    features: adsk.fusion.Features = targetComponent.features
-    binBodyExtrude = extrudeUtils.createBox(
-        actualBodyWidth,
-        actualBodyLength,
-        binBodyTotalHeight,
-        targetComponent,
-        targetComponent.xYConstructionPlane
-    )
-    binBody = binBodyExtrude.bodies.item(0)
-    binBody.name = 'Bin body'
+    stages: BinStages = None,
+    plan: BooleanPlan = None,
+) -> adsk.fusion.BRepBody:
+    stages = stages if stages is not None else BinStages()
+    layout = solveBinBodyLayout(input)
+    [binBody] = stages.run(BIN_STAGE_OUTER_BODY, targetComponent, lambda: [createBinOuterBody(input, layout, targetComponent)])
 
     bodiesToMerge: list[adsk.fusion.BRepBody] = []
     bodiesToSubtract: list[adsk.fusion.BRepBody] = []
 
-    # round corners
-    filletUtils.filletEdgesByLength(
-        binBodyExtrude.faces,
-        input.binCornerFilletRadius,
-        binBodyTotalHeight,
-        targetComponent,
-    ).name = 'Bin body corner fillets'
-
     if input.hasLip:
-        lipOriginPoint = adsk.core.Point3D.create(
-            0,
-            0,
-            binHeightWithoutBase * input.heightUnit + max(0, input.heightUnit - const.BIN_BASE_HEIGHT)
-        )
-        lipInput = BinBodyLipGeneratorInput()
-        lipInput.baseLength = input.baseLength
-        lipInput.baseWidth = input.baseWidth
-        lipInput.binLength = input.binLength
-        lipInput.binWidth = input.binWidth
-        lipInput.hasLipNotches = input.hasLipNotches
-        lipInput.xyClearance = input.xyClearance
-        lipInput.binCornerFilletRadius = input.binCornerFilletRadius
-        lipInput.origin = lipOriginPoint
-        lipBody = createGridfinityBinBodyLip(lipInput, targetComponent)
-
-        if input.wallThickness < const.BIN_LIP_WALL_THICKNESS:
-            lipBottomChamferSize = max(const.BIN_BODY_CUTOUT_BOTTOM_FILLET_RADIUS, input.binCornerFilletRadius - input.wallThickness)
-            lipBottomChamferExtrude = extrudeUtils.createBoxAtPoint(
-                actualBodyWidth - input.wallThickness * 2,
-                (actualBodyLength - input.wallThickness - const.BIN_LIP_WALL_THICKNESS + input.xyClearance) if input.hasScoop else (actualBodyLength - input.wallThickness * 2),
-                lipBottomChamferSize,
-                targetComponent,
-                adsk.core.Point3D.create(
-                    input.wallThickness,
-                    (const.BIN_LIP_WALL_THICKNESS - input.xyClearance) if input.hasScoop else input.wallThickness,
-                    lipOriginPoint.z,
-                )
-            )
-            lipBottomChamferExtrude.name = 'Lip bottom chamfer extrude'
-            filletUtils.filletEdgesByLength(
-                lipBottomChamferExtrude.faces,
-                lipBottomChamferSize,
-                lipBottomChamferSize,
-                targetComponent,
-            )
-            lipBottomChamferExtrudeTopFace = faceUtils.getTopFace(lipBottomChamferExtrude.bodies.item(0))
-            scoopSideEdge = min([edge for edge in lipBottomChamferExtrudeTopFace.edges if geometryUtils.isCollinearToX(edge)], key=lambda x: x.boundingBox.minPoint.y)
-
-            edgesToChamfer = list(scoopSideEdge.tangentiallyConnectedEdges)[3:] if input.hasScoop else scoopSideEdge.tangentiallyConnectedEdges
-            chamferFeatures: adsk.fusion.ChamferFeatures = features.chamferFeatures
-            bottomLipChamferInput = chamferFeatures.createInput2()
-            bottomLipChamferEdges = commonUtils.objectCollectionFromList(edgesToChamfer)
-            bottomLipChamferInput.chamferEdgeSets.addEqualDistanceChamferEdgeSet(
-                bottomLipChamferEdges,
-                adsk.core.ValueInput.createByReal(lipBottomChamferSize),
-                False)
-            chamferFeatures.add(bottomLipChamferInput)
-            combineUtils.cutBody(lipBody, commonUtils.objectCollectionFromList(lipBottomChamferExtrude.bodies), targetComponent)
-
-        bodiesToMerge.append(lipBody)
+        with futil.span('lip'):
+            bodiesToMerge += stages.run(BIN_STAGE_LIP, targetComponent, lambda: [createBinLip(input, layout, targetComponent)])
 
     if not input.isSolid:
-        compartmentsMinX = input.wallThickness
-        compartmentsMaxX = actualBodyWidth - input.wallThickness
-        compartmentsMinY = (const.BIN_LIP_WALL_THICKNESS - input.xyClearance) if input.hasLip and input.hasScoop else input.wallThickness
-        compartmentsMaxY = actualBodyLength - input.wallThickness
-
-        totalCompartmentsWidth = compartmentsMaxX - compartmentsMinX
-        totalCompartmentsLength = compartmentsMaxY - compartmentsMinY
-        
-        compartmentWidthUnit = (totalCompartmentsWidth - (input.compartmentsByX - 1) * input.wallThickness) / input.compartmentsByX
-        compartmentLengthUnit = (totalCompartmentsLength - (input.compartmentsByY - 1) * input.wallThickness) / input.compartmentsByY
-
-        for compartment in input.compartments:
-            compartmentX = compartmentsMinX + compartment.positionX * (compartmentWidthUnit + input.wallThickness)
-            compartmentY = compartmentsMinY + compartment.positionY * (compartmentLengthUnit + input.wallThickness)
-            compartmentOriginPoint = adsk.core.Point3D.create(
-                compartmentX,
-                compartmentY,
-                binBodyTotalHeight
-            )
-            compartmentWidth = compartmentWidthUnit * compartment.width + (compartment.width - 1) * input.wallThickness
-            compartmentLength = compartmentLengthUnit * compartment.length + (compartment.length - 1) * input.wallThickness
-            compartmentDepth = min(binBodyTotalHeight - const.BIN_COMPARTMENT_BOTTOM_THICKNESS, compartment.depth)
+        with futil.span('compartments'):
+            cutoutBodies = stages.run(BIN_STAGE_COMPARTMENTS, targetComponent, lambda: createBinCompartmentCutouts(input, layout, targetComponent))
+            bodiesToSubtract += cutoutBodies
+        if input.hasTab:
+            with futil.span('tabs'):
+                # top clearance cutout is always the last one
+                compartmentCutoutBodies = cutoutBodies if layout.compartmentsTopClearance is None else cutoutBodies[:-1]
+                bodiesToMerge += stages.run(BIN_STAGE_TABS, targetComponent, lambda: createBinCompartmentTabs(input, layout, compartmentCutoutBodies, targetComponent))
+
+    # combines are left to the plan of the caller, if there is one
+    bodyPlan = plan if plan is not None else BooleanPlan(targetComponent)
+    bodyPlan.cut(binBody, bodiesToSubtract, 'Bin body cutouts')
+    bodyPlan.join(binBody, bodiesToMerge, 'Bin body lip and tabs')
+    if plan is None:
+        with futil.span('body combine'):
+            bodyPlan.execute()
 
-            compartmentTabInput = BinBodyTabGeneratorInput()
-            tabOriginPoint = adsk.core.Point3D.create(
-                compartmentOriginPoint.x + max(0, min(input.tabPosition, input.binWidth - input.tabLength)) * input.baseWidth,
-                compartmentOriginPoint.y + compartmentLength,
-                compartmentOriginPoint.z,
-            )
-            compartmentTabInput.origin = tabOriginPoint
-            compartmentTabInput.length = max(0, min(input.tabLength, input.binWidth)) * input.baseWidth
-            compartmentTabInput.width = input.tabWidth
-            compartmentTabInput.overhangAngle = input.tabOverhangAngle
-            compartmentTabInput.topClearance = const.BIN_TAB_TOP_CLEARANCE
+    return binBody
 
-            [compartmentMerges, compartmentCuts] = createCompartment(
-                input.wallThickness,
-                compartmentOriginPoint,
-                compartmentWidth,
-                compartmentLength,
-                compartmentDepth,
-                input.binCornerFilletRadius - input.wallThickness,
-                input.hasScoop,
-                input.scoopMaxRadius,
-                input.hasTab,
-                compartmentTabInput,
-                targetComponent,
-            )
-            bodiesToSubtract = bodiesToSubtract + compartmentCuts
-            bodiesToMerge = bodiesToMerge + compartmentMerges
+def createBinOuterBody(
+    input: BinBodyGeneratorInput,
+    layout: BinBodyLayout,
+    targetComponent: adsk.fusion.Component,
+) -> adsk.fusion.BRepBody:
+    binBodyExtrude = extrudeUtils.createBox(
+        layout.actualBodyWidth,
+        layout.actualBodyLength,
+        layout.binBodyTotalHeight,
+        targetComponent,
+        targetComponent.xYConstructionPlane
+    )
+    binBody = binBodyExtrude.bodies.item(0)
+    binBody.name = 'Bin body'
 
-        if len(input.compartments) > 1:
-            compartmentsTopClearance = createCompartmentCutout(
-                input.wallThickness,
-                adsk.core.Point3D.create(
-                    compartmentsMinX,
-                    compartmentsMinY,
-                    binBodyTotalHeight
-                ),
-                actualBodyWidth - input.wallThickness * 2,
-                actualBodyLength - input.wallThickness - compartmentsMinY,
-                const.BIN_TAB_TOP_CLEARANCE,
-                input.binCornerFilletRadius - input.wallThickness,
-                False,
-                0,
-                False,
-                targetComponent,
-            )
-            bodiesToSubtract.append(compartmentsTopClearance)
+    # round corners
+    if input.fidelity >= const.GENERATOR_FIDELITY_STANDARD:
+        filletUtils.filletEdgesByLength(
+            binBodyExtrude.faces,
+            input.binCornerFilletRadius,
+            layout.binBodyTotalHeight,
+            targetComponent,
+        ).name = 'Bin body corner fillets'
+    return binBody
 
-    if len(bodiesToSubtract) > 0:
-        combineUtils.cutBody(
-            binBody,
-            commonUtils.objectCollectionFromList(bodiesToSubtract),
-            targetComponent
+def createBinLip(
+    input: BinBodyGeneratorInput,
+    layout: BinBodyLayout,
+    targetComponent: adsk.fusion.Component,
+) -> adsk.fusion.BRepBody:
+    features: adsk.fusion.Features = targetComponent.features
+    lipInput = BinBodyLipGeneratorInput()
+    lipInput.baseLength = input.baseLength
+    lipInput.baseWidth = input.baseWidth
+    lipInput.binLength = input.binLength
+    lipInput.binWidth = input.binWidth
+    lipInput.hasLipNotches = input.hasLipNotches
+    lipInput.xyClearance = input.xyClearance
+    lipInput.binCornerFilletRadius = input.binCornerFilletRadius
+    lipInput.origin = adsk.core.Point3D.create(*layout.lipOrigin)
+    lipInput.fidelity = input.fidelity
+    plan = BooleanPlan(targetComponent)
+    lipBody = createGridfinityBinBodyLip(lipInput, targetComponent, plan)
+
+    # chamfer box cut without its chamfers would leave a step under the lip
+    if not layout.lipBottomChamfer is None and input.fidelity >= const.GENERATOR_FIDELITY_STANDARD:
+        lipBottomChamfer = layout.lipBottomChamfer
+        lipBottomChamferExtrude = extrudeUtils.createBoxAtPoint(
+            lipBottomChamfer.width,
+            lipBottomChamfer.length,
+            lipBottomChamfer.size,
+            targetComponent,
+            adsk.core.Point3D.create(*lipBottomChamfer.origin),
+            const.SKETCH_POLICY_GEOMETRY_ONLY,
         )
-    if len(bodiesToMerge) > 0:
-        combineUtils.joinBodies(
-            binBody,
-            commonUtils.objectCollectionFromList(bodiesToMerge),
-            targetComponent
+        lipBottomChamferExtrude.name = 'Lip bottom chamfer extrude'
+        filletUtils.filletEdgesByLength(
+            lipBottomChamferExtrude.faces,
+            lipBottomChamfer.size,
+            lipBottomChamfer.size,
+            targetComponent,
         )
+        lipBottomChamferExtrudeTopFace = faceUtils.getTopFace(lipBottomChamferExtrude.bodies.item(0))
+        scoopSideEdge = min([edge for edge in lipBottomChamferExtrudeTopFace.edges if geometryUtils.isCollinearToX(edge)], key=lambda x: bRepIndex.boundingBox(x).minPoint[1])
+
+        edgesToChamfer = list(scoopSideEdge.tangentiallyConnectedEdges)[3:] if input.hasScoop else scoopSideEdge.tangentiallyConnectedEdges
+        chamferFeatures: adsk.fusion.ChamferFeatures = features.chamferFeatures
+        bottomLipChamferInput = chamferFeatures.createInput2()
+        bottomLipChamferEdges = commonUtils.objectCollectionFromList(edgesToChamfer)
+        bottomLipChamferInput.chamferEdgeSets.addEqualDistanceChamferEdgeSet(
+            bottomLipChamferEdges,
+            adsk.core.ValueInput.createByReal(lipBottomChamfer.size),
+            False)
+        chamferFeatures.add(bottomLipChamferInput)
+        plan.cut(lipBody, list(lipBottomChamferExtrude.bodies), 'Lip bottom chamfer cut')
+    plan.execute()
+    return lipBody
+
+def createBinCompartmentCutouts(
+    input: BinBodyGeneratorInput,
+    layout: BinBodyLayout,
+    targetComponent: adsk.fusion.Component,
+) -> list[adsk.fusion.BRepBody]:
+    # distinct cutout bodies, followed by the top clearance cutout when there is one
+    compartmentGroups: dict[float, list[BinBodyCutoutGeneratorInput]] = {}
+    for compartment in layout.compartments:
+        compartmentGroups.setdefault(round(compartment.cutout.depth, 6), []).append(createCompartmentCutoutInput(compartment.cutout, input.fidelity))
+
+    cutoutBodies: list[adsk.fusion.BRepBody] = []
+    # compartments of the same depth share sketch, extrude and fillet features
+    for compartmentGroup in compartmentGroups.values():
+        for cutoutBody in createGridfinityBinBodyCutouts(compartmentGroup, targetComponent):
+            if not cutoutBody in cutoutBodies:
+                cutoutBodies.append(cutoutBody)
+
+    if not layout.compartmentsTopClearance is None:
+        cutoutBodies.append(createGridfinityBinBodyCutout(
+            createCompartmentCutoutInput(layout.compartmentsTopClearance, input.fidelity),
+            targetComponent,
+        ))
+    return cutoutBodies
+
+def createBinCompartmentTabs(
+    input: BinBodyGeneratorInput,
+    layout: BinBodyLayout,
+    cutoutBodies: list[adsk.fusion.BRepBody],
+    targetComponent: adsk.fusion.Component,
+) -> list[adsk.fusion.BRepBody]:
+    tabBodies: list[adsk.fusion.BRepBody] = []
+    for compartment in layout.compartments:
+        cutoutInput = createCompartmentCutoutInput(compartment.cutout, input.fidelity)
+        # cutouts of a different depth never share a body with this compartment
+        cutoutBottom = cutoutInput.origin.z - cutoutInput.height
+        sameDepthBodies = [body for body in cutoutBodies if abs(body.boundingBox.minPoint.z - cutoutBottom) <= const.DEFAULT_FILTER_TOLERANCE]
+        tabBodies += createCompartmentTab(
+            cutoutBodyForInput(cutoutInput, sameDepthBodies if len(sameDepthBodies) > 0 else cutoutBodies),
+            createCompartmentTabInput(compartment.tab, input.fidelity),
+            targetComponent,
+        )
+    return tabBodies
 
-    return binBody
-
-
-def createCompartmentCutout(
-        wallThickness: float,
-        originPoint: adsk.core.Point3D,
-        width: float,
-        length: float,
-        depth: float,
-        cornerFilletRadius: float,
-        hasScoop: bool,
-        scoopMaxRadius: float,
-        hasBottomFillet: bool,
-        targetComponent: adsk.fusion.Component,
-    ) -> adsk.fusion.BRepBody:
-
-    innerCutoutFilletRadius = max(const.BIN_BODY_CUTOUT_BOTTOM_FILLET_RADIUS, cornerFilletRadius)
+def createCompartmentCutoutInput(cutoutLayout: BinCutoutLayout, fidelity: int = const.GENERATOR_FIDELITY_FULL) -> BinBodyCutoutGeneratorInput:
     innerCutoutInput = BinBodyCutoutGeneratorInput()
-    innerCutoutInput.origin = originPoint
-    innerCutoutInput.width = width
-    innerCutoutInput.length = length
-    innerCutoutInput.height = depth
-    innerCutoutInput.hasScoop = hasScoop
-    innerCutoutInput.scoopMaxRadius = scoopMaxRadius
-    innerCutoutInput.filletRadius = innerCutoutFilletRadius
-    innerCutoutInput.hasBottomFillet = hasBottomFillet
-
-    return createGridfinityBinBodyCutout(innerCutoutInput, targetComponent)
-
-def createCompartment(
-        wallThickness: float,
-        originPoint: adsk.core.Point3D,
-        width: float,
-        length: float,
-        depth: float,
-        cornerFilletRadius: float,
-        hasScoop: bool,
-        scoopMaxRadius: float,
-        hasTab: bool,
+    innerCutoutInput.origin = adsk.core.Point3D.create(*cutoutLayout.origin)
+    innerCutoutInput.width = cutoutLayout.width
+    innerCutoutInput.length = cutoutLayout.length
+    innerCutoutInput.height = cutoutLayout.depth
+    innerCutoutInput.hasScoop = cutoutLayout.hasScoop
+    innerCutoutInput.scoopMaxRadius = cutoutLayout.scoopMaxRadius
+    innerCutoutInput.filletRadius = cutoutLayout.filletRadius
+    innerCutoutInput.hasBottomFillet = cutoutLayout.hasBottomFillet
+    innerCutoutInput.fidelity = fidelity
+    return innerCutoutInput
+
+def createCompartmentTabInput(tabLayout: BinTabLayout, fidelity: int = const.GENERATOR_FIDELITY_FULL) -> BinBodyTabGeneratorInput:
+    tabInput = BinBodyTabGeneratorInput()
+    tabInput.origin = adsk.core.Point3D.create(*tabLayout.origin)
+    tabInput.length = tabLayout.length
+    tabInput.width = tabLayout.width
+    tabInput.overhangAngle = tabLayout.overhangAngle
+    tabInput.topClearance = tabLayout.topClearance
+    tabInput.fidelity = fidelity
+    return tabInput
+
+def createCompartmentTab(
+        innerCutoutBody: adsk.fusion.BRepBody,
         tabInput: BinBodyTabGeneratorInput,
         targetComponent: adsk.fusion.Component,
-    ) -> tuple[list[adsk.fusion.BRepBody], list[adsk.fusion.BRepBody]]:
-
-    bodiesToMerge: list[adsk.fusion.BRepBody] = []
-    bodiesToSubtract: list[adsk.fusion.BRepBody] = []
-
-    innerCutoutBody = createCompartmentCutout(
-        wallThickness,
-        originPoint,
-        width,
-        length,
-        depth,
-        cornerFilletRadius,
-        hasScoop,
-        scoopMaxRadius,
-        True,
-        targetComponent,
-    )
-    bodiesToSubtract.append(innerCutoutBody)
-
-    # label tab
-    if hasTab:
-        tabBody = createGridfinityBinBodyTab(tabInput, targetComponent)
+    ) -> list[adsk.fusion.BRepBody]:
+    tabBody = createGridfinityBinBodyTab(tabInput, targetComponent, const.SKETCH_POLICY_GEOMETRY_ONLY)
 
-        intersectTabInput = targetComponent.features.combineFeatures.createInput(
-            tabBody,
-            commonUtils.objectCollectionFromList([innerCutoutBody]),
-            )
-        intersectTabInput.operation = adsk.fusion.FeatureOperations.IntersectFeatureOperation
-        intersectTabInput.isKeepToolBodies = True
-        intersectTabFeature = targetComponent.features.combineFeatures.add(intersectTabInput)
-        bodiesToMerge = bodiesToMerge + [body for body in list(intersectTabFeature.bodies) if not body.revisionId == innerCutoutBody.revisionId]
-    return (bodiesToMerge, bodiesToSubtract)
\ No newline at end of file
+    intersectTabInput = targetComponent.features.combineFeatures.createInput(
+        tabBody,
+        commonUtils.objectCollectionFromList([innerCutoutBody]),
+        )
+    intersectTabInput.operation = adsk.fusion.FeatureOperations.IntersectFeatureOperation
+    intersectTabInput.isKeepToolBodies = True
+    intersectTabFeature = targetComponent.features.combineFeatures.add(intersectTabInput)
+    return [body for body in list(intersectTabFeature.bodies) if not body.revisionId == innerCutoutBody.revisionId]
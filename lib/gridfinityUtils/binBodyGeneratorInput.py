@@ -63,6 +63,7 @@ class BinBodyGeneratorInput():
         self.tabPosition = 0
         self.tabLength = 1
         self.tabWidth = const.BIN_TAB_WIDTH
+        self.fidelity = const.GENERATOR_FIDELITY_FULL
         self.compartments = [BinBodyCompartmentDefinition()]
         self.compartmentsByX = 1
         self.compartmentsByY = 1
@@ -243,3 +244,11 @@ class BinBodyGeneratorInput():
     @compartments.setter
     def compartments(self, value: list[BinBodyCompartmentDefinition]):
         self._compartments = value
+
+    @property
+    def fidelity(self) -> int:
+        return self._fidelity
+
+    @fidelity.setter
+    def fidelity(self, value: int):
+        self._fidelity = value
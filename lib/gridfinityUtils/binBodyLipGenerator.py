@@ -3,8 +3,9 @@ import os
 import math
 
 from ...lib import fusion360utils as futil
-from . import const, combineUtils, faceUtils, commonUtils, sketchUtils, extrudeUtils, baseGenerator, edgeUtils, filletUtils, geometryUtils
+from . import const, combineUtils, faceUtils, commonUtils, sketchUtils, extrudeUtils, baseGenerator, edgeUtils, filletUtils, geometryUtils, bRepIndex, constructionPlaneRegistry
 from .baseGeneratorInput import BaseGeneratorInput
+from .booleanPlanner import BooleanPlan
 from .binBodyLipGeneratorInput import BinBodyLipGeneratorInput
 
 app = adsk.core.Application.get()
@@ -14,13 +15,14 @@ def getInnerCutoutScoopFace(
     innerCutout: adsk.fusion.BRepBody
 ) -> tuple[adsk.fusion.BRepFace, adsk.fusion.BRepFace]:
     innerCutoutYNormalFaces = [face for face in innerCutout.faces if faceUtils.isYNormal(face)]
-    scoopFace = min(innerCutoutYNormalFaces, key=lambda x: x.boundingBox.minPoint.y)
-    oppositeFace = max(innerCutoutYNormalFaces, key=lambda x: x.boundingBox.minPoint.y)
+    scoopFace = min(innerCutoutYNormalFaces, key=lambda x: bRepIndex.boundingBox(x).minPoint[1])
+    oppositeFace = max(innerCutoutYNormalFaces, key=lambda x: bRepIndex.boundingBox(x).minPoint[1])
     return (scoopFace, oppositeFace)
 
 def createGridfinityBinBodyLip(
     input: BinBodyLipGeneratorInput,
     targetComponent: adsk.fusion.Component,
+    plan: BooleanPlan = None,
 ):
     actualLipBodyWidth = (input.baseWidth * input.binWidth) - input.xyClearance * 2.0
     actualLipBodyLength = (input.baseLength * input.binLength) - input.xyClearance * 2.0
@@ -40,21 +42,18 @@ def createGridfinityBinBodyLip(
     bodiesToSubtract: list[adsk.fusion.BRepBody] = []
 
     # round corners
-    filletUtils.filletEdgesByLength(
-        lipBodyExtrude.faces,
-        input.binCornerFilletRadius,
-        lipBodyHeight,
-        targetComponent,
-    ).name = 'Lip body corner fillets'
+    if input.fidelity >= const.GENERATOR_FIDELITY_STANDARD:
+        filletUtils.filletEdgesByLength(
+            lipBodyExtrude.faces,
+            input.binCornerFilletRadius,
+            lipBodyHeight,
+            targetComponent,
+        ).name = 'Lip body corner fillets'
 
     lipCutoutBodies: list[adsk.fusion.BRepBody] = []
-    lipCutoutPlaneInput: adsk.fusion.ConstructionPlaneInput = targetComponent.constructionPlanes.createInput()
-    lipCutoutPlaneInput.setByOffset(
-        lipBodyExtrude.endFaces.item(0),
-        adsk.core.ValueInput.createByReal(0)
-    )
 
-    if input.hasLipNotches:
+    # without notches the lip is cut with a single base shaped body spanning the whole bin
+    if input.hasLipNotches and input.fidelity >= const.GENERATOR_FIDELITY_FULL:
         lipCutoutInput = BaseGeneratorInput()
         lipCutoutInput.originPoint = geometryUtils.createOffsetPoint(
             input.origin,
@@ -67,6 +66,7 @@ def createGridfinityBinBodyLip(
         lipCutoutInput.xyClearance = input.xyClearance
         lipCutoutInput.hasBottomChamfer = False
         lipCutoutInput.cornerFilletRadius = input.binCornerFilletRadius + input.xyClearance * 2
+        lipCutoutInput.fidelity = input.fidelity
         lipCutout = baseGenerator.createSingleGridfinityBaseBody(lipCutoutInput, targetComponent)
         lipCutout.name = "Lip cutout"
         lipCutoutBodies.append(lipCutout)
@@ -95,6 +95,7 @@ def createGridfinityBinBodyLip(
             lipBodyHeight,
             targetComponent,
             lipMiddleCutoutOrigin,
+            const.SKETCH_POLICY_GEOMETRY_ONLY,
         )
         lipMidCutout.name = 'Lip middle cutout'
         filletUtils.filletEdgesByLength(
@@ -118,13 +119,18 @@ def createGridfinityBinBodyLip(
         lipCutoutInput.xyClearance = input.xyClearance
         lipCutoutInput.hasBottomChamfer = False
         lipCutoutInput.cornerFilletRadius = input.binCornerFilletRadius + input.xyClearance * 2
+        lipCutoutInput.fidelity = input.fidelity
         lipCutout = baseGenerator.createSingleGridfinityBaseBody(lipCutoutInput, targetComponent)
         lipCutout.name = 'Lip cutout'
         lipCutoutBodies.append(lipCutout)
 
     if const.BIN_LIP_TOP_RECESS_HEIGHT > const.DEFAULT_FILTER_TOLERANCE:
-        lipCutoutConstructionPlane = targetComponent.constructionPlanes.add(lipCutoutPlaneInput)
-        lipCutoutConstructionPlane.name = "top lip edge plane"
+        lipCutoutConstructionPlane = constructionPlaneRegistry.offsetPlane(
+            targetComponent.xYConstructionPlane,
+            input.origin.z + lipBodyHeight,
+            targetComponent,
+            "top lip edge plane",
+        )
         topChamferSketch: adsk.fusion.Sketch = targetComponent.sketches.add(lipCutoutConstructionPlane)
         topChamferSketch.name = "Lip top chamfer"
         sketchUtils.createRectangle(
@@ -132,6 +138,7 @@ def createGridfinityBinBodyLip(
             actualLipBodyLength,
             topChamferSketch.modelToSketchSpace(adsk.core.Point3D.create(0, 0, topChamferSketch.origin.z)),
             topChamferSketch,
+            const.SKETCH_POLICY_GEOMETRY_ONLY,
         )
         topChamferNegativeVolume = extrudeUtils.simpleDistanceExtrude(
             topChamferSketch.profiles.item(0),
@@ -145,10 +152,10 @@ def createGridfinityBinBodyLip(
         bodiesToSubtract.append(topChamferNegativeVolume.bodies.item(0))
     bodiesToSubtract = bodiesToSubtract + lipCutoutBodies
 
-    combineUtils.cutBody(
-        lipBody,
-        commonUtils.objectCollectionFromList(bodiesToSubtract),
-        targetComponent
-    )
+    # without a plan of the caller the lip is cut right away
+    lipPlan = plan if plan is not None else BooleanPlan(targetComponent)
+    lipPlan.cut(lipBody, bodiesToSubtract, 'Lip cut')
+    if plan is None:
+        lipPlan.execute()
 
     return lipBody
@@ -7,6 +7,7 @@ class BinBodyTabGeneratorInput():
         self.overhangAngle = const.BIN_TAB_OVERHANG_ANGLE
         self.labelAngle = const.BIN_TAB_LABEL_ANGLE
         self.position = 0
+        self.fidelity = const.GENERATOR_FIDELITY_FULL
 
     @property
     def topClearance(self) -> float:
@@ -56,4 +57,10 @@ class BinBodyTabGeneratorInput():
     def labelAngle(self, value: float):
         self._tablabelAngle = value
 
-    
\ No newline at end of file
+    @property
+    def fidelity(self) -> int:
+        return self._fidelity
+
+    @fidelity.setter
+    def fidelity(self, value: int):
+        self._fidelity = value
@@ -0,0 +1,125 @@
+import adsk.core, adsk.fusion, traceback
+
+from ...lib import fusion360utils as futil
+from . import const, commonUtils, combineUtils, faceUtils, geometryUtils, shellUtils
+from .baseGenerator import createBaseBodyPattern, cutBaseClearance
+from .binBodyGenerator import createGridfinityBinBody, createCompartmentTabInput
+from .binBodyTabGenerator import createGridfinityBinBodyTab
+from .binGeneratorInput import BinGeneratorInput
+from .booleanPlanner import BooleanPlan
+from .binLayoutSolver import solveShelledTabLayout
+from .binStageCache import BinStages, BIN_STAGE_BASE_PATTERN, BIN_STAGE_SHELL
+
+def createGridfinityBin(
+    input: BinGeneratorInput,
+    targetComponent: adsk.fusion.Component,
+    stages: BinStages = None,
+) -> adsk.fusion.BRepBody:
+    stages = stages if stages is not None else BinStages()
+    if input.isShelled and input.hasBody:
+        return stages.run(BIN_STAGE_SHELL, targetComponent, lambda: [createShelledGridfinityBin(input, targetComponent, stages)])[0]
+    return createMergedGridfinityBin(input, targetComponent, stages)
+
+def createBaseBodyPatternWithClearance(
+    input: BinGeneratorInput,
+    targetComponent: adsk.fusion.Component,
+) -> list[adsk.fusion.BRepBody]:
+    baseGeneratorInput = input.baseGeneratorInput
+    binBodyInput = input.binBodyGeneratorInput
+    baseBodies = createBaseBodyPattern(
+        baseGeneratorInput,
+        binBodyInput.binWidth,
+        binBodyInput.binLength,
+        targetComponent,
+    )
+    with futil.span('clearance cut', targetComponent):
+        cutBaseClearance(
+            baseGeneratorInput,
+            binBodyInput.binWidth,
+            binBodyInput.binLength,
+            targetComponent,
+        )
+    return baseBodies
+
+def createMergedGridfinityBin(
+    input: BinGeneratorInput,
+    targetComponent: adsk.fusion.Component,
+    stages: BinStages,
+) -> adsk.fusion.BRepBody:
+    binBodyInput = input.binBodyGeneratorInput
+    plan = BooleanPlan(targetComponent)
+
+    baseBodies: list[adsk.fusion.BRepBody] = []
+    if input.hasBase:
+        with futil.span('base pattern', targetComponent):
+            baseBodies = stages.run(BIN_STAGE_BASE_PATTERN, targetComponent, lambda: createBaseBodyPatternWithClearance(input, targetComponent))
+
+    binBody: adsk.fusion.BRepBody = None
+    if input.hasBody:
+        with futil.span('body', targetComponent):
+            binBody = createGridfinityBinBody(
+                binBodyInput,
+                targetComponent,
+                stages,
+                plan,
+            )
+
+    # merge everything
+    if input.hasBody and input.hasBase:
+        plan.join(binBody, baseBodies, 'Bin body base')
+    with futil.span('body combine', targetComponent):
+        plan.execute()
+    return binBody
+
+def createShelledGridfinityBin(
+    input: BinGeneratorInput,
+    targetComponent: adsk.fusion.Component,
+    stages: BinStages,
+) -> adsk.fusion.BRepBody:
+    binBodyInput = input.binBodyGeneratorInput
+    features: adsk.fusion.Features = targetComponent.features
+    combineFeatures: adsk.fusion.CombineFeatures = features.combineFeatures
+    binBody = createMergedGridfinityBin(input, targetComponent, stages)
+
+    with futil.span('shell', targetComponent):
+        # face.boundingBox.maxPoint.z ~ face.boundingBox.minPoint.z => face horizontal
+        # largest horizontal face
+        horizontalFaces = [face for face in binBody.faces if geometryUtils.isHorizontal(face)]
+        topFace = faceUtils.maxByArea(horizontalFaces)
+        if binBodyInput.hasLip:
+            splitBodyFeatures = features.splitBodyFeatures
+            splitBodyInput = splitBodyFeatures.createInput(
+                binBody,
+                topFace,
+                True
+            )
+            splitBodies = splitBodyFeatures.add(splitBodyInput)
+            bottomBody = min(splitBodies.bodies, key=lambda x: x.boundingBox.minPoint.z)
+            topBody = max(splitBodies.bodies, key=lambda x: x.boundingBox.minPoint.z)
+            horizontalFaces = [face for face in bottomBody.faces if geometryUtils.isHorizontal(face)]
+            topFace = faceUtils.maxByArea(horizontalFaces)
+            shellUtils.simpleShell([topFace], binBodyInput.wallThickness - binBodyInput.xyClearance, targetComponent)
+            toolBodies = adsk.core.ObjectCollection.create()
+            toolBodies.add(topBody)
+            combineAfterShellFeatureInput = combineFeatures.createInput(bottomBody, toolBodies)
+            combineFeatures.add(combineAfterShellFeatureInput)
+            binBody = targetComponent.bRepBodies.item(0)
+        else:
+            shellUtils.simpleShell([topFace], binBodyInput.wallThickness - binBodyInput.xyClearance, targetComponent)
+
+    if binBodyInput.hasTab:
+        with futil.span('shelled tab', targetComponent):
+            compartmentTabInput = createCompartmentTabInput(solveShelledTabLayout(binBodyInput), binBodyInput.fidelity)
+            tabBody = createGridfinityBinBodyTab(compartmentTabInput, targetComponent, const.SKETCH_POLICY_GEOMETRY_ONLY)
+            combineInput = combineFeatures.createInput(tabBody, commonUtils.objectCollectionFromList([binBody]))
+            combineInput.operation = adsk.fusion.FeatureOperations.CutFeatureOperation
+            combineInput.isKeepToolBodies = True
+            combineFeature = combineFeatures.add(combineInput)
+            tabBodies = [body for body in combineFeature.bodies if body.faces != binBody.faces]
+            tabMainBody = max([body for body in tabBodies], key=lambda x: x.edges.count)
+            bodiesToRemove = [body for body in tabBodies if body is not tabMainBody]
+            for body in bodiesToRemove:
+                features.removeFeatures.add(body)
+            combineUtils.joinBodies(binBody, commonUtils.objectCollectionFromList([tabMainBody]), targetComponent)
+
+    return binBody
@@ -0,0 +1,52 @@
+import adsk.core, adsk.fusion, traceback
+
+from .baseGeneratorInput import BaseGeneratorInput
+from .binBodyGeneratorInput import BinBodyGeneratorInput
+
+class BinGeneratorInput():
+    def __init__(self):
+        self.baseGeneratorInput = BaseGeneratorInput()
+        self.binBodyGeneratorInput = BinBodyGeneratorInput()
+        self.hasBase = True
+        self.hasBody = True
+        self.isShelled = False
+
+    @property
+    def baseGeneratorInput(self) -> BaseGeneratorInput:
+        return self._baseGeneratorInput
+
+    @baseGeneratorInput.setter
+    def baseGeneratorInput(self, value: BaseGeneratorInput):
+        self._baseGeneratorInput = value
+
+    @property
+    def binBodyGeneratorInput(self) -> BinBodyGeneratorInput:
+        return self._binBodyGeneratorInput
+
+    @binBodyGeneratorInput.setter
+    def binBodyGeneratorInput(self, value: BinBodyGeneratorInput):
+        self._binBodyGeneratorInput = value
+
+    @property
+    def hasBase(self) -> bool:
+        return self._hasBase
+
+    @hasBase.setter
+    def hasBase(self, value: bool):
+        self._hasBase = value
+
+    @property
+    def hasBody(self) -> bool:
+        return self._hasBody
+
+    @hasBody.setter
+    def hasBody(self, value: bool):
+        self._hasBody = value
+
+    @property
+    def isShelled(self) -> bool:
+        return self._isShelled
+
+    @isShelled.setter
+    def isShelled(self, value: bool):
+        self._isShelled = value
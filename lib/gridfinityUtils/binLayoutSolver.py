@@ -0,0 +1,188 @@
+from . import const
+from .binBodyGeneratorInput import BinBodyGeneratorInput
+from .binGeneratorInput import BinGeneratorInput
+
+# Derived bin dimensions computed from generator inputs without touching the CAD API.
+# Generators, preview and dialog tables take sizes from here so they always agree.
+# Points are (x, y, z) tuples in bin component coordinates, all sizes are in cm.
+
+class BinTabLayout():
+    def __init__(self, origin: tuple[float, float, float], length: float, width: float, overhangAngle: float):
+        self.origin = origin
+        self.length = length
+        self.width = width
+        self.overhangAngle = overhangAngle
+        self.topClearance = const.BIN_TAB_TOP_CLEARANCE
+
+class BinCutoutLayout():
+    # box cut down from the origin z, origin is the min x, min y corner
+    def __init__(
+        self,
+        origin: tuple[float, float, float],
+        width: float,
+        length: float,
+        depth: float,
+        cornerFilletRadius: float,
+        hasScoop: bool,
+        scoopMaxRadius: float,
+        hasBottomFillet: bool,
+    ):
+        self.origin = origin
+        self.width = width
+        self.length = length
+        self.depth = depth
+        self.filletRadius = max(const.BIN_BODY_CUTOUT_BOTTOM_FILLET_RADIUS, cornerFilletRadius)
+        self.hasScoop = hasScoop
+        self.scoopMaxRadius = scoopMaxRadius
+        self.hasBottomFillet = hasBottomFillet
+
+class BinCompartmentLayout():
+    def __init__(self, cutout: BinCutoutLayout, tab: BinTabLayout):
+        self.cutout = cutout
+        self.tab = tab
+
+class BinLipChamferLayout():
+    # box at the bottom of the lip, its top edges are chamfered and the box is cut from the lip
+    def __init__(self, origin: tuple[float, float, float], width: float, length: float, size: float):
+        self.origin = origin
+        self.width = width
+        self.length = length
+        self.size = size
+
+class BinBodyLayout():
+    def __init__(self):
+        self.actualBodyWidth = 0.0
+        self.actualBodyLength = 0.0
+        self.binBodyTotalHeight = 0.0
+        self.lipOrigin: tuple[float, float, float] = None
+        self.lipBottomChamfer: BinLipChamferLayout = None
+        self.compartmentsMinX = 0.0
+        self.compartmentsMaxX = 0.0
+        self.compartmentsMinY = 0.0
+        self.compartmentsMaxY = 0.0
+        self.compartmentWidthUnit = 0.0
+        self.compartmentLengthUnit = 0.0
+        self.compartments: list[BinCompartmentLayout] = []
+        self.compartmentsTopClearance: BinCutoutLayout = None
+
+class BinLayout():
+    def __init__(self, body: BinBodyLayout, shelledTab: BinTabLayout):
+        self.body = body
+        self.shelledTab = shelledTab
+
+def actualBinSize(baseSize: float, binSize: float, xyClearance: float):
+    return baseSize * binSize - xyClearance * 2
+
+def binBodyTotalHeight(binHeight: float, heightUnit: float):
+    # body above the base, the base itself is BIN_BASE_HEIGHT tall
+    return (binHeight - 1) * heightUnit + max(0, heightUnit - const.BIN_BASE_HEIGHT)
+
+def binTotalHeight(binHeight: float, heightUnit: float, hasLip: bool):
+    return binHeight * heightUnit + ((const.BIN_LIP_EXTRA_HEIGHT - const.BIN_LIP_TOP_RECESS_HEIGHT) if hasLip else 0)
+
+def compartmentsMinY(wallThickness: float, xyClearance: float, hasLip: bool, hasScoop: bool):
+    # scoop side wall follows the lip instead of the bin wall
+    return (const.BIN_LIP_WALL_THICKNESS - xyClearance) if hasLip and hasScoop else wallThickness
+
+def compartmentUnitSize(totalSize: float, count: int, wallThickness: float):
+    return (totalSize - (count - 1) * wallThickness) / count
+
+def tabStartOffset(tabPosition: float, tabLength: float, binWidth: float, baseWidth: float):
+    return max(0, min(tabPosition, binWidth - tabLength)) * baseWidth
+
+def tabActualLength(tabLength: float, binWidth: float, baseWidth: float):
+    return max(0, min(tabLength, binWidth)) * baseWidth
+
+def solveBinBodyLayout(input: BinBodyGeneratorInput) -> BinBodyLayout:
+    layout = BinBodyLayout()
+    layout.actualBodyWidth = actualBinSize(input.baseWidth, input.binWidth, input.xyClearance)
+    layout.actualBodyLength = actualBinSize(input.baseLength, input.binLength, input.xyClearance)
+    layout.binBodyTotalHeight = binBodyTotalHeight(input.binHeight, input.heightUnit)
+
+    if input.hasLip:
+        layout.lipOrigin = (0, 0, layout.binBodyTotalHeight)
+        if input.wallThickness < const.BIN_LIP_WALL_THICKNESS:
+            layout.lipBottomChamfer = BinLipChamferLayout(
+                (
+                    input.wallThickness,
+                    (const.BIN_LIP_WALL_THICKNESS - input.xyClearance) if input.hasScoop else input.wallThickness,
+                    layout.binBodyTotalHeight,
+                ),
+                layout.actualBodyWidth - input.wallThickness * 2,
+                (layout.actualBodyLength - input.wallThickness - const.BIN_LIP_WALL_THICKNESS + input.xyClearance) if input.hasScoop else (layout.actualBodyLength - input.wallThickness * 2),
+                max(const.BIN_BODY_CUTOUT_BOTTOM_FILLET_RADIUS, input.binCornerFilletRadius - input.wallThickness),
+            )
+
+    if input.isSolid:
+        return layout
+
+    layout.compartmentsMinX = input.wallThickness
+    layout.compartmentsMaxX = layout.actualBodyWidth - input.wallThickness
+    layout.compartmentsMinY = compartmentsMinY(input.wallThickness, input.xyClearance, input.hasLip, input.hasScoop)
+    layout.compartmentsMaxY = layout.actualBodyLength - input.wallThickness
+    layout.compartmentWidthUnit = compartmentUnitSize(layout.compartmentsMaxX - layout.compartmentsMinX, input.compartmentsByX, input.wallThickness)
+    layout.compartmentLengthUnit = compartmentUnitSize(layout.compartmentsMaxY - layout.compartmentsMinY, input.compartmentsByY, input.wallThickness)
+    compartmentCornerRadius = input.binCornerFilletRadius - input.wallThickness
+
+    for compartment in input.compartments:
+        compartmentOrigin = (
+            layout.compartmentsMinX + compartment.positionX * (layout.compartmentWidthUnit + input.wallThickness),
+            layout.compartmentsMinY + compartment.positionY * (layout.compartmentLengthUnit + input.wallThickness),
+            layout.binBodyTotalHeight,
+        )
+        compartmentWidth = layout.compartmentWidthUnit * compartment.width + (compartment.width - 1) * input.wallThickness
+        compartmentLength = layout.compartmentLengthUnit * compartment.length + (compartment.length - 1) * input.wallThickness
+        compartmentDepth = min(layout.binBodyTotalHeight - const.BIN_COMPARTMENT_BOTTOM_THICKNESS, compartment.depth)
+        layout.compartments.append(BinCompartmentLayout(
+            BinCutoutLayout(
+                compartmentOrigin,
+                compartmentWidth,
+                compartmentLength,
+                compartmentDepth,
+                compartmentCornerRadius,
+                input.hasScoop,
+                input.scoopMaxRadius,
+                True,
+            ),
+            BinTabLayout(
+                (
+                    compartmentOrigin[0] + tabStartOffset(input.tabPosition, input.tabLength, input.binWidth, input.baseWidth),
+                    compartmentOrigin[1] + compartmentLength,
+                    compartmentOrigin[2],
+                ),
+                tabActualLength(input.tabLength, input.binWidth, input.baseWidth),
+                input.tabWidth,
+                input.tabOverhangAngle,
+            ),
+        ))
+
+    if len(input.compartments) > 1:
+        layout.compartmentsTopClearance = BinCutoutLayout(
+            (layout.compartmentsMinX, layout.compartmentsMinY, layout.binBodyTotalHeight),
+            layout.actualBodyWidth - input.wallThickness * 2,
+            layout.actualBodyLength - input.wallThickness - layout.compartmentsMinY,
+            const.BIN_TAB_TOP_CLEARANCE,
+            compartmentCornerRadius,
+            False,
+            0,
+            False,
+        )
+    return layout
+
+def solveShelledTabLayout(input: BinBodyGeneratorInput) -> BinTabLayout:
+    # single tab added along the back wall after the body is shelled
+    return BinTabLayout(
+        (
+            input.wallThickness + tabStartOffset(input.tabPosition, input.tabLength, input.binWidth, input.baseWidth),
+            const.BIN_LIP_WALL_THICKNESS if input.hasLip and input.hasScoop else input.binLength * input.baseLength - input.xyClearance * 2,
+            binBodyTotalHeight(input.binHeight, input.heightUnit),
+        ),
+        tabActualLength(input.tabLength, input.binWidth, input.baseWidth) - input.wallThickness * 2 - input.xyClearance * 2,
+        input.tabWidth,
+        input.tabOverhangAngle,
+    )
+
+def solveBinLayout(input: BinGeneratorInput) -> BinLayout:
+    binBodyInput = input.binBodyGeneratorInput
+    shelledTab = solveShelledTabLayout(binBodyInput) if input.isShelled and input.hasBody and binBodyInput.hasTab else None
+    return BinLayout(solveBinBodyLayout(binBodyInput), shelledTab)
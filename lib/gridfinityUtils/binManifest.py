@@ -0,0 +1,206 @@
+import adsk.core, adsk.fusion, traceback
+import csv
+import json
+import math
+import os
+
+from . import const
+from .baseGeneratorInput import BaseGeneratorInput
+from .binBodyGenerator import uniformCompartments
+from .binBodyGeneratorInput import BinBodyGeneratorInput, BinBodyCompartmentDefinition
+from .binGeneratorInput import BinGeneratorInput
+
+# Manifest entries use the same field names as BinBodyGeneratorInput and BaseGeneratorInput.
+# Lengths are in mm, angles in degrees, bin width, length and height in base units.
+# JSON manifest is a list of entries (or {"bins": [...]}), CSV has one entry per row
+# with compartments written as "x y w l [depth]" groups separated by ';'.
+# Invalid entries are kept with an 'error' message so the rest of the batch still runs.
+
+BIN_TYPE_HOLLOW = 'hollow'
+BIN_TYPE_SHELLED = 'shelled'
+BIN_TYPE_SOLID = 'solid'
+
+MM_FIELDS = [
+    'baseWidth', 'baseLength', 'heightUnit', 'xyClearance', 'wallThickness', 'scoopMaxRadius',
+    'tabWidth', 'screwHolesDiameter', 'magnetCutoutsDiameter', 'magnetCutoutsDepth',
+]
+BOOL_FIELDS = [
+    'hasBase', 'hasBody', 'hasLip', 'hasLipNotches', 'hasScoop', 'hasTab',
+    'hasScrewHoles', 'hasMagnetCutouts', 'hasMagnetCutoutsTabs',
+]
+NUMBER_FIELDS = ['binWidth', 'binLength', 'binHeight', 'tabLength', 'tabPosition', 'tabOverhangAngle']
+INT_FIELDS = ['count', 'compartmentsByX', 'compartmentsByY']
+
+DEFAULT_ENTRY = {
+    'name': '',
+    'count': 1,
+    'binType': BIN_TYPE_HOLLOW,
+    'hasBase': True,
+    'hasBody': True,
+    'baseWidth': const.DIMENSION_DEFAULT_WIDTH_UNIT * 10,
+    'baseLength': const.DIMENSION_DEFAULT_WIDTH_UNIT * 10,
+    'heightUnit': const.DIMENSION_DEFAULT_HEIGHT_UNIT * 10,
+    'xyClearance': const.BIN_XY_CLEARANCE * 10,
+    'binWidth': 1,
+    'binLength': 1,
+    'binHeight': 5,
+    'wallThickness': const.BIN_WALL_THICKNESS * 10,
+    'hasLip': True,
+    'hasLipNotches': False,
+    'hasScoop': False,
+    'scoopMaxRadius': const.BIN_SCOOP_MAX_RADIUS * 10,
+    'hasTab': False,
+    'tabLength': 1,
+    'tabWidth': const.BIN_TAB_WIDTH * 10,
+    'tabPosition': 0,
+    'tabOverhangAngle': const.BIN_TAB_OVERHANG_ANGLE,
+    'hasScrewHoles': False,
+    'hasMagnetCutouts': False,
+    'hasMagnetCutoutsTabs': False,
+    'screwHolesDiameter': const.DIMENSION_SCREW_HOLE_DIAMETER * 10,
+    'magnetCutoutsDiameter': const.DIMENSION_MAGNET_CUTOUT_DIAMETER * 10,
+    'magnetCutoutsDepth': const.DIMENSION_MAGNET_CUTOUT_DEPTH * 10,
+    'compartmentsByX': 1,
+    'compartmentsByY': 1,
+    'compartments': None,
+}
+
+class BinManifestError(Exception):
+    pass
+
+def readBinManifest(path: str) -> list[dict]:
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, newline='') as manifestFile:
+        if extension == '.json':
+            rawEntries = json.load(manifestFile)
+            if isinstance(rawEntries, dict):
+                rawEntries = rawEntries.get('bins', [])
+        elif extension == '.csv':
+            rawEntries = [{key.strip(): value.strip() for (key, value) in row.items() if key and value and value.strip()} for row in csv.DictReader(manifestFile)]
+        else:
+            raise BinManifestError(f'Unsupported manifest format "{extension}", expected .json or .csv')
+    if not isinstance(rawEntries, list):
+        raise BinManifestError('Manifest must contain a list of bins')
+    entries = []
+    for (index, rawEntry) in enumerate(rawEntries):
+        try:
+            entries.append(parseManifestEntry(rawEntry, index))
+        except BinManifestError as err:
+            name = rawEntry.get('name') if isinstance(rawEntry, dict) else None
+            entries.append({'name': str(name or f'Entry {index + 1}'), 'count': 1, 'error': str(err)})
+    return entries
+
+def parseManifestEntry(rawEntry: dict, index: int) -> dict:
+    if not isinstance(rawEntry, dict):
+        raise BinManifestError(f'Entry {index + 1}: expected an object with bin fields')
+    unknownFields = [key for key in rawEntry if key not in DEFAULT_ENTRY]
+    if len(unknownFields) > 0:
+        raise BinManifestError(f'Entry {index + 1}: unknown fields {", ".join(unknownFields)}')
+    entry = dict(DEFAULT_ENTRY)
+    entry.update(rawEntry)
+    try:
+        for key in BOOL_FIELDS:
+            entry[key] = _parseBool(entry[key])
+        for key in MM_FIELDS + NUMBER_FIELDS:
+            entry[key] = float(entry[key])
+        for key in INT_FIELDS:
+            entry[key] = int(entry[key])
+        entry['compartments'] = _parseCompartments(entry['compartments'])
+    except (TypeError, ValueError) as err:
+        raise BinManifestError(f'Entry {index + 1}: {err}')
+    entry['binType'] = str(entry['binType']).lower()
+    if not entry['binType'] in [BIN_TYPE_HOLLOW, BIN_TYPE_SHELLED, BIN_TYPE_SOLID]:
+        raise BinManifestError(f'Entry {index + 1}: unknown bin type "{entry["binType"]}"')
+    for key in ['binWidth', 'binLength', 'binHeight', 'baseWidth', 'baseLength', 'heightUnit', 'count']:
+        if entry[key] <= 0:
+            raise BinManifestError(f'Entry {index + 1}: {key} must be positive')
+    entry['error'] = None
+    if not entry['name']:
+        entry['name'] = 'Gridfinity bin {}x{}x{}'.format(int(entry['binLength']), int(entry['binWidth']), int(entry['binHeight']))
+    return entry
+
+def createBinGeneratorInputFromManifest(entry: dict, originPoint: adsk.core.Point3D) -> BinGeneratorInput:
+    isSolid = entry['binType'] == BIN_TYPE_SOLID
+    isShelled = entry['binType'] == BIN_TYPE_SHELLED
+    xyClearance = entry['xyClearance'] / 10
+
+    baseGeneratorInput = BaseGeneratorInput()
+    baseGeneratorInput.originPoint = adsk.core.Point3D.create(originPoint.x - xyClearance, originPoint.y - xyClearance, originPoint.z)
+    baseGeneratorInput.baseWidth = entry['baseWidth'] / 10
+    baseGeneratorInput.baseLength = entry['baseLength'] / 10
+    baseGeneratorInput.xyClearance = xyClearance
+    baseGeneratorInput.hasScrewHoles = entry['hasScrewHoles'] and not isShelled
+    baseGeneratorInput.hasMagnetCutouts = entry['hasMagnetCutouts'] and not isShelled
+    baseGeneratorInput.hasMagnetCutoutsTabs = entry['hasMagnetCutoutsTabs'] and not isShelled
+    baseGeneratorInput.screwHolesDiameter = entry['screwHolesDiameter'] / 10
+    baseGeneratorInput.magnetCutoutsDiameter = entry['magnetCutoutsDiameter'] / 10
+    baseGeneratorInput.magnetCutoutsDepth = entry['magnetCutoutsDepth'] / 10
+
+    binBodyInput = BinBodyGeneratorInput()
+    binBodyInput.hasLip = entry['hasLip']
+    binBodyInput.hasLipNotches = entry['hasLipNotches']
+    binBodyInput.binWidth = entry['binWidth']
+    binBodyInput.binLength = entry['binLength']
+    binBodyInput.binHeight = entry['binHeight']
+    binBodyInput.baseWidth = entry['baseWidth'] / 10
+    binBodyInput.baseLength = entry['baseLength'] / 10
+    binBodyInput.heightUnit = entry['heightUnit'] / 10
+    binBodyInput.xyClearance = xyClearance
+    binBodyInput.binCornerFilletRadius = const.BIN_CORNER_FILLET_RADIUS - xyClearance
+    binBodyInput.isSolid = isSolid or isShelled
+    binBodyInput.wallThickness = entry['wallThickness'] / 10
+    binBodyInput.hasScoop = entry['hasScoop'] and not isSolid and not isShelled
+    binBodyInput.scoopMaxRadius = entry['scoopMaxRadius'] / 10
+    binBodyInput.hasTab = entry['hasTab'] and not isSolid
+    binBodyInput.tabLength = entry['tabLength']
+    binBodyInput.tabWidth = entry['tabWidth'] / 10
+    binBodyInput.tabPosition = entry['tabPosition']
+    binBodyInput.tabOverhangAngle = math.radians(entry['tabOverhangAngle'])
+    binBodyInput.compartmentsByX = entry['compartmentsByX']
+    binBodyInput.compartmentsByY = entry['compartmentsByY']
+    if entry['compartments'] is None:
+        binBodyInput.compartments = uniformCompartments(binBodyInput.compartmentsByX, binBodyInput.compartmentsByY)
+    else:
+        binBodyInput.compartments = [
+            BinBodyCompartmentDefinition(x, y, w, l, depth / 10) if not depth is None else BinBodyCompartmentDefinition(x, y, w, l)
+            for (x, y, w, l, depth) in entry['compartments']
+        ]
+
+    binGeneratorInput = BinGeneratorInput()
+    binGeneratorInput.baseGeneratorInput = baseGeneratorInput
+    binGeneratorInput.binBodyGeneratorInput = binBodyInput
+    binGeneratorInput.hasBase = entry['hasBase']
+    binGeneratorInput.hasBody = entry['hasBody']
+    binGeneratorInput.isShelled = isShelled
+    return binGeneratorInput
+
+def _parseBool(value):
+    if isinstance(value, str):
+        if value.strip().lower() in ['1', 'true', 'yes', 'y']:
+            return True
+        if value.strip().lower() in ['0', 'false', 'no', 'n']:
+            return False
+        raise ValueError(f'"{value}" is not a boolean value')
+    return bool(value)
+
+def _parseCompartments(value):
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = [group.split() for group in value.split(';') if group.strip()]
+    compartments = []
+    for compartment in value:
+        if isinstance(compartment, dict):
+            compartment = [
+                compartment.get('positionX', 0),
+                compartment.get('positionY', 0),
+                compartment.get('width', 1),
+                compartment.get('length', 1),
+                compartment.get('depth'),
+            ]
+        if not len(compartment) in [4, 5]:
+            raise ValueError(f'compartment "{compartment}" must have position x, y, width, length and optional depth')
+        (x, y, w, l) = [int(item) for item in compartment[:4]]
+        depth = float(compartment[4]) if len(compartment) == 5 and not compartment[4] is None else None
+        compartments.append((x, y, w, l, depth))
+    return compartments
@@ -0,0 +1,131 @@
+import adsk.core, adsk.fusion, traceback
+import math
+
+from . import const, temporaryShapeUtils
+from .baseGeneratorInput import BaseGeneratorInput
+from .binGeneratorInput import BinGeneratorInput
+from .binLayoutSolver import solveBinBodyLayout
+
+# Preview geometry is approximated: chamfers are replaced with steps, fillets on edges,
+# scoop, label tab, lip notches and magnet tabs are omitted.
+# Outer dimensions, compartments and holes match the parametric bin.
+
+def createGridfinityBasePreviewBody(input: BaseGeneratorInput) -> adsk.fusion.BRepBody:
+    # steps approximating top chamfer, vertical mid section and bottom chamfer, counted from the top
+    topSectionInset = const.BIN_BASE_TOP_SECTION_HEIGH / 2
+    midSectionInset = const.BIN_BASE_TOP_SECTION_HEIGH
+    bottomSectionInset = const.BIN_BASE_TOP_SECTION_HEIGH + (const.BIN_BASE_BOTTOM_SECTION_HEIGH / 2 if input.hasBottomChamfer else 0)
+    sections = [
+        (topSectionInset, 0, const.BIN_BASE_TOP_SECTION_HEIGH),
+        (midSectionInset, const.BIN_BASE_TOP_SECTION_HEIGH, const.BIN_BASE_MID_SECTION_HEIGH),
+        (bottomSectionInset, const.BIN_BASE_TOP_SECTION_HEIGH + const.BIN_BASE_MID_SECTION_HEIGH, const.BIN_BASE_BOTTOM_SECTION_HEIGH),
+    ]
+    sectionBodies = [temporaryShapeUtils.roundedBox(
+        adsk.core.Point3D.create(input.originPoint.x + inset, input.originPoint.y + inset, input.originPoint.z - offset - height),
+        input.baseWidth - inset * 2,
+        input.baseLength - inset * 2,
+        height,
+        max(0, input.cornerFilletRadius - inset),
+    ) for (inset, offset, height) in sections]
+    baseBody = temporaryShapeUtils.joinBodies(sectionBodies[0], sectionBodies[1:])
+
+    # cutouts are placed the same way as in the parametric base, one hole rotated around the base center
+    baseBottomZ = input.originPoint.z - const.BIN_BASE_HEIGHT
+    holeOffset = const.DIMENSION_SCREW_HOLES_OFFSET - input.xyClearance
+    centerX = input.baseWidth / 2 - input.xyClearance
+    centerY = input.baseLength / 2 - input.xyClearance
+    cutoutBodies: list[adsk.fusion.BRepBody] = []
+    for i in range(4):
+        angle = math.radians(90 * i)
+        holeCenter = adsk.core.Point3D.create(
+            centerX + (holeOffset - centerX) * math.cos(angle) - (holeOffset - centerY) * math.sin(angle),
+            centerY + (holeOffset - centerX) * math.sin(angle) + (holeOffset - centerY) * math.cos(angle),
+            baseBottomZ,
+        )
+        if input.hasScrewHoles:
+            cutoutBodies.append(temporaryShapeUtils.simpleCylinder(holeCenter, input.screwHolesDiameter / 2, const.BIN_BASE_HEIGHT))
+        if input.hasMagnetCutouts:
+            cutoutBodies.append(temporaryShapeUtils.simpleCylinder(holeCenter, input.magnetCutoutsDiameter / 2, input.magnetCutoutsDepth))
+    return temporaryShapeUtils.cutBody(baseBody, cutoutBodies)
+
+def createGridfinityBinPreview(
+    input: BinGeneratorInput,
+    targetComponent: adsk.fusion.Component,
+) -> adsk.fusion.BRepBody:
+    baseGeneratorInput = input.baseGeneratorInput
+    binBodyInput = input.binBodyGeneratorInput
+    bodies: list[adsk.fusion.BRepBody] = []
+
+    if input.hasBase:
+        baseBody = createGridfinityBasePreviewBody(baseGeneratorInput)
+        for i in range(int(binBodyInput.binWidth)):
+            for j in range(int(binBodyInput.binLength)):
+                bodies.append(temporaryShapeUtils.translatedCopy(
+                    baseBody,
+                    byX=i * baseGeneratorInput.baseWidth,
+                    byY=j * baseGeneratorInput.baseLength,
+                ))
+
+    if input.hasBody:
+        bodies.insert(0, createBinBodyPreview(input))
+
+    if len(bodies) == 0:
+        return None
+    binBody = temporaryShapeUtils.joinBodies(bodies[0], bodies[1:])
+    return temporaryShapeUtils.addToComponent([binBody], 'Bin preview', targetComponent)[0]
+
+def createBinBodyPreview(input: BinGeneratorInput) -> adsk.fusion.BRepBody:
+    binBodyInput = input.binBodyGeneratorInput
+    layout = solveBinBodyLayout(binBodyInput)
+    lipHeight = const.BIN_LIP_EXTRA_HEIGHT if binBodyInput.hasLip else 0
+    origin = adsk.core.Point3D.create(0, 0, 0)
+
+    binBody = temporaryShapeUtils.roundedBox(
+        origin,
+        layout.actualBodyWidth,
+        layout.actualBodyLength,
+        layout.binBodyTotalHeight + lipHeight,
+        binBodyInput.binCornerFilletRadius,
+    )
+
+    toolBodies: list[adsk.fusion.BRepBody] = []
+    if binBodyInput.hasLip:
+        toolBodies.append(temporaryShapeUtils.roundedBox(
+            adsk.core.Point3D.create(const.BIN_LIP_WALL_THICKNESS, const.BIN_LIP_WALL_THICKNESS, layout.binBodyTotalHeight),
+            layout.actualBodyWidth - const.BIN_LIP_WALL_THICKNESS * 2,
+            layout.actualBodyLength - const.BIN_LIP_WALL_THICKNESS * 2,
+            lipHeight,
+            binBodyInput.binCornerFilletRadius - const.BIN_LIP_WALL_THICKNESS,
+        ))
+
+    if input.isShelled:
+        shellThickness = binBodyInput.wallThickness - binBodyInput.xyClearance
+        toolBodies.append(temporaryShapeUtils.roundedBox(
+            adsk.core.Point3D.create(shellThickness, shellThickness, shellThickness),
+            layout.actualBodyWidth - shellThickness * 2,
+            layout.actualBodyLength - shellThickness * 2,
+            layout.binBodyTotalHeight - shellThickness,
+            binBodyInput.binCornerFilletRadius - shellThickness,
+        ))
+    elif not binBodyInput.isSolid:
+        compartmentRadius = binBodyInput.binCornerFilletRadius - binBodyInput.wallThickness
+        for compartment in layout.compartments:
+            cutout = compartment.cutout
+            toolBodies.append(temporaryShapeUtils.roundedBox(
+                adsk.core.Point3D.create(cutout.origin[0], cutout.origin[1], cutout.origin[2] - cutout.depth),
+                cutout.width,
+                cutout.length,
+                cutout.depth + lipHeight,
+                compartmentRadius,
+            ))
+
+        if not layout.compartmentsTopClearance is None:
+            toolBodies.append(temporaryShapeUtils.roundedBox(
+                adsk.core.Point3D.create(layout.compartmentsMinX, layout.compartmentsMinY, layout.binBodyTotalHeight - const.BIN_TAB_TOP_CLEARANCE),
+                layout.compartmentsMaxX - layout.compartmentsMinX,
+                layout.compartmentsMaxY - layout.compartmentsMinY,
+                const.BIN_TAB_TOP_CLEARANCE + lipHeight,
+                compartmentRadius,
+            ))
+
+    return temporaryShapeUtils.cutBody(binBody, toolBodies)
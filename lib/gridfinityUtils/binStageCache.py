@@ -0,0 +1,112 @@
+import adsk.core, adsk.fusion, traceback
+from typing import Callable
+
+from ...lib import fusion360utils as futil
+from ... import config
+from . import temporaryShapeUtils
+from .binGeneratorInput import BinGeneratorInput
+from .generatorInputHash import generatorInputHash
+
+# Bin generation is split into stages, each stage result is kept as temporary b-rep copies
+# keyed on the inputs the stage is built from. Between consecutive previews only stages
+# whose inputs changed are rebuilt, the others are added back with a single base feature.
+# Only the latest result of every stage is kept.
+BIN_STAGE_BASE_PATTERN = 'base pattern'
+BIN_STAGE_OUTER_BODY = 'outer body'
+BIN_STAGE_LIP = 'lip'
+BIN_STAGE_COMPARTMENTS = 'compartments'
+BIN_STAGE_TABS = 'tabs'
+BIN_STAGE_SHELL = 'shell'
+
+# BinBodyGeneratorInput fields every stage is built from
+BIN_STAGE_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    BIN_STAGE_BASE_PATTERN: ('binWidth', 'binLength'),
+    BIN_STAGE_OUTER_BODY: (
+        'baseWidth', 'baseLength', 'binWidth', 'binLength', 'binHeight', 'heightUnit', 'xyClearance',
+        'binCornerFilletRadius', 'fidelity',
+    ),
+    BIN_STAGE_LIP: (
+        'baseWidth', 'baseLength', 'binWidth', 'binLength', 'binHeight', 'heightUnit', 'xyClearance',
+        'binCornerFilletRadius', 'wallThickness', 'hasLip', 'hasLipNotches', 'hasScoop', 'fidelity',
+    ),
+    BIN_STAGE_COMPARTMENTS: (
+        'baseWidth', 'baseLength', 'binWidth', 'binLength', 'binHeight', 'heightUnit', 'xyClearance',
+        'binCornerFilletRadius', 'wallThickness', 'isSolid', 'hasLip', 'hasScoop', 'scoopMaxRadius',
+        'compartments', 'compartmentsByX', 'compartmentsByY', 'fidelity',
+    ),
+    BIN_STAGE_TABS: (
+        'baseWidth', 'binWidth', 'hasTab', 'tabWidth', 'tabLength', 'tabPosition', 'tabOverhangAngle', 'fidelity',
+    ),
+    BIN_STAGE_SHELL: (
+        'baseWidth', 'baseLength', 'binWidth', 'binLength', 'binHeight', 'heightUnit', 'xyClearance',
+        'wallThickness', 'hasLip', 'hasTab', 'tabWidth', 'tabLength', 'tabPosition', 'tabOverhangAngle', 'fidelity',
+    ),
+}
+# BinGeneratorInput fields of stages which are not fully described by the bin body input
+BIN_STAGE_GENERATOR_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    BIN_STAGE_BASE_PATTERN: ('baseGeneratorInput',),
+    BIN_STAGE_SHELL: ('hasBase', 'hasBody', 'isShelled'),
+}
+# stages built on top of bodies of other stages, in the order stages are keyed
+BIN_STAGE_UPSTREAM: dict[str, tuple[str, ...]] = {
+    BIN_STAGE_BASE_PATTERN: (),
+    BIN_STAGE_OUTER_BODY: (),
+    BIN_STAGE_LIP: (),
+    BIN_STAGE_COMPARTMENTS: (),
+    # tabs are trimmed by the compartment cutouts
+    BIN_STAGE_TABS: (BIN_STAGE_COMPARTMENTS,),
+    BIN_STAGE_SHELL: (BIN_STAGE_BASE_PATTERN, BIN_STAGE_OUTER_BODY, BIN_STAGE_LIP, BIN_STAGE_COMPARTMENTS, BIN_STAGE_TABS),
+}
+
+# stage -> (key, [(body name, temporary body copy)])
+_stages: dict[str, tuple[str, list[tuple[str, adsk.fusion.BRepBody]]]] = {}
+
+def binStageKeys(input: BinGeneratorInput) -> dict[str, str]:
+    binBodyInput = input.binBodyGeneratorInput
+    keys: dict[str, str] = {}
+    for (stage, upstreamStages) in BIN_STAGE_UPSTREAM.items():
+        keys[stage] = generatorInputHash(
+            stage,
+            {field: getattr(binBodyInput, field) for field in BIN_STAGE_DEPENDENCIES[stage]},
+            {field: getattr(input, field) for field in BIN_STAGE_GENERATOR_DEPENDENCIES.get(stage, ())},
+            [keys[upstreamStage] for upstreamStage in upstreamStages],
+        )
+    return keys
+
+class BinStages():
+    # stage results of a single bin, without reuse every stage is built from scratch
+    def __init__(self, input: BinGeneratorInput = None, reuse: bool = False):
+        self.reuse = reuse and config.BIN_STAGE_CACHE_ENABLED and input is not None
+        self.keys = binStageKeys(input) if self.reuse else {}
+        self.reusedStages: list[str] = []
+
+    def run(
+        self,
+        stage: str,
+        targetComponent: adsk.fusion.Component,
+        build: Callable[[], list[adsk.fusion.BRepBody]],
+    ) -> list[adsk.fusion.BRepBody]:
+        if not self.reuse:
+            return build()
+        temporaryBRep = adsk.fusion.TemporaryBRepManager.get()
+        cached = _stages.get(stage)
+        if cached is not None and cached[0] == self.keys[stage]:
+            self.reusedStages.append(stage)
+            storedBodies = cached[1]
+            if len(storedBodies) == 0:
+                return []
+            with futil.span(f'{stage} from stage cache'):
+                bodies = temporaryShapeUtils.addToComponent(
+                    [temporaryBRep.copy(body) for (name, body) in storedBodies],
+                    f'{stage.capitalize()} copy',
+                    targetComponent,
+                )
+                for (body, (name, storedBody)) in zip(bodies, storedBodies):
+                    body.name = name
+            return bodies
+        bodies = build()
+        _stages[stage] = (self.keys[stage], [(body.name, temporaryBRep.copy(body)) for body in bodies])
+        return bodies
+
+def clearBinStageCache():
+    _stages.clear()
@@ -0,0 +1,63 @@
+import adsk.core, adsk.fusion, traceback
+import math
+
+from . import bRepIndex
+from .bRepIndex import BRepEntityBox
+from .const import DEFAULT_FILTER_TOLERANCE
+
+# Uniform XY grid over cached bounding boxes of bodies. A body is stored in every cell its box covers,
+# so a query only compares the bodies of the cells covered by the query box. Boolean tools and
+# participants far away from the target region are dropped without testing every pair of bodies.
+# Boxes which would cover more than MAX_CELLS_PER_BOX cells are kept aside and tested on every query.
+MAX_CELLS_PER_BOX = 1024
+
+def boxesOverlap(first: BRepEntityBox, second: BRepEntityBox):
+    # boxes touching along a face enclose no common volume
+    return all(
+        min(first.maxPoint[axis], second.maxPoint[axis]) - max(first.minPoint[axis], second.minPoint[axis]) > DEFAULT_FILTER_TOLERANCE
+        for axis in range(3)
+    )
+
+def createBox(minPoint: tuple[float, float, float], maxPoint: tuple[float, float, float]) -> BRepEntityBox:
+    return BRepEntityBox(adsk.core.BoundingBox3D.create(adsk.core.Point3D.create(*minPoint), adsk.core.Point3D.create(*maxPoint)))
+
+class BodyGridIndex():
+    def __init__(self, bodies: list[adsk.fusion.BRepBody], boxes: list[BRepEntityBox] = None):
+        self.bodies = list(bodies)
+        self.boxes = boxes if boxes is not None else [bRepIndex.bodyBoundingBox(body) for body in self.bodies]
+        self.cells: dict[tuple[int, int], list[int]] = {}
+        self.oversized: list[int] = []
+        sizes = [max(box.size(0), box.size(1)) for box in self.boxes]
+        # average body footprint, most bodies land in one to four cells
+        self.cellSize = max(sum(sizes) / len(sizes), DEFAULT_FILTER_TOLERANCE) if len(sizes) > 0 else 1.0
+        for (index, box) in enumerate(self.boxes):
+            cells = self.cellRange(box)
+            if len(cells[0]) * len(cells[1]) > MAX_CELLS_PER_BOX:
+                self.oversized.append(index)
+                continue
+            for cellX in cells[0]:
+                for cellY in cells[1]:
+                    self.cells.setdefault((cellX, cellY), []).append(index)
+
+    def cellRange(self, box: BRepEntityBox) -> tuple[range, range]:
+        return tuple(
+            range(math.floor(box.minPoint[axis] / self.cellSize), math.floor(box.maxPoint[axis] / self.cellSize) + 1)
+            for axis in range(2)
+        )
+
+    def candidates(self, box: BRepEntityBox) -> set[int]:
+        cells = self.cellRange(box)
+        if len(cells[0]) * len(cells[1]) > len(self.cells):
+            # a query wider than the grid checks the stored cells only
+            return set([index for (cell, indexes) in self.cells.items() if cell[0] in cells[0] and cell[1] in cells[1] for index in indexes] + self.oversized)
+        return set([index for cellX in cells[0] for cellY in cells[1] for index in self.cells.get((cellX, cellY), [])] + self.oversized)
+
+    def queryIndexes(self, box: BRepEntityBox) -> list[int]:
+        # positions of bodies overlapping the box, in the order they were indexed
+        return [index for index in sorted(self.candidates(box)) if boxesOverlap(self.boxes[index], box)]
+
+    def query(self, box: BRepEntityBox) -> list[adsk.fusion.BRepBody]:
+        return [self.bodies[index] for index in self.queryIndexes(box)]
+
+    def overlapsAny(self, box: BRepEntityBox) -> bool:
+        return any(boxesOverlap(self.boxes[index], box) for index in self.candidates(box))
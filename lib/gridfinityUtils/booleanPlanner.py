@@ -0,0 +1,125 @@
+import adsk.core, adsk.fusion, traceback
+
+from ...lib import fusion360utils as futil
+from ... import config
+from . import combineUtils, commonUtils
+from .bodySpatialIndex import BodyGridIndex
+
+# Join, cut and intersect intents of a generation are collected into a plan and emitted as combine
+# features when the plan is executed. An intent is added to an earlier combine of the same target
+# when it can be moved past every combine recorded after that one: joins and cuts are grouped with
+# the same operation, a join and a cut swap places only when their tool bodies can't overlap,
+# intersects are never grouped or moved. Intents of different targets swap places when they share no bodies.
+# The plan has to be executed before the geometry of any of its targets is read.
+BOOLEAN_JOIN = 'join'
+BOOLEAN_CUT = 'cut'
+BOOLEAN_INTERSECT = 'intersect'
+
+class BooleanIntent():
+    def __init__(self, operation: str, targetBody: adsk.fusion.BRepBody, toolBodies: list[adsk.fusion.BRepBody], name: str):
+        self.operation = operation
+        self.targetBody = targetBody
+        self.toolBodies = toolBodies
+        self.name = name
+        self._toolIndex: BodyGridIndex = None
+
+    @property
+    def toolIndex(self) -> BodyGridIndex:
+        # built when the plan is executed, tool bodies are final by then
+        if self._toolIndex is None:
+            self._toolIndex = BodyGridIndex(self.toolBodies)
+        return self._toolIndex
+
+    def bodies(self) -> list[adsk.fusion.BRepBody]:
+        return [self.targetBody] + self.toolBodies
+
+class BooleanGroup():
+    def __init__(self, intent: BooleanIntent):
+        self.operation = intent.operation
+        self.targetBody = intent.targetBody
+        self.intents = [intent]
+
+    @property
+    def toolBodies(self) -> list[adsk.fusion.BRepBody]:
+        return [body for intent in self.intents for body in intent.toolBodies]
+
+    @property
+    def name(self) -> str:
+        return ' + '.join([intent.name for intent in self.intents if not intent.name is None])
+
+def sharesBodies(first: BooleanIntent, second: BooleanIntent):
+    return any(body == otherBody for body in first.bodies() for otherBody in second.bodies())
+
+def canSwap(intent: BooleanIntent, other: BooleanIntent):
+    if not intent.targetBody == other.targetBody:
+        return not sharesBodies(intent, other)
+    if BOOLEAN_INTERSECT in (intent.operation, other.operation):
+        return False
+    if intent.operation == other.operation:
+        return True
+    # (target + join) - cut equals (target - cut) + join unless join and cut tools overlap
+    return not any(other.toolIndex.overlapsAny(box) for box in intent.toolIndex.boxes)
+
+class BooleanPlan():
+    def __init__(self, targetComponent: adsk.fusion.Component):
+        self.targetComponent = targetComponent
+        self.intents: list[BooleanIntent] = []
+
+    def join(self, targetBody: adsk.fusion.BRepBody, toolBodies: list[adsk.fusion.BRepBody], name: str = None):
+        self.add(BOOLEAN_JOIN, targetBody, toolBodies, name)
+
+    def cut(self, targetBody: adsk.fusion.BRepBody, toolBodies: list[adsk.fusion.BRepBody], name: str = None):
+        self.add(BOOLEAN_CUT, targetBody, toolBodies, name)
+
+    def intersect(self, targetBody: adsk.fusion.BRepBody, toolBodies: list[adsk.fusion.BRepBody], name: str = None):
+        self.add(BOOLEAN_INTERSECT, targetBody, toolBodies, name)
+
+    def add(self, operation: str, targetBody: adsk.fusion.BRepBody, toolBodies: list[adsk.fusion.BRepBody], name: str = None):
+        if len(toolBodies) > 0:
+            self.intents.append(BooleanIntent(operation, targetBody, list(toolBodies), name))
+
+    def groups(self) -> list[BooleanGroup]:
+        groups: list[BooleanGroup] = []
+        for intent in self.intents:
+            groupIndex = None
+            if config.BOOLEAN_PLANNER_ENABLED and not intent.operation == BOOLEAN_INTERSECT:
+                for index in reversed(range(len(groups))):
+                    group = groups[index]
+                    if group.targetBody == intent.targetBody and group.operation == intent.operation:
+                        groupIndex = index
+                        break
+                    if not all(canSwap(intent, groupIntent) for groupIntent in group.intents):
+                        break
+            if groupIndex is None:
+                groups.append(BooleanGroup(intent))
+            else:
+                groups[groupIndex].intents.append(intent)
+        return groups
+
+    def describe(self, groups: list[BooleanGroup] = None) -> str:
+        groups = groups if groups is not None else self.groups()
+        lines = [f'Boolean plan, {len(self.intents)} intents in {len(groups)} combines']
+        for (groupIndex, group) in enumerate(groups):
+            lines.append(f'combine {groupIndex + 1}: {group.operation} "{group.targetBody.name}", {len(group.toolBodies)} tools')
+            for intent in group.intents:
+                lines.append(f'  #{self.intents.index(intent)} {intent.operation} {intent.name or "unnamed"}, {len(intent.toolBodies)} tools')
+        return '\n'.join(lines)
+
+    def execute(self) -> list[adsk.fusion.CombineFeature]:
+        groups = self.groups()
+        if config.BOOLEAN_PLAN_LOG_ENABLED and len(groups) > 0:
+            futil.log(self.describe(groups))
+        combineFeatures: list[adsk.fusion.CombineFeature] = []
+        for group in groups:
+            toolBodies = commonUtils.objectCollectionFromList(group.toolBodies)
+            if group.operation == BOOLEAN_JOIN:
+                combineFeature = combineUtils.joinBodies(group.targetBody, toolBodies, self.targetComponent)
+            elif group.operation == BOOLEAN_CUT:
+                combineFeature = combineUtils.cutBody(group.targetBody, toolBodies, self.targetComponent)
+            else:
+                combineFeature = combineUtils.intersectBody(group.targetBody, toolBodies, self.targetComponent)
+            if len(group.name) > 0:
+                combineFeature.name = group.name
+            combineFeatures.append(combineFeature)
+        self.intents = []
+        return combineFeatures
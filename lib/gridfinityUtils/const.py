@@ -27,6 +27,9 @@ BIN_SCOOP_MAX_RADIUS = 2.5
 
 BASEPLATE_EXTRA_HEIGHT = 0.64
 BASEPLATE_BIN_Z_CLEARANCE = 0.05
+BASEPLATE_DEFAULT_DRAWER_WIDTH = 50
+BASEPLATE_DEFAULT_DRAWER_LENGTH = 40
+DEFAULT_PRINT_BED_SIZE = 22
 
 DIMENSION_DEFAULT_WIDTH_UNIT = 4.2
 DIMENSION_DEFAULT_HEIGHT_UNIT = 0.7
@@ -40,5 +43,16 @@ DIMENSION_MAGNET_CUTOUT_DIAMETER = 0.65
 DIMENSION_MAGNET_CUTOUT_DEPTH = 0.24
 DIMENSION_PRINT_HELPER_GROOVE_DEPTH = 0.03
 
+# Generator fidelity levels. Draft omits fillets, chamfers and everything below standard,
+# standard omits print helper grooves and lip notches, full generates every feature.
+GENERATOR_FIDELITY_DRAFT = 0
+GENERATOR_FIDELITY_STANDARD = 1
+GENERATOR_FIDELITY_FULL = 2
+
+# Sketch emission policies. Constrained sketches get geometric constraints and dimensions so they can be edited,
+# geometry only sketches get just the curves, used for tool bodies which are consumed by a combine right away.
+SKETCH_POLICY_CONSTRAINED = 'constrained'
+SKETCH_POLICY_GEOMETRY_ONLY = 'geometry only'
+
 
 DEFAULT_FILTER_TOLERANCE = 0.00001
\ No newline at end of file
@@ -0,0 +1,63 @@
+import adsk.core, adsk.fusion, traceback
+import collections
+
+from ... import config
+
+# Offset construction planes shared per component. Generators place most sketches at a few heights,
+# e.g. every compartment cutout and the lip body start at the bin body top, a plane is created once
+# for every (reference, offset) pair and reused by the following sketches of the same component.
+# Only origin planes and faces of bodies with a revision are keyed, other references always get a new plane.
+# Planes which are no longer valid are dropped on lookup, only the most recently used
+# CONSTRUCTION_PLANE_REGISTRY_MAX_PLANES planes are kept.
+OFFSET_DIGITS = 6
+CONSTRUCTION_PLANE_REGISTRY_MAX_PLANES = 256
+
+# (component id, reference key, rounded offset) -> construction plane
+_planes: collections.OrderedDict[tuple, adsk.fusion.ConstructionPlane] = collections.OrderedDict()
+
+def referenceKey(reference: adsk.core.Base, targetComponent: adsk.fusion.Component):
+    if isinstance(reference, adsk.fusion.BRepFace):
+        revisionId = reference.body.revisionId
+        # a modified body gets a new revision, its faces are keyed anew
+        return ('face', revisionId, reference.tempId) if revisionId else None
+    for (name, originPlane) in (
+        ('xy', targetComponent.xYConstructionPlane),
+        ('xz', targetComponent.xZConstructionPlane),
+        ('yz', targetComponent.yZConstructionPlane),
+    ):
+        if reference == originPlane:
+            return (name,)
+    return None
+
+def offsetPlane(
+    reference: adsk.core.Base,
+    offset: float,
+    targetComponent: adsk.fusion.Component,
+    name: str = None,
+) -> adsk.fusion.ConstructionPlane:
+    key = None
+    if config.CONSTRUCTION_PLANE_REGISTRY_ENABLED:
+        planeReferenceKey = referenceKey(reference, targetComponent)
+        if planeReferenceKey is not None:
+            key = (targetComponent.id, planeReferenceKey, round(offset, OFFSET_DIGITS) + 0.0)
+            plane = _planes.get(key)
+            if plane is not None:
+                if plane.isValid:
+                    _planes.move_to_end(key)
+                    return plane
+                # planes of a rolled back preview are no longer valid
+                del _planes[key]
+
+    planeInput: adsk.fusion.ConstructionPlaneInput = targetComponent.constructionPlanes.createInput()
+    planeInput.setByOffset(reference, adsk.core.ValueInput.createByReal(offset))
+    plane = targetComponent.constructionPlanes.add(planeInput)
+    if name is not None:
+        plane.name = name
+    if key is not None:
+        _planes[key] = plane
+        if len(_planes) > CONSTRUCTION_PLANE_REGISTRY_MAX_PLANES:
+            _planes.popitem(last=False)
+    return plane
+
+def clearConstructionPlaneRegistry():
+    _planes.clear()
@@ -2,7 +2,7 @@ import adsk.core, adsk.fusion, traceback
 import os
 import math
 
-from . import const
+from . import const, bRepIndex
 
 def matches(edge1: adsk.fusion.BRepEdge, edge2: adsk.fusion.BRepEdge):
     [_, start1, end1] = edge1.evaluator.getEndPoints()
@@ -16,10 +16,9 @@ def selectEdgesByLength(
     filterEdgeTolerance: float,
     ):
     filteredEdges = adsk.core.ObjectCollection.create()
-    for face in faces:
-        for edge in face.edges:
-            if math.isclose(edge.length, filterEdgeLength, abs_tol=filterEdgeTolerance):
-                filteredEdges.add(edge)
+    for index in bRepIndex.edgeIndexes(faces):
+        for edge in index.byLength(filterEdgeLength, filterEdgeTolerance):
+            filteredEdges.add(edge)
     return filteredEdges
 
 def excludeEdges(edges: list[adsk.fusion.BRepEdge], toExclude: list[adsk.fusion.BRepEdge]):
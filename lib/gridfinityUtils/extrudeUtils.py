@@ -1,7 +1,7 @@
 import adsk.core, adsk.fusion, traceback
 import os
 
-from . import sketchUtils
+from . import sketchUtils, constructionPlaneRegistry, const
 
 def simpleDistanceExtrude(
     profile: adsk.core.Base,
@@ -51,20 +51,20 @@ def createBoxAtPoint(
     height: float,
     targetComponent: adsk.fusion.Component,
     originPoint: adsk.core.Point3D,
+    policy: str = const.SKETCH_POLICY_CONSTRAINED,
     ):
     features: adsk.fusion.Features = targetComponent.features
     extrudeFeatures: adsk.fusion.ExtrudeFeatures = features.extrudeFeatures
-    boxPlaneInput: adsk.fusion.ConstructionPlaneInput = targetComponent.constructionPlanes.createInput()
-    boxPlaneInput.setByOffset(
+    boxConstructionPlane = constructionPlaneRegistry.offsetPlane(
         targetComponent.xYConstructionPlane,
-        adsk.core.ValueInput.createByReal(originPoint.z)
+        originPoint.z,
+        targetComponent,
+        'Simple box at point construction plane',
     )
-    boxConstructionPlane = targetComponent.constructionPlanes.add(boxPlaneInput)
-    boxConstructionPlane.name = 'Simple box at point construction plane'
     sketches: adsk.fusion.Sketches = targetComponent.sketches
     recSketch: adsk.fusion.Sketch = sketches.add(boxConstructionPlane)
     recSketch.name = 'Simple box at point sketch'
-    sketchUtils.createRectangle(width, length, recSketch.modelToSketchSpace(originPoint), recSketch)
+    sketchUtils.createRectangle(width, length, recSketch.modelToSketchSpace(originPoint), recSketch, policy)
         
     # extrude
     extrude = extrudeFeatures.addSimple(recSketch.profiles.item(0),
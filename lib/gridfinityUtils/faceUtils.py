@@ -3,7 +3,7 @@ import adsk.core, adsk.fusion, traceback
 import os
 
 from .const import DEFAULT_FILTER_TOLERANCE
-from . import geometryUtils
+from . import geometryUtils, bRepIndex
 
 
 def minByArea(faces: adsk.fusion.BRepFaces):
@@ -23,21 +23,23 @@ def shortestEdge(face: adsk.fusion.BRepFace):
     return min(face.edges, key=lambda x: x.length)
 
 def isYNormal(face: adsk.fusion.BRepFace):
-    return math.isclose(face.boundingBox.minPoint.y, face.boundingBox.maxPoint.y, abs_tol=DEFAULT_FILTER_TOLERANCE)
+    return bRepIndex.isFlat(face, 1)
 
 def isXNormal(face: adsk.fusion.BRepFace):
-    return math.isclose(face.boundingBox.minPoint.x, face.boundingBox.maxPoint.x, abs_tol=DEFAULT_FILTER_TOLERANCE)
+    return bRepIndex.isFlat(face, 0)
 
 def isZNormal(face: adsk.fusion.BRepFace):
-    return math.isclose(face.boundingBox.minPoint.z, face.boundingBox.maxPoint.z, abs_tol=DEFAULT_FILTER_TOLERANCE)
+    return bRepIndex.isFlat(face, 2)
 
 def getBottomFace(body: adsk.fusion.BRepBody):
-    horizontalFaces = [face for face in body.faces if isZNormal(face)]
-    return min(horizontalFaces, key=lambda x: x.boundingBox.minPoint.z)
+    index = bRepIndex.bodyIndex(body)
+    horizontalFaces = [face for face in body.faces if index.boundingBox(face).isFlat(2)]
+    return min(horizontalFaces, key=lambda x: index.boundingBox(x).minPoint[2])
 
 def getTopFace(body: adsk.fusion.BRepBody):
-    horizontalFaces = [face for face in body.faces if isZNormal(face)]
-    return max(horizontalFaces, key=lambda x: x.boundingBox.minPoint.z)
+    index = bRepIndex.bodyIndex(body)
+    horizontalFaces = [face for face in body.faces if index.boundingBox(face).isFlat(2)]
+    return max(horizontalFaces, key=lambda x: index.boundingBox(x).minPoint[2])
 
 def getTopHorizontalEdge(edges: adsk.fusion.BRepEdges):
     horizontalEdges = [edge for edge in edges if geometryUtils.isHorizontal(edge)]
@@ -50,9 +52,4 @@ def getBottomHorizontalEdge(edges: adsk.fusion.BRepEdges):
 def getVerticalEdges(
     faces: adsk.fusion.BRepFaces,
     ):
-    filteredEdges: list[adsk.fusion.BRepEdge] = []
-    for face in faces:
-        for edge in face.edges:
-            if geometryUtils.isCollinearToZ(edge):
-                filteredEdges.append(edge)
-    return filteredEdges
+    return [edge for index in bRepIndex.edgeIndexes(faces) for edge in index.alongAxis(2)]
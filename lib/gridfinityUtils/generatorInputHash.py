@@ -0,0 +1,36 @@
+import adsk.core, adsk.fusion, traceback
+import hashlib
+import json
+
+# Generator inputs are plain property classes, their state lives in underscored attributes.
+# Floats are rounded so values that went through unit conversion still hash the same.
+# Bump the version when the serialization format changes, hashes stored on disk get invalidated.
+CANONICAL_FORMAT_VERSION = 1
+FLOAT_PRECISION = 6
+
+def canonicalInput(value):
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return round(value, FLOAT_PRECISION) + 0.0
+    if isinstance(value, (list, tuple)):
+        return [canonicalInput(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): canonicalInput(item) for (key, item) in value.items()}
+    if isinstance(value, adsk.core.Point3D):
+        return [canonicalInput(value.x), canonicalInput(value.y), canonicalInput(value.z)]
+    return {
+        '__type__': type(value).__name__,
+        **{key.lstrip('_'): canonicalInput(item) for (key, item) in vars(value).items()},
+    }
+
+def canonicalInputJson(*inputs) -> str:
+    return json.dumps({
+        'version': CANONICAL_FORMAT_VERSION,
+        'inputs': [canonicalInput(input) for input in inputs],
+    }, sort_keys=True, separators=(',', ':'))
+
+def generatorInputHash(*inputs) -> str:
+    return hashlib.sha256(canonicalInputJson(*inputs).encode()).hexdigest()
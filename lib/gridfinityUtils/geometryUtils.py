@@ -3,18 +3,19 @@ import adsk.core, adsk.fusion, traceback
 import os
 
 from .const import DEFAULT_FILTER_TOLERANCE
+from . import bRepIndex
 
 def isHorizontal(entity: adsk.fusion.BRepEdge):
-    return math.isclose(entity.boundingBox.maxPoint.z, entity.boundingBox.minPoint.z, abs_tol=DEFAULT_FILTER_TOLERANCE)
+    return bRepIndex.isFlat(entity, 2)
 
 def isCollinearToZ(entity: adsk.fusion.BRepEdge):
-    return math.isclose(entity.boundingBox.maxPoint.x, entity.boundingBox.minPoint.x, abs_tol=DEFAULT_FILTER_TOLERANCE) and math.isclose(entity.boundingBox.maxPoint.y, entity.boundingBox.minPoint.y, abs_tol=DEFAULT_FILTER_TOLERANCE)
+    return bRepIndex.isFlat(entity, 0, 1)
 
 def isCollinearToX(entity: adsk.fusion.BRepEdge):
-    return math.isclose(entity.boundingBox.maxPoint.z, entity.boundingBox.minPoint.z, abs_tol=DEFAULT_FILTER_TOLERANCE) and math.isclose(entity.boundingBox.maxPoint.y, entity.boundingBox.minPoint.y, abs_tol=DEFAULT_FILTER_TOLERANCE)
+    return bRepIndex.isFlat(entity, 2, 1)
 
 def isCollinearToY(entity: adsk.fusion.BRepEdge):
-    return math.isclose(entity.boundingBox.maxPoint.z, entity.boundingBox.minPoint.z, abs_tol=DEFAULT_FILTER_TOLERANCE) and math.isclose(entity.boundingBox.maxPoint.x, entity.boundingBox.minPoint.x, abs_tol=DEFAULT_FILTER_TOLERANCE)
+    return bRepIndex.isFlat(entity, 2, 0)
 
 def boundingBoxVolume(box: adsk.core.BoundingBox3D):
     dimensions = box.maxPoint.asVector()
@@ -0,0 +1,119 @@
+import adsk.core, adsk.fusion, traceback
+import json
+import os
+import re
+import time
+
+from ...lib import fusion360utils as futil
+from ... import config
+
+# Generated components are queued during generation and exported in one pass afterwards.
+# Hashes of exported parameters are kept next to the files, a component is exported again
+# only when its parameters, format or refinement changed or the file is missing.
+
+EXPORT_FORMAT_STL = 'stl'
+EXPORT_FORMAT_3MF = '3mf'
+EXPORT_HASHES_FILE_NAME = '.export_hashes.json'
+
+MESH_REFINEMENT = {
+    'low': adsk.fusion.MeshRefinementSettings.MeshRefinementLow,
+    'medium': adsk.fusion.MeshRefinementSettings.MeshRefinementMedium,
+    'high': adsk.fusion.MeshRefinementSettings.MeshRefinementHigh,
+}
+
+class MeshExportJob():
+    def __init__(self, component: adsk.fusion.Component, name: str, parametersHash: str):
+        self.component = component
+        self.name = name
+        self.parametersHash = parametersHash
+
+class MeshExportResult():
+    def __init__(self, fileName: str, seconds: float, isSkipped: bool = False, error: str = None):
+        self.fileName = fileName
+        self.seconds = seconds
+        self.isSkipped = isSkipped
+        self.error = error
+
+_queue: list[MeshExportJob] = []
+
+def queueMeshExport(component: adsk.fusion.Component, name: str, parametersHash: str):
+    _queue.append(MeshExportJob(component, name, parametersHash))
+
+def clearMeshExportQueue():
+    _queue.clear()
+
+def exportFileName(name: str, exportFormat: str):
+    return '{}.{}'.format(re.sub(r'[<>:"/\\|?*]', '_', name).strip(), exportFormat)
+
+def readExportHashes(folder: str) -> dict[str, str]:
+    try:
+        with open(os.path.join(folder, EXPORT_HASHES_FILE_NAME)) as hashesFile:
+            return json.load(hashesFile)
+    except (OSError, ValueError):
+        return {}
+
+def writeExportHashes(folder: str, hashes: dict[str, str]):
+    with open(os.path.join(folder, EXPORT_HASHES_FILE_NAME), 'w') as hashesFile:
+        json.dump(hashes, hashesFile, indent=2, sort_keys=True)
+
+def runQueuedMeshExports(
+    folder: str,
+    exportFormats: list[str],
+    refinement: str,
+) -> list[MeshExportResult]:
+    jobs = list(_queue)
+    _queue.clear()
+    if len(jobs) == 0:
+        return []
+    # bins of the same size share a name, number repeated ones to keep every file
+    usedNames: dict[str, int] = {}
+    for job in jobs:
+        usedNames[job.name] = usedNames.get(job.name, 0) + 1
+        if usedNames[job.name] > 1:
+            job.name = '{} ({})'.format(job.name, usedNames[job.name])
+    os.makedirs(folder, exist_ok=True)
+    exportHashes = readExportHashes(folder)
+    results: list[MeshExportResult] = []
+
+    for job in jobs:
+        exportManager = job.component.parentDesign.exportManager
+        for exportFormat in exportFormats:
+            fileName = exportFileName(job.name, exportFormat)
+            filePath = os.path.join(folder, fileName)
+            exportHash = '{}:{}:{}'.format(job.parametersHash, exportFormat, refinement)
+            if exportHashes.get(fileName) == exportHash and os.path.exists(filePath):
+                results.append(MeshExportResult(fileName, 0, isSkipped=True))
+                continue
+
+            startTime = time.perf_counter()
+            try:
+                if exportFormat == EXPORT_FORMAT_STL:
+                    exportOptions = exportManager.createSTLExportOptions(job.component, filePath)
+                elif exportFormat == EXPORT_FORMAT_3MF:
+                    exportOptions = exportManager.createC3MFExportOptions(job.component, filePath)
+                else:
+                    raise ValueError(f'Unsupported export format "{exportFormat}"')
+                exportOptions.meshRefinement = MESH_REFINEMENT[refinement]
+                exportManager.execute(exportOptions)
+                exportHashes[fileName] = exportHash
+                results.append(MeshExportResult(fileName, time.perf_counter() - startTime))
+            except Exception as err:
+                futil.log(f'Failed to export "{fileName}", {traceback.format_exc()}')
+                results.append(MeshExportResult(fileName, time.perf_counter() - startTime, error=str(err)))
+        # hashes are saved after every component so an interrupted run keeps the finished files
+        writeExportHashes(folder, exportHashes)
+
+    futil.log(formatMeshExportSummary(results))
+    return results
+
+def formatMeshExportSummary(results: list[MeshExportResult]):
+    exported = [result for result in results if not result.isSkipped and result.error is None]
+    skipped = [result for result in results if result.isSkipped]
+    failed = [result for result in results if not result.error is None]
+    return 'Mesh export: {} exported, {} unchanged, {} failed in {:.1f}s'.format(len(exported), len(skipped), len(failed), sum([result.seconds for result in results]))
+
+def runConfiguredMeshExports():
+    if not config.EXPORT_ENABLED:
+        clearMeshExportQueue()
+        return []
+    return runQueuedMeshExports(config.EXPORT_FOLDER_PATH, config.EXPORT_FORMATS, config.EXPORT_MESH_REFINEMENT)
@@ -0,0 +1,81 @@
+import adsk.core, adsk.fusion, traceback
+import os
+from typing import Callable
+
+from ...lib import fusion360utils as futil
+from ... import config
+from . import temporaryShapeUtils
+from .generatorInputHash import generatorInputHash
+
+# Finished generator results stored on disk as SMT files, keyed by the canonical input hash.
+# The folder is a LRU cache bounded by config.RESULT_CACHE_MAX_SIZE_MB, file modification
+# time is refreshed on every hit. Bump the version when generated geometry changes.
+RESULT_CACHE_VERSION = 2
+RESULT_FILE_EXTENSION = '.smt'
+
+def resultCacheKey(kind: str, *inputs) -> str:
+    return generatorInputHash(kind, RESULT_CACHE_VERSION, *inputs)
+
+def resultFilePath(key: str):
+    return os.path.join(config.RESULT_CACHE_FOLDER_PATH, key + RESULT_FILE_EXTENSION)
+
+def importCachedResult(key: str, name: str, targetComponent: adsk.fusion.Component) -> list[adsk.fusion.BRepBody]:
+    filePath = resultFilePath(key)
+    if not os.path.exists(filePath):
+        return None
+    try:
+        storedBodies = adsk.fusion.TemporaryBRepManager.get().createFromFile(filePath)
+        if storedBodies is None or storedBodies.count == 0:
+            return None
+        bodies = temporaryShapeUtils.addToComponent(list(storedBodies), name, targetComponent)
+        os.utime(filePath)
+        return bodies
+    except Exception as err:
+        futil.log(f'Failed to import cached result {key}, {err}')
+        return None
+
+def storeResult(key: str, targetComponent: adsk.fusion.Component):
+    os.makedirs(config.RESULT_CACHE_FOLDER_PATH, exist_ok=True)
+    filePath = resultFilePath(key)
+    # exported under a temporary name so an interrupted export is never picked up as a hit
+    temporaryFilePath = filePath + '.partial'
+    exportManager = targetComponent.parentDesign.exportManager
+    exportManager.execute(exportManager.createSMTExportOptions(targetComponent, temporaryFilePath))
+    os.replace(temporaryFilePath, filePath)
+    pruneResultCache(config.RESULT_CACHE_MAX_SIZE_MB * 1024 * 1024)
+
+def pruneResultCache(maxSize: int):
+    folder = config.RESULT_CACHE_FOLDER_PATH
+    files = []
+    for fileName in os.listdir(folder):
+        if fileName.endswith(RESULT_FILE_EXTENSION):
+            fileStat = os.stat(os.path.join(folder, fileName))
+            files.append((fileStat.st_mtime, fileStat.st_size, fileName))
+    totalSize = sum([size for (mtime, size, fileName) in files])
+    for (mtime, size, fileName) in sorted(files):
+        if totalSize <= maxSize:
+            break
+        os.remove(os.path.join(folder, fileName))
+        totalSize -= size
+
+def generateWithResultCache(
+    key: str,
+    name: str,
+    targetComponent: adsk.fusion.Component,
+    generate: Callable[[], adsk.fusion.BRepBody],
+) -> adsk.fusion.BRepBody:
+    # returns the body returned by the generator, or the first imported body on a cache hit
+    if not config.RESULT_CACHE_ENABLED:
+        return generate()
+    with futil.span('result cache lookup'):
+        cachedBodies = importCachedResult(key, name, targetComponent)
+    if cachedBodies is not None:
+        futil.log(f'"{name}" imported from the result cache')
+        return cachedBodies[0]
+    result = generate()
+    try:
+        with futil.span('result cache store'):
+            storeResult(key, targetComponent)
+    except Exception as err:
+        futil.log(f'Failed to store "{name}" in the result cache, {err}')
+    return result
@@ -1,7 +1,8 @@
 import adsk.core, adsk.fusion, traceback
 import os
 
-from . import extrudeUtils, sketchUtils
+from ...lib import fusion360utils as futil
+from . import extrudeUtils, sketchUtils, constructionPlaneRegistry, const
 
 app = adsk.core.Application.get()
 ui = app.userInterface
@@ -13,44 +14,45 @@ def simpleCylinder(
     radius: float,
     centerBottom: adsk.core.Point3D,
     targetComponent: adsk.fusion.Component,
+    policy: str = const.SKETCH_POLICY_CONSTRAINED,
 ):
-    baseConstructionPlaneInput: adsk.fusion.ConstructionPlaneInput = targetComponent.constructionPlanes.createInput()
-    baseConstructionPlaneInput.setByOffset(plane, adsk.core.ValueInput.createByReal(planeOffset))
-    baseConstructionPlane = targetComponent.constructionPlanes.add(baseConstructionPlaneInput)
+    baseConstructionPlane = constructionPlaneRegistry.offsetPlane(plane, planeOffset, targetComponent)
     cylinderBaseSketch: adsk.fusion.Sketch = targetComponent.sketches.add(baseConstructionPlane)
     cylinderBaseSketch.name = "Simple cylinder sketch"
     dimensions: adsk.fusion.SketchDimensions = cylinderBaseSketch.sketchDimensions
     constraints: adsk.fusion.GeometricConstraints = cylinderBaseSketch.geometricConstraints
-    centerOnSketch = cylinderBaseSketch.modelToSketchSpace(centerBottom)
-    centerOnSketch.z = 0
+    with futil.sketch_drawing(cylinderBaseSketch):
+        centerOnSketch = cylinderBaseSketch.modelToSketchSpace(centerBottom)
+        centerOnSketch.z = 0
 
-    circle = cylinderBaseSketch.sketchCurves.sketchCircles.addByCenterRadius(
-        centerOnSketch,
-        radius,
-    )
-    dimensions.addDiameterDimension(
-        circle,
-        adsk.core.Point3D.create(circle.centerSketchPoint.geometry.x + 1, circle.centerSketchPoint.geometry.y + 1, 0),
-        True,
-    )
-    if centerOnSketch.isEqualTo(cylinderBaseSketch.originPoint.geometry):
-        constraints.addCoincident(cylinderBaseSketch.originPoint, circle.centerSketchPoint)
-    else:
-        dimensions.addDistanceDimension(
-            cylinderBaseSketch.originPoint,
-            circle.centerSketchPoint,
-            adsk.fusion.DimensionOrientations.HorizontalDimensionOrientation,
-            adsk.core.Point3D.create(circle.centerSketchPoint.geometry.x, 0, 0),
-            True
-        )
-        dimensions.addDistanceDimension(
-            cylinderBaseSketch.originPoint,
-            circle.centerSketchPoint,
-            adsk.fusion.DimensionOrientations.VerticalDimensionOrientation,
-            adsk.core.Point3D.create(0, circle.centerSketchPoint.geometry.y, 0),
-            True
+        circle = cylinderBaseSketch.sketchCurves.sketchCircles.addByCenterRadius(
+            centerOnSketch,
+            radius,
         )
-    
+        if sketchUtils.isConstrained(policy):
+            dimensions.addDiameterDimension(
+                circle,
+                adsk.core.Point3D.create(circle.centerSketchPoint.geometry.x + 1, circle.centerSketchPoint.geometry.y + 1, 0),
+                True,
+            )
+            if centerOnSketch.isEqualTo(cylinderBaseSketch.originPoint.geometry):
+                constraints.addCoincident(cylinderBaseSketch.originPoint, circle.centerSketchPoint)
+            else:
+                dimensions.addDistanceDimension(
+                    cylinderBaseSketch.originPoint,
+                    circle.centerSketchPoint,
+                    adsk.fusion.DimensionOrientations.HorizontalDimensionOrientation,
+                    adsk.core.Point3D.create(circle.centerSketchPoint.geometry.x, 0, 0),
+                    True
+                )
+                dimensions.addDistanceDimension(
+                    cylinderBaseSketch.originPoint,
+                    circle.centerSketchPoint,
+                    adsk.fusion.DimensionOrientations.VerticalDimensionOrientation,
+                    adsk.core.Point3D.create(0, circle.centerSketchPoint.geometry.y, 0),
+                    True
+                )
+
     cylinderExtrude = extrudeUtils.simpleDistanceExtrude(
         cylinderBaseSketch.profiles.item(0),
         adsk.fusion.FeatureOperations.NewBodyFeatureOperation,
@@ -70,21 +72,17 @@ def simpleBox(
     height: float,
     originPoint: adsk.core.Point3D,
     targetComponent: adsk.fusion.Component,
+    policy: str = const.SKETCH_POLICY_CONSTRAINED,
 ):
     features: adsk.fusion.Features = targetComponent.features
     extrudeFeatures: adsk.fusion.ExtrudeFeatures = features.extrudeFeatures
-    boxPlaneInput: adsk.fusion.ConstructionPlaneInput = targetComponent.constructionPlanes.createInput()
-    boxPlaneInput.setByOffset(
-        plane,
-        adsk.core.ValueInput.createByReal(planeOffset)
-    )
-    boxConstructionPlane = targetComponent.constructionPlanes.add(boxPlaneInput)
+    boxConstructionPlane = constructionPlaneRegistry.offsetPlane(plane, planeOffset, targetComponent)
     sketches: adsk.fusion.Sketches = targetComponent.sketches
     recSketch: adsk.fusion.Sketch = sketches.add(boxConstructionPlane)
     recSketch.name = "Simple box sketch"
     startPointOnSketch = recSketch.modelToSketchSpace(originPoint)
     startPointOnSketch.z = 0
-    sketchUtils.createRectangle(width, length, startPointOnSketch, recSketch)
+    sketchUtils.createRectangle(width, length, startPointOnSketch, recSketch, policy)
         
     # extrude
     extrude = extrudeFeatures.addSimple(recSketch.profiles.item(0),
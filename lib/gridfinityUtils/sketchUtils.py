@@ -2,6 +2,8 @@ import math
 import adsk.core, adsk.fusion, traceback
 import os
 
+from ...lib import fusion360utils as futil
+from ... import config
 from . import const
 
 def isVertical(line: adsk.fusion.SketchLine):
@@ -10,51 +12,86 @@ def isVertical(line: adsk.fusion.SketchLine):
 def isHorizontal(line: adsk.fusion.SketchLine):
     return math.isclose(line.startSketchPoint.geometry.y, line.endSketchPoint.geometry.y, abs_tol=const.DEFAULT_FILTER_TOLERANCE)
 
+def isConstrained(policy: str):
+    return policy == const.SKETCH_POLICY_CONSTRAINED or not config.GEOMETRY_ONLY_TOOL_SKETCHES_ENABLED
+
 def createRectangle(
     width: float,
     length: float,
     startPoint: adsk.core.Point3D,
     sketch: adsk.fusion.Sketch,
+    policy: str = const.SKETCH_POLICY_CONSTRAINED,
 ):
     constraints: adsk.fusion.GeometricConstraints = sketch.geometricConstraints
     dimensions: adsk.fusion.SketchDimensions = sketch.sketchDimensions
     lines: adsk.fusion.SketchLines = sketch.sketchCurves.sketchLines
-    rectangleLines = lines.addTwoPointRectangle(
-        startPoint,
-        adsk.core.Point3D.create(startPoint.x + width, startPoint.y + length, 0)
-    )
-    constraints.addHorizontal(rectangleLines.item(0))
-    constraints.addVertical(rectangleLines.item(1))
-    constraints.addHorizontal(rectangleLines.item(2))
-    constraints.addVertical(rectangleLines.item(3))
-    if startPoint.isEqualTo(sketch.originPoint.geometry):
-        constraints.addCoincident(sketch.originPoint, rectangleLines.item(3))
-        constraints.addCoincident(sketch.originPoint, rectangleLines.item(0))
-    else:
-        dimensions.addDistanceDimension(
-            sketch.originPoint,
-            rectangleLines.item(0).startSketchPoint,
-            adsk.fusion.DimensionOrientations.VerticalDimensionOrientation,
-            rectangleLines.item(0).startSketchPoint.geometry,
-            True,
+    with futil.sketch_drawing(sketch):
+        rectangleLines = lines.addTwoPointRectangle(
+            startPoint,
+            adsk.core.Point3D.create(startPoint.x + width, startPoint.y + length, 0)
         )
-        dimensions.addDistanceDimension(
-            sketch.originPoint,
-            rectangleLines.item(3).startSketchPoint,
+        if not isConstrained(policy):
+            return rectangleLines
+        constraints.addHorizontal(rectangleLines.item(0))
+        constraints.addVertical(rectangleLines.item(1))
+        constraints.addHorizontal(rectangleLines.item(2))
+        constraints.addVertical(rectangleLines.item(3))
+        if startPoint.isEqualTo(sketch.originPoint.geometry):
+            constraints.addCoincident(sketch.originPoint, rectangleLines.item(3))
+            constraints.addCoincident(sketch.originPoint, rectangleLines.item(0))
+        else:
+            dimensions.addDistanceDimension(
+                sketch.originPoint,
+                rectangleLines.item(0).startSketchPoint,
+                adsk.fusion.DimensionOrientations.VerticalDimensionOrientation,
+                rectangleLines.item(0).startSketchPoint.geometry,
+                True,
+            )
+            dimensions.addDistanceDimension(
+                sketch.originPoint,
+                rectangleLines.item(3).startSketchPoint,
+                adsk.fusion.DimensionOrientations.HorizontalDimensionOrientation,
+                rectangleLines.item(3).startSketchPoint.geometry,
+                True,
+            )
+        dimensions.addDistanceDimension(rectangleLines.item(0).startSketchPoint,
+            rectangleLines.item(0).endSketchPoint,
             adsk.fusion.DimensionOrientations.HorizontalDimensionOrientation,
-            rectangleLines.item(3).startSketchPoint.geometry,
-            True,
-        )
-    dimensions.addDistanceDimension(rectangleLines.item(0).startSketchPoint,
-        rectangleLines.item(0).endSketchPoint,
-        adsk.fusion.DimensionOrientations.HorizontalDimensionOrientation,
-        rectangleLines.item(0).endSketchPoint.geometry)
-    dimensions.addDistanceDimension(rectangleLines.item(1).startSketchPoint,
-        rectangleLines.item(1).endSketchPoint,
-        adsk.fusion.DimensionOrientations.VerticalDimensionOrientation,
-        rectangleLines.item(1).endSketchPoint.geometry)
+            rectangleLines.item(0).endSketchPoint.geometry)
+        dimensions.addDistanceDimension(rectangleLines.item(1).startSketchPoint,
+            rectangleLines.item(1).endSketchPoint,
+            adsk.fusion.DimensionOrientations.VerticalDimensionOrientation,
+            rectangleLines.item(1).endSketchPoint.geometry)
     return rectangleLines
 
+def createRoundedRectangle(
+    width: float,
+    length: float,
+    startPoint: adsk.core.Point3D,
+    filletRadius: float,
+    sketch: adsk.fusion.Sketch,
+    policy: str = const.SKETCH_POLICY_CONSTRAINED,
+):
+    with futil.sketch_drawing(sketch):
+        rectangleLines = createRectangle(width, length, startPoint, sketch, policy)
+        sketchArcs = sketch.sketchCurves.sketchArcs
+        constraints: adsk.fusion.GeometricConstraints = sketch.geometricConstraints
+        dimensions: adsk.fusion.SketchDimensions = sketch.sketchDimensions
+
+        [side1, side2, side3, side4] = list(rectangleLines)
+        fillet1 = sketchArcs.addFillet(side1, side1.endSketchPoint.geometry, side2, side2.startSketchPoint.geometry, filletRadius)
+        fillet2 = sketchArcs.addFillet(side2, side2.endSketchPoint.geometry, side3, side3.startSketchPoint.geometry, filletRadius)
+        fillet3 = sketchArcs.addFillet(side3, side3.endSketchPoint.geometry, side4, side4.startSketchPoint.geometry, filletRadius)
+        fillet4 = sketchArcs.addFillet(side4, side4.endSketchPoint.geometry, side1, side1.startSketchPoint.geometry, filletRadius)
+        if not isConstrained(policy):
+            return [fillet1, fillet2, fillet3, fillet4, side1, side2, side3, side4]
+
+        constraints.addEqual(fillet1, fillet2)
+        constraints.addEqual(fillet2, fillet3)
+        constraints.addEqual(fillet3, fillet4)
+        dimensions.addRadialDimension(fillet1, fillet1.startSketchPoint.geometry)
+    return [fillet1, fillet2, fillet3, fillet4, side1, side2, side3, side4]
+
 def filterCirclesByRadius(
     radius: float,
     tolerance: float,
@@ -75,13 +112,14 @@ def createOffsetProfileSketch(
     sketches: adsk.fusion.Sketches = targetComponent.sketches
     sketch: adsk.fusion.Sketch = sketches.add(planarEntity)
     constraints: adsk.fusion.GeometricConstraints = sketch.geometricConstraints
-    curvesList: list[adsk.fusion.SketchCurve] = []
-    for curve in sketch.sketchCurves:
-        curvesList.append(curve)
-        curve.isConstruction = True
-    constraints.addOffset(curvesList,
-        adsk.core.ValueInput.createByReal(offsetValue),
-        sketch.sketchCurves.sketchLines.item(0).startSketchPoint.geometry)
+    with futil.sketch_drawing(sketch):
+        curvesList: list[adsk.fusion.SketchCurve] = []
+        for curve in sketch.sketchCurves:
+            curvesList.append(curve)
+            curve.isConstruction = True
+        constraints.addOffset(curvesList,
+            adsk.core.ValueInput.createByReal(offsetValue),
+            sketch.sketchCurves.sketchLines.item(0).startSketchPoint.geometry)
 
     return sketch
 
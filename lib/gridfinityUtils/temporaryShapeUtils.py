@@ -0,0 +1,88 @@
+import adsk.core, adsk.fusion, traceback
+
+from . import const
+
+# Shapes built with the temporary b-rep manager, they live outside of the timeline
+# until added to a component, so no sketches or features are recorded while building them.
+
+def simpleBox(
+    originPoint: adsk.core.Point3D,
+    width: float,
+    length: float,
+    height: float,
+) -> adsk.fusion.BRepBody:
+    centerPoint = adsk.core.Point3D.create(
+        originPoint.x + width / 2,
+        originPoint.y + length / 2,
+        originPoint.z + height / 2,
+    )
+    boundingBox = adsk.core.OrientedBoundingBox3D.create(
+        centerPoint,
+        adsk.core.Vector3D.create(1, 0, 0),
+        adsk.core.Vector3D.create(0, 1, 0),
+        abs(width),
+        abs(length),
+        abs(height),
+    )
+    return adsk.fusion.TemporaryBRepManager.get().createBox(boundingBox)
+
+def simpleCylinder(
+    centerBottom: adsk.core.Point3D,
+    radius: float,
+    height: float,
+) -> adsk.fusion.BRepBody:
+    centerTop = adsk.core.Point3D.create(centerBottom.x, centerBottom.y, centerBottom.z + height)
+    return adsk.fusion.TemporaryBRepManager.get().createCylinderOrCone(centerBottom, radius, centerTop, radius)
+
+def roundedBox(
+    originPoint: adsk.core.Point3D,
+    width: float,
+    length: float,
+    height: float,
+    radius: float,
+) -> adsk.fusion.BRepBody:
+    radius = min(radius, width / 2, length / 2)
+    if radius < const.DEFAULT_FILTER_TOLERANCE:
+        return simpleBox(originPoint, width, length, height)
+    body = simpleBox(adsk.core.Point3D.create(originPoint.x + radius, originPoint.y, originPoint.z), width - radius * 2, length, height)
+    cornerTools = [simpleBox(adsk.core.Point3D.create(originPoint.x, originPoint.y + radius, originPoint.z), width, length - radius * 2, height)]
+    for x in [originPoint.x + radius, originPoint.x + width - radius]:
+        for y in [originPoint.y + radius, originPoint.y + length - radius]:
+            cornerTools.append(simpleCylinder(adsk.core.Point3D.create(x, y, min(originPoint.z, originPoint.z + height)), radius, abs(height)))
+    return joinBodies(body, cornerTools)
+
+def translatedCopy(body: adsk.fusion.BRepBody, byX = 0, byY = 0, byZ = 0) -> adsk.fusion.BRepBody:
+    temporaryBRep = adsk.fusion.TemporaryBRepManager.get()
+    bodyCopy = temporaryBRep.copy(body)
+    transform = adsk.core.Matrix3D.create()
+    transform.translation = adsk.core.Vector3D.create(byX, byY, byZ)
+    temporaryBRep.transform(bodyCopy, transform)
+    return bodyCopy
+
+def joinBodies(targetBody: adsk.fusion.BRepBody, toolBodies: list[adsk.fusion.BRepBody]):
+    temporaryBRep = adsk.fusion.TemporaryBRepManager.get()
+    for toolBody in toolBodies:
+        temporaryBRep.booleanOperation(targetBody, toolBody, adsk.fusion.BooleanTypes.UnionBooleanType)
+    return targetBody
+
+def cutBody(targetBody: adsk.fusion.BRepBody, toolBodies: list[adsk.fusion.BRepBody]):
+    temporaryBRep = adsk.fusion.TemporaryBRepManager.get()
+    for toolBody in toolBodies:
+        temporaryBRep.booleanOperation(targetBody, toolBody, adsk.fusion.BooleanTypes.DifferenceBooleanType)
+    return targetBody
+
+def addToComponent(
+    bodies: list[adsk.fusion.BRepBody],
+    name: str,
+    targetComponent: adsk.fusion.Component,
+) -> list[adsk.fusion.BRepBody]:
+    if targetComponent.parentDesign.designType == adsk.fusion.DesignTypes.DirectDesignType:
+        return [targetComponent.bRepBodies.add(body) for body in bodies]
+    baseFeature = targetComponent.features.baseFeatures.add()
+    baseFeature.name = name
+    baseFeature.startEdit()
+    for body in bodies:
+        targetComponent.bRepBodies.add(body, baseFeature)
+    baseFeature.finishEdit()
+    # bodies added during the edit are replaced once the edit is finished
+    return list(baseFeature.bodies)
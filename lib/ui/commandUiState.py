@@ -1,4 +1,6 @@
 import adsk.core, adsk.fusion, traceback
+import hashlib
+import json
 from ...lib import fusion360utils as futil
 
 class SingleInputState:
@@ -116,4 +118,10 @@ class CommandUiState:
         for key in self.inputState.keys():
             if key not in ignoreKeys:
                 result[key] = self.inputState[key].toDict()
-        return result
\ No newline at end of file
+        return result
+
+    def toHash(self, ignoreKeys: list[str] = []):
+        # group expansion doesn't affect generated geometry
+        values = [[state.id, state.value] for state in self.inputState.values()
+            if state.id not in ignoreKeys and state.type != adsk.core.GroupCommandInput.classType()]
+        return hashlib.sha1(json.dumps(sorted(values), default=str).encode()).hexdigest()
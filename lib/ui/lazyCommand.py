@@ -0,0 +1,99 @@
+import adsk.core, adsk.fusion, traceback
+import importlib
+import os
+import time
+
+from ...lib import configUtils
+from ...lib import fusion360utils as futil
+
+app = adsk.core.Application.get()
+ui = app.userInterface
+
+class LazyCommand():
+    # Command button registered from its lightweight commandInfo module. The entry module, and with it
+    # the generator stack, is imported on the first commandCreated event and handles every event after.
+    def __init__(self, commandInfo, entryModuleName: str, package: str):
+        self.info = commandInfo
+        self.entryModuleName = entryModuleName
+        self.package = package
+        self.entry = None
+
+    @property
+    def isLoaded(self) -> bool:
+        return self.entry is not None
+
+    def start(self):
+        futil.log(f'{self.info.CMD_NAME} Command Register Event')
+        try:
+            addinConfig = configUtils.readConfig(self.info.CONFIG_FOLDER_PATH)
+
+            # Create a command Definition.
+            cmd_def = ui.commandDefinitions.itemById(self.info.CMD_ID)
+            if not cmd_def:
+                cmd_def = ui.commandDefinitions.addButtonDefinition(self.info.CMD_ID, self.info.CMD_NAME, self.info.CMD_Description, self.info.ICON_FOLDER)
+
+                # Define an event handler for the command created event. It will be called when the button is clicked.
+                futil.add_handler(cmd_def.commandCreated, self.command_created)
+
+                # Get the target workspace and panel the button will be created in.
+                workspace = ui.workspaces.itemById(self.info.WORKSPACE_ID)
+                panel = workspace.toolbarPanels.itemById(self.info.PANEL_ID)
+
+                # Create the button command control in the UI after the specified existing command.
+                control = panel.controls.addCommand(cmd_def, self.info.COMMAND_BESIDE_ID, False)
+
+                # Specify if the command is promoted to the main toolbar, IS_PROMOTED is the default until the user pins or unpins it.
+                control.isPromoted = addinConfig['UI'].getboolean('is_promoted') if self.hasSavedConfig else self.info.IS_PROMOTED
+            ui.statusMessage = ""
+        except Exception as err:
+            self.reportStartError(err)
+
+    @property
+    def hasSavedConfig(self) -> bool:
+        return os.path.exists(os.path.join(self.info.CONFIG_FOLDER_PATH, configUtils.CONFIG_FILE_NAME))
+
+    def load(self):
+        startTime = time.perf_counter()
+        entry = importlib.import_module(self.entryModuleName, self.package)
+        entry.start()
+        self.entry = entry
+        futil.log(f'{self.info.CMD_NAME} loaded in {(time.perf_counter() - startTime) * 1000:.0f}ms')
+
+    def command_created(self, args: adsk.core.CommandCreatedEventArgs):
+        if not self.isLoaded:
+            try:
+                self.load()
+            except Exception as err:
+                self.reportStartError(err)
+                return
+        self.entry.command_created(args)
+
+    def stop(self):
+        futil.log(f'{self.info.CMD_NAME} Command Stop Event')
+        # Get the various UI elements for this command
+        workspace = ui.workspaces.itemById(self.info.WORKSPACE_ID)
+        panel = workspace.toolbarPanels.itemById(self.info.PANEL_ID)
+        command_control: adsk.core.CommandControl = panel.controls.itemById(self.info.CMD_ID)
+        command_definition = ui.commandDefinitions.itemById(self.info.CMD_ID)
+
+        if command_control:
+            addinConfig = configUtils.readConfig(self.info.CONFIG_FOLDER_PATH)
+            addinConfig['UI']['is_promoted'] = 'yes' if command_control.isPromoted else 'no'
+            configUtils.writeConfig(addinConfig, self.info.CONFIG_FOLDER_PATH)
+
+        # Delete the button command control
+        if command_control:
+            command_control.deleteMe()
+
+        # Delete the command definition
+        if command_definition:
+            command_definition.deleteMe()
+
+    def reportStartError(self, err: Exception):
+        futil.log(f'{self.info.CMD_NAME} Error occurred at the start, {err}, {traceback.format_exc()}')
+        ui.statusMessage = f"{self.info.CMD_NAME} failed to initialize"
+        if ui:
+            ui.messageBox(
+                f"{self.info.CMD_NAME} Critical error occurred at the start, the command will be unavailable, if the issue persists use <a href=\"https://github.com/Le0Michine/FusionGridfinityGenerator/issues/new\">this link</a> to report it:<br>{traceback.format_exc()}",
+                f"{self.info.CMD_NAME} Error",
+            )
@@ -0,0 +1,114 @@
+import adsk.core, adsk.fusion, traceback
+import threading
+
+from ...lib import fusion360utils as futil
+from ..gridfinityUtils import temporaryShapeUtils
+
+app = adsk.core.Application.get()
+
+# Fusion fires executePreview right after every input change, so a burst of spinner clicks
+# turns into a burst of full rebuilds. The scheduler lets the preview handler skip generation
+# until inputs stay unchanged for a quiet period, then requests a single preview of the last state.
+# Fusion discards the shown preview before every executePreview, so copies of the last generated
+# preview bodies are kept and added back when inputs return to that state instead of regenerating it.
+class PreviewScheduler:
+    def __init__(self, commandName: str, quietPeriod: float):
+        self.commandName = commandName
+        self.quietPeriod = quietPeriod
+        self.customEventId = f'{commandName}_preview_scheduler'.replace(' ', '_')
+        self.command: adsk.core.Command = None
+        self.customEvent: adsk.core.CustomEvent = None
+        self.handlers = []
+        self.timer: threading.Timer = None
+        self.changeCounter = 0
+        self.isSettled = True
+        self.pendingInputsHash: str = None
+        # last generated preview, kept while the unsettled previews in between show nothing
+        self.generatedInputsHash: str = None
+        self.generatedName: str = None
+        self.generatedBodies: list[tuple[str, adsk.fusion.BRepBody]] = []
+
+    def start(self, command: adsk.core.Command, inputsHash: str):
+        self.stop()
+        self.command = command
+        self.isSettled = True
+        self.pendingInputsHash = inputsHash
+        self.clearPreviewResult()
+        self.customEvent = app.registerCustomEvent(self.customEventId)
+        futil.add_handler(self.customEvent, self.onQuietPeriodEnd, local_handlers=self.handlers)
+
+    def stop(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        if self.customEvent is not None:
+            app.unregisterCustomEvent(self.customEventId)
+            self.customEvent = None
+        self.handlers = []
+        self.command = None
+        self.clearPreviewResult()
+
+    def inputChanged(self, inputsHash: str):
+        if inputsHash == self.pendingInputsHash:
+            # ui only change, e.g. a group was expanded, doesn't start a new burst
+            return
+        self.pendingInputsHash = inputsHash
+        self.isSettled = False
+        self.changeCounter += 1
+        if self.timer is not None:
+            self.timer.cancel()
+        self.timer = threading.Timer(self.quietPeriod, app.fireCustomEvent, [self.customEventId, str(self.changeCounter)])
+        self.timer.daemon = True
+        self.timer.start()
+
+    def onQuietPeriodEnd(self, args: adsk.core.CustomEventArgs):
+        if self.command is None or args.additionalInfo != str(self.changeCounter):
+            # a newer change restarted the quiet period
+            return
+        self.timer = None
+        self.isSettled = True
+        self.command.doExecutePreview()
+
+    def shouldGeneratePreview(self, inputsHash: str, targetComponent: adsk.fusion.Component):
+        if not self.isSettled:
+            # previous preview is discarded by Fusion before the event, nothing is shown until inputs settle
+            futil.log(f'{self.commandName} Inputs are changing, postponing preview')
+            return False
+        if inputsHash == self.generatedInputsHash and len(self.generatedBodies) > 0:
+            with futil.span('preview restore'):
+                self.restorePreviewResult(targetComponent)
+            futil.log(f'{self.commandName} Inputs are unchanged since the last generated preview, restored it')
+            return False
+        return True
+
+    def storePreviewResult(self, inputsHash: str, occurrence: adsk.fusion.Occurrence):
+        temporaryBRep = adsk.fusion.TemporaryBRepManager.get()
+        self.clearPreviewResult()
+        for (body, transforms) in occurrenceBodies(occurrence, [occurrence.transform]):
+            bodyCopy = temporaryBRep.copy(body)
+            for transform in transforms:
+                temporaryBRep.transform(bodyCopy, transform)
+            self.generatedBodies.append((body.name, bodyCopy))
+        self.generatedName = occurrence.component.name
+        self.generatedInputsHash = inputsHash
+
+    def restorePreviewResult(self, targetComponent: adsk.fusion.Component):
+        temporaryBRep = adsk.fusion.TemporaryBRepManager.get()
+        occurrence = targetComponent.occurrences.addNewComponent(adsk.core.Matrix3D.create())
+        occurrence.component.name = self.generatedName
+        # the stored copies are kept for the next restore, a copy of them is added
+        bodies = temporaryShapeUtils.addToComponent([temporaryBRep.copy(body) for (name, body) in self.generatedBodies], self.generatedName, occurrence.component)
+        for (body, (name, storedBody)) in zip(bodies, self.generatedBodies):
+            body.name = name
+
+    def clearPreviewResult(self):
+        self.generatedInputsHash = None
+        self.generatedName = None
+        self.generatedBodies = []
+
+def occurrenceBodies(occurrence: adsk.fusion.Occurrence, transforms: list[adsk.core.Matrix3D]):
+    # bodies of the occurrence and its nested occurrences with transforms to apply in order, innermost first
+    for body in occurrence.component.bRepBodies:
+        yield (body, transforms)
+    for childOccurrence in occurrence.component.occurrences:
+        yield from occurrenceBodies(childOccurrence, [childOccurrence.transform] + transforms)
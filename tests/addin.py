@@ -0,0 +1,22 @@
+import importlib
+import os
+import sys
+
+# Tests run outside of Fusion 360 against the recording backend, add-in modules are imported
+# as a package named after the add-in folder, the same way the benchmark imports them.
+ADDIN_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE_NAME = os.path.basename(ADDIN_ROOT)
+
+if not os.path.dirname(ADDIN_ROOT) in sys.path:
+    sys.path.insert(0, os.path.dirname(ADDIN_ROOT))
+
+cadBackend = importlib.import_module(f'{PACKAGE_NAME}.cadBackend')
+adsk = cadBackend.installRecordingBackend()
+
+def importAddinModule(name: str):
+    return importlib.import_module(f'{PACKAGE_NAME}.{name}')
+
+def newComponent(design = None):
+    if design is None:
+        design = cadBackend.newRecordingDesign()
+    return design.rootComponent.occurrences.addNewComponent(adsk.core.Matrix3D.create()).component
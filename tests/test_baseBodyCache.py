@@ -0,0 +1,52 @@
+import unittest
+
+from addin import adsk, importAddinModule, newComponent
+
+const = importAddinModule('lib.gridfinityUtils.const')
+baseGenerator = importAddinModule('lib.gridfinityUtils.baseGenerator')
+baseGeneratorInput = importAddinModule('lib.gridfinityUtils.baseGeneratorInput')
+baseBodyCache = importAddinModule('lib.gridfinityUtils.baseBodyCache')
+
+def baseInput():
+    input = baseGeneratorInput.BaseGeneratorInput()
+    input.originPoint = adsk.core.Point3D.create(0, 0, 0)
+    input.baseWidth = const.DIMENSION_DEFAULT_WIDTH_UNIT
+    input.baseLength = const.DIMENSION_DEFAULT_WIDTH_UNIT
+    input.xyClearance = const.BIN_XY_CLEARANCE
+    return input
+
+class BaseBodyCacheTest(unittest.TestCase):
+    def setUp(self):
+        baseBodyCache.clearBaseBodyCache()
+
+    def tearDown(self):
+        baseBodyCache.clearBaseBodyCache()
+
+    def baseFeatureCount(self, component):
+        return component.features.baseFeatures.count
+
+    def testIdenticalBaseIsStamped(self):
+        component = newComponent()
+        baseGenerator.createSingleGridfinityBaseBody(baseInput(), component)
+        baseGenerator.createSingleGridfinityBaseBody(baseInput(), component)
+        self.assertEqual(self.baseFeatureCount(component), 1)
+
+    def testBaseWithOtherParametersIsNotStamped(self):
+        component = newComponent()
+        baseGenerator.createSingleGridfinityBaseBody(baseInput(), component)
+        input = baseInput()
+        input.hasScrewHoles = True
+        baseGenerator.createSingleGridfinityBaseBody(input, component)
+        self.assertEqual(self.baseFeatureCount(component), 0)
+
+    def testCacheKeepsRecentTemplatesOnly(self):
+        component = newComponent()
+        body = baseGenerator.createSingleGridfinityBaseBody(baseInput(), component)
+        for index in range(baseBodyCache.BASE_BODY_CACHE_MAX_TEMPLATES + 1):
+            input = baseInput()
+            input.baseLength += index + 1
+            baseBodyCache.storeBaseBody(input, body, component)
+        self.assertIsNone(baseBodyCache.stampBaseBody(baseInput(), component))
+
+if __name__ == '__main__':
+    unittest.main()
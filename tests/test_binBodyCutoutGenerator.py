@@ -0,0 +1,91 @@
+import math
+import unittest
+
+from addin import adsk, importAddinModule, newComponent
+
+const = importAddinModule('lib.gridfinityUtils.const')
+binGenerator = importAddinModule('lib.gridfinityUtils.binGenerator')
+binGeneratorInput = importAddinModule('lib.gridfinityUtils.binGeneratorInput')
+binBodyGeneratorInput = importAddinModule('lib.gridfinityUtils.binBodyGeneratorInput')
+binBodyCutoutGenerator = importAddinModule('lib.gridfinityUtils.binBodyCutoutGenerator')
+
+def cutoutInput(x: float, y: float, width: float, length: float):
+    input = binBodyCutoutGenerator.BinBodyCutoutGeneratorInput()
+    input.origin = adsk.core.Point3D.create(x, y, 3)
+    input.width = width
+    input.length = length
+    input.height = 2
+    input.filletRadius = 0.2
+    input.hasScoop = False
+    input.hasBottomFillet = True
+    return input
+
+def binInput(compartments: list[tuple[int, int, int, int]]):
+    xyClearance = const.BIN_XY_CLEARANCE
+    input = binGeneratorInput.BinGeneratorInput()
+    baseInput = input.baseGeneratorInput
+    baseInput.originPoint = adsk.core.Point3D.create(-xyClearance, -xyClearance, 0)
+    baseInput.baseWidth = const.DIMENSION_DEFAULT_WIDTH_UNIT
+    baseInput.baseLength = const.DIMENSION_DEFAULT_WIDTH_UNIT
+    baseInput.xyClearance = xyClearance
+
+    bodyInput = input.binBodyGeneratorInput
+    bodyInput.binWidth = 3
+    bodyInput.binLength = 3
+    bodyInput.binHeight = 5
+    bodyInput.baseWidth = const.DIMENSION_DEFAULT_WIDTH_UNIT
+    bodyInput.baseLength = const.DIMENSION_DEFAULT_WIDTH_UNIT
+    bodyInput.heightUnit = const.DIMENSION_DEFAULT_HEIGHT_UNIT
+    bodyInput.xyClearance = xyClearance
+    bodyInput.binCornerFilletRadius = const.BIN_CORNER_FILLET_RADIUS - xyClearance
+    bodyInput.hasTab = True
+    bodyInput.tabLength = 1
+    bodyInput.tabOverhangAngle = math.radians(const.BIN_TAB_OVERHANG_ANGLE)
+    bodyInput.compartmentsByX = 3
+    bodyInput.compartmentsByY = 3
+    bodyInput.compartments = [binBodyGeneratorInput.BinBodyCompartmentDefinition(*compartment) for compartment in compartments]
+    return input
+
+class BinBodyCutoutGeneratorTest(unittest.TestCase):
+    def testOverlappingCompartmentsKeepSeparateCutoutBodies(self):
+        component = newComponent()
+        inputs = [
+            cutoutInput(0, 0, 2, 2),
+            cutoutInput(1, 1, 2, 2),
+            cutoutInput(5, 0, 1, 1),
+        ]
+        bodies = binBodyCutoutGenerator.createGridfinityBinBodyCutouts(inputs, component)
+        self.assertEqual(len(set(bodies)), 3)
+        self.assertEqual(component.bRepBodies.count, 3)
+        for (input, body) in zip(inputs, bodies):
+            self.assertAlmostEqual(body.boundingBox.minPoint.x, input.origin.x)
+            self.assertAlmostEqual(body.boundingBox.minPoint.y, input.origin.y)
+            self.assertIs(binBodyCutoutGenerator.cutoutBodyForInput(input, bodies), body)
+
+    def testSeparatedCompartmentsShareSketch(self):
+        groups = binBodyCutoutGenerator.separateCutoutGroups([
+            cutoutInput(0, 0, 2, 2),
+            cutoutInput(1, 1, 2, 2),
+            cutoutInput(5, 0, 1, 1),
+            cutoutInput(3.5, 0, 1, 1),
+            # touches the first one
+            cutoutInput(-1, 0, 1, 1),
+        ])
+        self.assertEqual([len(group) for group in groups], [3, 2])
+
+    def testCompartmentOutsideOfCutoutsRaises(self):
+        component = newComponent()
+        bodies = binBodyCutoutGenerator.createGridfinityBinBodyCutouts([
+            cutoutInput(0, 0, 2, 2),
+            cutoutInput(5, 0, 1, 1),
+        ], component)
+        with self.assertRaises(ValueError):
+            binBodyCutoutGenerator.cutoutBodyForInput(cutoutInput(10, 10, 1, 1), bodies)
+
+    def testBinWithOverlappingCompartmentTabs(self):
+        component = newComponent()
+        binGenerator.createGridfinityBin(binInput([(0, 0, 2, 2), (1, 1, 2, 2), (0, 2, 1, 1)]), component)
+        self.assertEqual(component.bRepBodies.count, 1)
+
+if __name__ == '__main__':
+    unittest.main()
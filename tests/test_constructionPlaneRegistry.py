@@ -0,0 +1,29 @@
+import unittest
+
+from addin import importAddinModule, newComponent
+
+constructionPlaneRegistry = importAddinModule('lib.gridfinityUtils.constructionPlaneRegistry')
+
+class ConstructionPlaneRegistryTest(unittest.TestCase):
+    def setUp(self):
+        constructionPlaneRegistry.clearConstructionPlaneRegistry()
+
+    def tearDown(self):
+        constructionPlaneRegistry.clearConstructionPlaneRegistry()
+
+    def testPlaneIsSharedWithinComponent(self):
+        component = newComponent()
+        plane = constructionPlaneRegistry.offsetPlane(component.xYConstructionPlane, 1, component)
+        self.assertIs(constructionPlaneRegistry.offsetPlane(component.xYConstructionPlane, 1, component), plane)
+        self.assertEqual(component.constructionPlanes.count, 1)
+
+    def testRegistryKeepsRecentPlanesOnly(self):
+        component = newComponent()
+        firstPlane = constructionPlaneRegistry.offsetPlane(component.xYConstructionPlane, 0, component)
+        for index in range(constructionPlaneRegistry.CONSTRUCTION_PLANE_REGISTRY_MAX_PLANES):
+            constructionPlaneRegistry.offsetPlane(component.xYConstructionPlane, index + 1, component)
+        self.assertEqual(len(constructionPlaneRegistry._planes), constructionPlaneRegistry.CONSTRUCTION_PLANE_REGISTRY_MAX_PLANES)
+        self.assertIsNot(constructionPlaneRegistry.offsetPlane(component.xYConstructionPlane, 0, component), firstPlane)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import types
+import unittest
+
+from addin import adsk, cadBackend, importAddinModule
+
+previewScheduler = importAddinModule('lib.ui.previewScheduler')
+temporaryShapeUtils = importAddinModule('lib.gridfinityUtils.temporaryShapeUtils')
+
+class PreviewDialog():
+    # stands in for a command dialog, every executePreview starts from a new design as Fusion
+    # discards the shown preview before the event
+    def __init__(self, scheduler: previewScheduler.PreviewScheduler):
+        self.scheduler = scheduler
+        self.inputsHash = 'initial'
+        self.generatedCount = 0
+        self.design = None
+        scheduler.command = self
+
+    def doExecutePreview(self):
+        self.design = cadBackend.newRecordingDesign()
+        root = self.design.rootComponent
+        if not self.scheduler.shouldGeneratePreview(self.inputsHash, root):
+            return
+        self.generatedCount += 1
+        occurrence = root.occurrences.addNewComponent(adsk.core.Matrix3D.create())
+        occurrence.component.name = f'Preview {self.inputsHash}'
+        body = temporaryShapeUtils.simpleBox(adsk.core.Point3D.create(0, 0, 0), 4.2, 4.2, len(self.inputsHash))
+        temporaryShapeUtils.addToComponent([body], 'Preview', occurrence.component)[0].name = 'Preview body'
+        self.scheduler.storePreviewResult(self.inputsHash, occurrence)
+
+    def changeInput(self, inputsHash: str):
+        self.inputsHash = inputsHash
+        self.scheduler.inputChanged(inputsHash)
+        self.doExecutePreview()
+
+    def endQuietPeriod(self):
+        self.scheduler.onQuietPeriodEnd(types.SimpleNamespace(additionalInfo=str(self.scheduler.changeCounter)))
+
+    def shownBodies(self):
+        return [body for occurrence in self.design.rootComponent.occurrences for body in occurrence.component.bRepBodies]
+
+class PreviewSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        # the quiet period is ended by the test, the timer never fires
+        self.scheduler = previewScheduler.PreviewScheduler('Test', 60)
+        self.dialog = PreviewDialog(self.scheduler)
+        self.dialog.doExecutePreview()
+
+    def tearDown(self):
+        self.scheduler.stop()
+
+    def testChangingInputsPostponePreview(self):
+        self.dialog.changeInput('changed')
+        self.dialog.changeInput('changed again')
+        self.assertEqual(self.dialog.generatedCount, 1)
+        self.assertEqual(self.dialog.shownBodies(), [])
+        self.dialog.endQuietPeriod()
+        self.assertEqual(self.dialog.generatedCount, 2)
+
+    def testRevertedInputsRestoreLastPreview(self):
+        self.dialog.changeInput('changed')
+        self.dialog.changeInput('initial')
+        self.dialog.endQuietPeriod()
+        self.assertEqual(self.dialog.generatedCount, 1)
+        shownBodies = self.dialog.shownBodies()
+        self.assertEqual([body.name for body in shownBodies], ['Preview body'])
+        self.assertAlmostEqual(shownBodies[0].boundingBox.maxPoint.z, len('initial'))
+        self.assertEqual(self.dialog.design.rootComponent.occurrences.item(0).component.name, 'Preview initial')
+
+    def testRestoredPreviewCanBeRestoredAgain(self):
+        self.dialog.changeInput('changed')
+        self.dialog.changeInput('initial')
+        self.dialog.endQuietPeriod()
+        # ui only change, e.g. a group was expanded
+        self.dialog.changeInput('initial')
+        self.assertEqual(self.dialog.generatedCount, 1)
+        self.assertEqual(len(self.dialog.shownBodies()), 1)
+
+if __name__ == '__main__':
+    unittest.main()